@@ -1,5 +1,12 @@
 from .artworks_data_writer import update_artworks
+from .artworks_data_scheduler import schedule_artworks_updates, run_scheduled_update
 from .artworks_router import artworks_router
 from .artworks_data_helper import format_artworks_by_params
 
-__all__ = ["update_artworks", "artworks_router", "format_artworks_by_params"]  # Explicitly define public API
\ No newline at end of file
+__all__ = [
+    "update_artworks",
+    "schedule_artworks_updates",
+    "run_scheduled_update",
+    "artworks_router",
+    "format_artworks_by_params",
+]  # Explicitly define public API
\ No newline at end of file
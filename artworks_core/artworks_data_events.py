@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+from tortoise import connections
+
+from artworks_utils import logger
+
+# PostgreSQL NOTIFY channel announcing artworks changed by ingest
+ARTWORKS_CHANGED_CHANNEL = "artworks_changed"
+
+# Artwork ids per notification, keeping payloads well under the 8000 bytes NOTIFY limit
+NOTIFY_IDS_PER_MESSAGE = 500
+
+# Functions called with the changed artwork ids (None when any artwork may have changed)
+artworks_change_handlers = []
+
+# Task listening for change notifications, started by `start_artworks_listener`
+artworks_listener_task = None
+
+def register_artworks_change_handler(handler):
+    """
+    Registers a function called whenever artworks change (e.g. to invalidate a cache).
+
+    Args:
+        handler (callable): Function taking the list of changed artwork ids, or None when any
+            artwork may have changed (e.g. notifications were missed while reconnecting).
+    """
+    if handler not in artworks_change_handlers:
+        artworks_change_handlers.append(handler)
+
+def dispatch_artworks_changed(artwork_ids):
+    """
+    Calls the registered change handlers in this process.
+
+    Args:
+        artwork_ids (list): The changed artwork ids, or None when any artwork may have changed.
+    """
+    for handler in artworks_change_handlers:
+        try:
+            handler(artwork_ids)
+        except Exception as exception:
+            logger.error("Artworks change handler %s failed: %s", handler, exception)
+
+async def publish_artworks_changed(artwork_ids):
+    """
+    Announces changed artworks to every server process through PostgreSQL NOTIFY.
+
+    Notifications are delivered to the listeners (see `listen_artworks_changes`) once the
+    writing transaction has committed, so readers never re-cache the previous version. If the
+    notification cannot be sent, the handlers of this process are still called.
+
+    Args:
+        artwork_ids (list): The local ids of the changed artworks (an empty list announces
+            new artworks only), or None when any artwork may have changed (e.g. deleted).
+    """
+    try:
+        connection = connections.get("default")
+        if artwork_ids is None:
+            payloads = [json.dumps({"ids": None})]
+        else:
+            payloads = [
+                json.dumps({"ids": artwork_ids[start:start + NOTIFY_IDS_PER_MESSAGE]})
+                for start in range(0, max(len(artwork_ids), 1), NOTIFY_IDS_PER_MESSAGE)
+            ]
+        for payload in payloads:
+            await connection.execute_query("SELECT pg_notify($1, $2)", [ARTWORKS_CHANGED_CHANNEL, payload])
+    except Exception as exception:
+        logger.warning("Publishing artworks changes failed, notifying this process only: %s", exception)
+        dispatch_artworks_changed(artwork_ids)
+
+def handle_artworks_notification(_connection, _pid, _channel, payload):
+    """
+    Dispatches a change notification received from PostgreSQL to the registered handlers.
+
+    Args:
+        payload (str): The notification payload, a JSON object with the changed "ids" (null
+            when any artwork may have changed).
+    """
+    try:
+        artwork_ids = json.loads(payload)["ids"]
+    except (ValueError, KeyError, TypeError) as exception:
+        logger.error("Invalid artworks change notification %r: %s", payload, exception)
+        artwork_ids = None
+
+    dispatch_artworks_changed(artwork_ids)
+
+async def listen_artworks_changes(retry_delay=5.0):
+    """
+    Listens for artworks change notifications on a dedicated database connection.
+
+    The connection is reacquired after a failure. Notifications sent while disconnected are
+    lost, so the handlers are told that any artwork may have changed on every reconnection.
+
+    Args:
+        retry_delay (float): Seconds to wait before reconnecting.
+    """
+    reconnecting = False
+    while True:
+        try:
+            async with connections.get("default").acquire_connection() as connection:
+                if not hasattr(connection, "add_listener"):
+                    logger.info("Artworks change notifications require PostgreSQL (asyncpg), not listening")
+                    return
+
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _connection: closed.set())
+                await connection.add_listener(ARTWORKS_CHANGED_CHANNEL, handle_artworks_notification)
+                logger.info("Listening for artworks changes on %s", ARTWORKS_CHANGED_CHANNEL)
+                if reconnecting:
+                    dispatch_artworks_changed(None)
+                try:
+                    await closed.wait()
+                finally:
+                    if not connection.is_closed():
+                        await connection.remove_listener(ARTWORKS_CHANGED_CHANNEL, handle_artworks_notification)
+            logger.warning("Artworks changes listener connection closed")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            logger.error("Artworks changes listener failed: %s", exception)
+
+        reconnecting = True
+        await asyncio.sleep(retry_delay)
+
+def start_artworks_listener():
+    """
+    Starts listening for artworks changes in the background, once per process.
+
+    Returns:
+        asyncio.Task: The listener task.
+    """
+    global artworks_listener_task
+    if artworks_listener_task is None or artworks_listener_task.done():
+        artworks_listener_task = asyncio.create_task(listen_artworks_changes())
+    return artworks_listener_task
+
+async def stop_artworks_listener():
+    """
+    Stops the background artworks changes listener and releases its connection.
+    """
+    global artworks_listener_task
+    if artworks_listener_task is not None:
+        artworks_listener_task.cancel()
+        await asyncio.gather(artworks_listener_task, return_exceptions=True)
+        artworks_listener_task = None
@@ -1,7 +1,544 @@
+import base64
+import binascii
+import csv
+import hashlib
+import io
+import json
+from datetime import datetime
+
+from artworks_utils import json_dumps, make_etag
+
+# Artwork columns persisted from the upstream AIC payload, in model order.
+ARTWORK_FIELDS = (
+    "title",
+    "artist_title",
+    "place_of_origin",
+    "thumbnail",
+    "date_start",
+    "date_end",
+    "date_display",
+    "artist_display",
+    "description",
+    "short_description",
+    "classification_title",
+    "style_title",
+    "medium_display",
+    "material_titles",
+    "term_titles",
+    "category_titles",
+)
+
+# Fields of the serialized artworks returned by the API, in `Artwork.to_dict` order
+ARTWORK_PUBLIC_FIELDS = ("id", "aic_id", *ARTWORK_FIELDS)
+
+# Fields of the cached artworks: the public fields and the validators of conditional requests
+ARTWORK_CACHED_FIELDS = (*ARTWORK_PUBLIC_FIELDS, "fingerprint", "updated_at")
+
+# Fields requested from the AIC search API, which only returns a handful of fields by default
+ARTWORK_API_FIELDS = ("id", "updated_at", *ARTWORK_FIELDS)
+
+def get_artworks_fields(params):
+    """
+    Resolves the `fields` query parameter (sparse fieldset) into the columns to select.
+
+    Args:
+        params (dict): Query parameters, `fields` is a comma-separated list of public fields
+            (e.g. "title,artist_title,thumbnail") and may be repeated.
+
+    Returns:
+        tuple: The selected fields in `ARTWORK_PUBLIC_FIELDS` order, always including "id",
+            or every public field if `fields` is missing or empty.
+
+    Raises:
+        ValueError: If an unknown field is requested.
+    """
+    requested_fields = {
+        field.strip()
+        for value in params.get('fields', [])
+        for field in value.split(",")
+        if field.strip()
+    }
+    if not requested_fields:
+        return ARTWORK_PUBLIC_FIELDS
+
+    unknown_fields = requested_fields.difference(ARTWORK_PUBLIC_FIELDS)
+    if unknown_fields:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown_fields))}")
+
+    requested_fields.add("id")
+    return tuple(field for field in ARTWORK_PUBLIC_FIELDS if field in requested_fields)
+
+def get_artworks_pagination(params, max_limit):
+    """
+    Resolves the `page` and `limit` query parameters of offset pagination.
+
+    Args:
+        params (dict): Query parameters, `page` and `limit` are optional.
+        max_limit (int): Maximum page size.
+
+    Returns:
+        tuple: The (page, limit) pair, clamped to at least 1 and to `max_limit`, or the default
+            (1, 10) if a value is not an integer.
+    """
+    try:
+        page = int(params.get('page', ['1'])[0])  # Use a string default to align with list
+        limit = min(int(params.get('limit', ['10'])[0]), max_limit)  # Use a string default
+    except (ValueError, IndexError):
+        page, limit = 1, 10
+
+    return max(page, 1), max(limit, 1)
+
+def get_artworks_batch_ids(params, max_batch_size):
+    """
+    Resolves the `ids` query parameter of the batch route.
+
+    Args:
+        params (dict): Query parameters, `ids` is a comma-separated list of artwork ids
+            (e.g. "12,7,42") and may be repeated.
+        max_batch_size (int): Maximum number of ids.
+
+    Returns:
+        list: The artwork ids as integers, in request order (duplicates are kept).
+
+    Raises:
+        ValueError: If no id is given, an id is not an integer or there are too many ids.
+    """
+    try:
+        artwork_ids = [
+            int(artwork_id)
+            for value in params.get('ids', [])
+            for artwork_id in value.split(",")
+            if artwork_id.strip()
+        ]
+    except ValueError as exception:
+        raise ValueError(f"Invalid artwork id: {exception}") from exception
+
+    if not artwork_ids:
+        raise ValueError("Missing artwork ids")
+    if len(artwork_ids) > max_batch_size:
+        raise ValueError(f"Too many artwork ids: {len(artwork_ids)} > {max_batch_size}")
+
+    return artwork_ids
+
+# Preferences used when a recommendations request gives none
+DEFAULT_RECOMMENDATION_PREFERENCES = {
+    "style_title": "Post-Impressionism",
+    "medium_display": "Oil on canvas",
+    "category_titles": ["Painting and Sculpture of Europe"],
+}
+
+def get_recommendation_preferences(params, default_k, max_k):
+    """
+    Resolves the preferences of a recommendations request.
+
+    Args:
+        params (dict): Query parameters (lists of strings) or JSON body (strings, numbers or
+            lists) with the optional keys:
+            - 'style_title', 'medium_display': The preferred style and medium.
+            - 'category_titles': The preferred categories (repeated parameter or JSON list).
+            - 'date_start', 'date_end': Years bounding the recommended artworks.
+            - 'k': Number of recommendations.
+        default_k (int): Number of recommendations when `k` is missing.
+        max_k (int): Maximum number of recommendations.
+
+    Returns:
+        tuple: The preferences dictionary and k. Without any style, medium or category, the
+            `DEFAULT_RECOMMENDATION_PREFERENCES` are used.
+
+    Raises:
+        ValueError: If a year or k is not an integer, or k is out of range.
+    """
+    values = {
+        key: [str(item) for item in value] if isinstance(value, list) else [str(value)]
+        for key, value in params.items()
+        if value is not None
+    }
+
+    def first_value(key):
+        return next((item.strip() for item in values.get(key, []) if item.strip()), None)
+
+    preferences = {
+        "style_title": first_value("style_title"),
+        "medium_display": first_value("medium_display"),
+        "category_titles": [item.strip() for item in values.get("category_titles", []) if item.strip()],
+    }
+    if not any(preferences.values()):
+        preferences = {**DEFAULT_RECOMMENDATION_PREFERENCES}
+
+    try:
+        for key in ("date_start", "date_end"):
+            year = first_value(key)
+            preferences[key] = int(year) if year is not None else None
+        k = int(first_value("k") or default_k)
+    except ValueError as exception:
+        raise ValueError(f"Invalid recommendation parameter: {exception}") from exception
+
+    if not 1 <= k <= max_k:
+        raise ValueError(f"k must be between 1 and {max_k}")
+
+    return preferences, k
+
+def get_recommendation_profile(preferences, k):
+    """
+    Builds the normalized preference profile of a recommendations request (cache key).
+
+    Args:
+        preferences (dict): The resolved preferences (see `get_recommendation_preferences`).
+        k (int): The resolved number of recommendations.
+
+    Returns:
+        tuple: (style_title, medium_display, category_titles, date_start, date_end, k) where the
+            categories are sorted and deduplicated, as their order does not change the results.
+    """
+    return (
+        preferences.get("style_title"),
+        preferences.get("medium_display"),
+        tuple(sorted(set(preferences.get("category_titles") or []))),
+        preferences.get("date_start"),
+        preferences.get("date_end"),
+        k,
+    )
+
+def get_search_cache_key(search_query, page, limit, fields):
+    """
+    Builds the cache key of a search, so equivalent queries share one cache entry.
+
+    Args:
+        search_query (str): The search query string.
+        page (int): The resolved page number.
+        limit (int): The resolved page size.
+        fields (tuple): The resolved fields to select.
+
+    Returns:
+        tuple: The case- and whitespace-insensitive query with the pagination and fields.
+    """
+    return " ".join(search_query.lower().split()), page, limit, fields
+
+def get_artwork_etag(artwork, fields):
+    """
+    Builds the entity tag of an artwork representation.
+
+    The content fingerprint changes exactly when a stored field changes. Artworks without a
+    fingerprint (saved before fingerprints existed) use their last write time instead.
+
+    Args:
+        artwork (dict): The artwork with its "fingerprint" and "updated_at" (`ARTWORK_CACHED_FIELDS`).
+        fields (tuple): The resolved fields of the representation.
+
+    Returns:
+        str: The strong entity tag.
+    """
+    return make_etag(artwork["fingerprint"] or f"{artwork['id']}@{artwork['updated_at']}", *fields)
+
+def get_artworks_list_etag(catalog_version, params):
+    """
+    Builds the entity tag of an artworks list.
+
+    Args:
+        catalog_version (tuple): The number of artworks and their last write time, which
+            change with any write to the catalog.
+        params (dict): The query parameters, which select the artworks of the list.
+
+    Returns:
+        str: The strong entity tag.
+    """
+    return make_etag(*catalog_version, *(f"{key}={values}" for key, values in sorted(params.items())))
+
+def get_artworks_query_params(page, limit, since=None):
+    """
+    Builds the AIC query parameters for a page of artworks.
+
+    Args:
+        page (int): The 1-based page number.
+        limit (int): Number of artworks per page.
+        since (str, optional): ISO-8601 upstream timestamp. When given, the parameters target the
+            search API and select only artworks modified since then, oldest modification first.
+
+    Returns:
+        dict: The query parameters.
+    """
+    query_params = {
+        "page": page,
+        "limit": limit,
+    }
+
+    if since is not None:
+        query_params.update({
+            "query[range][updated_at][gte]": since,
+            "sort[updated_at]": "asc",
+            "fields": ",".join(ARTWORK_API_FIELDS),
+        })
+
+    return query_params
+
+def get_latest_timestamp(timestamps):
+    """
+    Returns the most recent of a list of ISO-8601 timestamps.
+
+    Args:
+        timestamps (iterable): ISO-8601 strings, None and invalid values are ignored.
+
+    Returns:
+        str: The most recent timestamp as given, or None if there is no valid timestamp.
+    """
+    latest, latest_value = None, None
+    for timestamp in timestamps:
+        try:
+            value = datetime.fromisoformat(timestamp)
+        except (TypeError, ValueError):
+            continue
+        if latest_value is None or value > latest_value:
+            latest, latest_value = timestamp, value
+    return latest
+
+def normalize_artwork_payload(item):
+    """
+    Maps a raw AIC artwork payload to the fields stored on the `Artwork` model.
+
+    Args:
+        item (dict): Artwork dictionary as returned by the AIC API.
+
+    Returns:
+        dict: Model fields, including the upstream `aic_id` (None if the payload has no id).
+    """
+    return {
+        "aic_id": item.get("id", None),
+        "title": item.get("title", "Unknown Title"),
+        "artist_title": item.get("artist_title", "Unknown Artist"),
+        "place_of_origin": item.get("place_of_origin", "Unknown Origin"),
+        "thumbnail": item.get("thumbnail", None),
+        "date_start": item.get("date_start", None),
+        "date_end": item.get("date_end", None),
+        "date_display": item.get("date_display", None),
+        "artist_display": item.get("artist_display", None),
+        "description": item.get("description", None),
+        "short_description": item.get("short_description", None),
+        "classification_title": item.get("classification_title", None),
+        "style_title": item.get("style_title", None),
+        "medium_display": item.get("medium_display", None),
+        "material_titles": item.get("material_titles", []),
+        "term_titles": item.get("term_titles", []),
+        "category_titles": item.get("category_titles", []),
+    }
+
+def format_upstream_artwork(item, fields):
+    """
+    Maps an artwork of the AIC search API to the representation of a local artwork.
+
+    Args:
+        item (dict): Artwork dictionary as returned by the AIC API.
+        fields (tuple): The resolved fields to select (see `get_artworks_fields`).
+
+    Returns:
+        dict: The selected fields. The local "id" is None, as the artwork may not be stored.
+    """
+    artwork = {"id": None, **normalize_artwork_payload(item)}
+    return {field: artwork[field] for field in fields}
+
+def compute_artwork_fingerprint(artwork_data):
+    """
+    Computes a content fingerprint of a normalized artwork payload.
+
+    Only the stored artwork fields take part in the hash, so the fingerprint changes exactly
+    when an ingest would change the row.
+
+    Args:
+        artwork_data (dict): Normalized artwork fields (see `normalize_artwork_payload`).
+
+    Returns:
+        str: Hex encoded SHA-256 digest of the payload.
+    """
+    payload = {field: artwork_data.get(field) for field in ARTWORK_FIELDS}
+    encoded_payload = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded_payload.encode("utf-8")).hexdigest()
+
+# SQL sort keys of the artworks list, always followed by the id as a deterministic tiebreaker.
+# Missing values sort like the defaults of `format_artworks_by_params` (0 for dates, "" for text),
+# and every expression is backed by an `(expression, id)` index.
+ARTWORKS_SORT_KEYS = {
+    "date": 'COALESCE("date_start", 0)',
+    "title": 'LOWER(COALESCE("title", \'\'))',
+    "artist_title": 'LOWER(COALESCE("artist_title", \'\'))',
+    "artist_display": 'LOWER(COALESCE("artist_display", \'\'))',
+}
+
+def get_artworks_sort(params):
+    """
+    Resolves the `sort` query parameter into an SQL sort key.
+
+    Args:
+        params (dict): Query parameters, `sort` is one of `<key>_asc` or `<key>_desc` where
+            `<key>` is a key of `ARTWORKS_SORT_KEYS`.
+
+    Returns:
+        tuple: (sort_type, expression, descending) where `sort_type` is the validated sort, or
+            ("id", None, False) when the sort is missing or not supported.
+    """
+    try:
+        sort_type = params['sort'][0]
+    except (KeyError, IndexError):
+        return "id", None, False
+
+    sort_key, _, direction = sort_type.rpartition("_")
+    if sort_key not in ARTWORKS_SORT_KEYS or direction not in ("asc", "desc"):
+        return "id", None, False
+
+    return sort_type, ARTWORKS_SORT_KEYS[sort_key], direction == "desc"
+
+# Scalar columns filtered by equality (several values of a parameter match any of them)
+ARTWORKS_EQUALITY_FILTERS = ("artist_title", "style_title", "medium_display", "classification_title")
+
+# JSONB list columns filtered by containment (several values must all be present)
+ARTWORKS_CONTAINMENT_FILTERS = ("category_titles", "term_titles", "material_titles")
+
+def get_artworks_filters(params):
+    """
+    Translates the filter query parameters of the artworks list into ORM filters.
+
+    Supported parameters:
+        - artist_title, style_title, medium_display, classification_title: Exact match, repeat
+          the parameter to match any of several values.
+        - date_start: Artworks started in or after this year.
+        - date_end: Artworks completed in or before this year.
+        - category_titles, term_titles, material_titles: Artworks whose list contains the value,
+          repeat the parameter to require several values.
+
+    Args:
+        params (dict): Query parameters, each mapped to a list of values.
+
+    Returns:
+        dict: Keyword arguments for `QuerySet.filter`.
+
+    Raises:
+        ValueError: If a year is not an integer.
+    """
+    filters = {}
+
+    for field in ARTWORKS_EQUALITY_FILTERS:
+        values = [value for value in params.get(field, []) if value]
+        if len(values) == 1:
+            filters[field] = values[0]
+        elif values:
+            filters[f"{field}__in"] = values
+
+    if params.get('date_start'):
+        filters["date_start__gte"] = int(params['date_start'][0])
+    if params.get('date_end'):
+        filters["date_end__lte"] = int(params['date_end'][0])
+
+    for field in ARTWORKS_CONTAINMENT_FILTERS:
+        values = [value for value in params.get(field, []) if value]
+        if values:
+            filters[f"{field}__contains"] = values
+
+    return filters
+
+# Formats of the artworks export, with their content type
+ARTWORKS_EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+def get_artworks_export_format(params):
+    """
+    Resolves the `format` query parameter of the artworks export.
+
+    Args:
+        params (dict): Query parameters, `format` is a key of `ARTWORKS_EXPORT_FORMATS`.
+
+    Returns:
+        str: The export format, "ndjson" when missing.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    export_format = params.get('format', ['ndjson'])[0].strip().lower()
+    if export_format not in ARTWORKS_EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    return export_format
+
+def encode_ndjson_artworks(artworks):
+    """
+    Encodes artworks as newline-delimited JSON, one artwork per line.
+
+    Args:
+        artworks (list): The serialized artworks.
+
+    Returns:
+        bytes: The encoded lines.
+    """
+    return b"".join(json_dumps(artwork) + b"\n" for artwork in artworks)
+
+def encode_csv_artworks(artworks, fields, header=False):
+    """
+    Encodes artworks as CSV rows. List fields are written as JSON arrays, missing values as
+    empty cells.
+
+    Args:
+        artworks (list): The serialized artworks.
+        fields (tuple): The columns, in order.
+        header (bool): Whether the header row is written first.
+
+    Returns:
+        bytes: The encoded rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(fields)
+    for artwork in artworks:
+        writer.writerow([
+            json.dumps(artwork[field]) if isinstance(artwork[field], (list, dict)) else artwork[field]
+            for field in fields
+        ])
+    return buffer.getvalue().encode("utf-8")
+
+def encode_cursor(sort_type, sort_key):
+    """
+    Encodes an opaque keyset pagination cursor.
+
+    Args:
+        sort_type (str): The sort the cursor was produced for.
+        sort_key (list): The sort key of the last returned artwork, ending with its id.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    payload = json.dumps({"sort": sort_type, "after": sort_key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor, sort_type):
+    """
+    Decodes a keyset pagination cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor string.
+        sort_type (str): The sort of the current request, which must match the cursor's.
+
+    Returns:
+        list: The sort key of the last artwork of the previous page, ending with its id.
+
+    Raises:
+        ValueError: If the cursor is malformed or was produced for another sort.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        cursor_sort, sort_key = payload["sort"], payload["after"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as exception:
+        raise ValueError(f"Malformed cursor: {cursor}") from exception
+
+    if cursor_sort != sort_type or not isinstance(sort_key, list) or not sort_key:
+        raise ValueError(f"Cursor does not match sort: {sort_type}")
+
+    return sort_key
+
 async def format_artworks_by_params(data, params):
     """
     Formats and sorts a list of artworks based on query parameters.
 
+    Database queries sort in SQL (see `ARTWORKS_SORT_KEYS`), this is the fallback for
+    artworks that are already in memory.
+
     Args:
         data (list): List of artwork dictionaries to be formatted.
         params (dict): Query parameters containing sorting preferences.
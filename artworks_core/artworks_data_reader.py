@@ -1,30 +1,68 @@
-import numpy
-import pandas
-from tortoise.transactions import in_transaction
-
-from artworks_core.artworks_data_helper import format_artworks_by_params
+import asyncio
+from collections import Counter
+
+from tortoise import connections
+from tortoise.expressions import Q, RawSQL
+from tortoise.functions import Count, Max
+
+from artworks_core.artworks_data_helper import (
+    ARTWORK_API_FIELDS,
+    ARTWORK_CACHED_FIELDS,
+    ARTWORKS_EXPORT_FORMATS,
+    decode_cursor,
+    encode_csv_artworks,
+    encode_cursor,
+    encode_ndjson_artworks,
+    format_upstream_artwork,
+    get_artwork_etag,
+    get_artworks_batch_ids,
+    get_artworks_export_format,
+    get_artworks_fields,
+    get_artworks_filters,
+    get_artworks_list_etag,
+    get_artworks_pagination,
+    get_artworks_query_params,
+    get_artworks_sort,
+    get_recommendation_preferences,
+    get_recommendation_profile,
+    get_search_cache_key,
+)
+from artworks_core.artworks_recommendation_index import (
+    get_recommendation_index,
+    get_recommendation_index_version,
+    run_index_query,
+)
 from artworks_core.models import Artwork
 from artworks_settings import get_app_instance
-from artworks_utils import logger, handle_get_request
-
-user_preferences = {
-    "style_title": "Post-Impressionism",
-    "medium_display": "Oil on canvas",
-    "category_titles": ["Painting and Sculpture of Europe"]
-}
-
-async def get_total_artworks():
+from artworks_utils import (
+    logger,
+    handle_get_request,
+    TTLCache,
+    json_size,
+    ExecutorOverloadedError,
+    JSONFragments,
+    json_dumps,
+)
+
+async def get_total_artworks(since=None):
     """
     Fetches the total number of artworks from the external API.
 
+    Args:
+        since (str, optional): ISO-8601 upstream timestamp, counts only the artworks modified since then.
+
     Returns:
         int: Total number of artworks, or 0 if the count is unavailable.
     """
-    response = await handle_get_request(get_app_instance().config.ARTWORKS_API, {})
+    config = get_app_instance().config
+    if since is None:
+        response = await handle_get_request(config.ARTWORKS_API, {})
+    else:
+        response = await handle_get_request(config.ARTWORKS_SEARCH_API, get_artworks_query_params(1, 1, since))
 
     try:
         return response["data"]["pagination"]["total"]
-    except KeyError as exception:
+    except (KeyError, TypeError) as exception:
         logger.info("get_total_artworks exception: %s", exception)
         return 0
 
@@ -52,77 +90,531 @@ async def get_or_create_artwork(**kwargs):
 
 async def get_artworks_by_params(params):
     """
-    Fetches artworks based on pagination and sorting parameters.
+    Fetches artworks based on filtering, pagination and sorting parameters.
+
+    Only the columns of the `fields` parameter (see `get_artworks_fields`) are selected, as plain
+    dictionaries without model instances, so grid views skip the large description columns.
+
+    Filters (see `get_artworks_filters`) run in SQL on indexed columns: btree indexes for the
+    scalar columns and date ranges, GIN indexes for the JSONB list containment filters.
+
+    Sorting happens in SQL: each supported `sort` (date, title, artist_title, artist_display,
+    with an _asc or _desc suffix) becomes an ORDER BY on an indexed sort key, with the id as a
+    tiebreaker. Without a valid sort, artworks are ordered by id.
+
+    Two pagination styles are supported, both deterministic:
+        - Keyset: `cursor` (the `next` value of the previous response) and `limit`. Every page
+          is an index range scan starting after the previous page's last sort key and id, so
+          page N costs the same as page 1 and pages stay stable while ingest is writing.
+        - Offset: `page` and `limit`, kept for compatibility (cost grows with the page number).
+
+    When the fragment cache is enabled (see `get_artwork_fragment_cache`), the artworks are
+    returned as their cached JSON encodings, so the response is assembled by joining them.
 
     Args:
-        params (dict): Query parameters containing pagination and sorting information.
+        params (dict): Query parameters containing filtering, pagination and sorting information.
 
     Returns:
-        dict: Serialized and formatted list of artworks with HTTP status code.
+        dict: Serialized list of artworks (or `JSONFragments`), the `next` cursor (None on the
+            last page) and the HTTP status code.
     """
     try:
+        page, limit = get_artworks_pagination(params, get_app_instance().config.ARTWORKS_MAX_LIMIT)
+        cursor = params.get('cursor', [None])[0]
+        sort_type, sort_expression, descending = get_artworks_sort(params)
+
+        logger.debug(
+            "get_artworks_by_params page: %s, limit: %s, sort: %s, cursor: %s", page, limit, sort_type, cursor
+        )
+
         try:
-            page = int(params['page'][0])  # Use a string default to align with list
-            limit = int(params['limit'][0])  # Use a string default
-        except (ValueError, IndexError) as exception:
-            logger.error("Invalid pagination parameters: %s", exception)
-            page, limit = 1, 10
+            filters = get_artworks_filters(params)
+            fields = get_artworks_fields(params)
+        except ValueError as exception:
+            logger.error("Invalid query parameters: %s", exception)
+            return {"error": str(exception), "data": [], "status": 400}
+
+        queryset = Artwork.filter(**filters)
+        direction = "-" if descending else ""
+        if sort_expression:
+            queryset = queryset.annotate(sort_key=RawSQL(sort_expression)).order_by(
+                f"{direction}sort_key", f"{direction}id"
+            )
+        else:
+            queryset = queryset.order_by("id")
+
+        if cursor:
+            try:
+                last_key = decode_cursor(cursor, sort_type)
+                queryset = queryset.filter(get_keyset_filter(last_key, sort_expression, descending))
+            except ValueError as exception:
+                logger.error("Invalid pagination cursor: %s", exception)
+                return {"error": "Invalid cursor", "data": [], "status": 400}
+        else:
+            # Calculate the offset
+            queryset = queryset.offset((page - 1) * limit)
+
+        # Read before the query, so fragments encoded from rows older than an invalidation are dropped
+        fragment_cache = get_artwork_fragment_cache()
+        generation = fragment_cache.generation
+
+        # Fetch one extra artwork to know whether there is a next page
+        selected_fields = (*fields, "sort_key") if sort_expression else fields
+        artworks = await queryset.limit(limit + 1).values(*selected_fields)
+        has_next = len(artworks) > limit
+        artworks = artworks[:limit]
+
+        next_cursor = None
+        if has_next:
+            last_artwork = artworks[-1]
+            last_key = [last_artwork["sort_key"], last_artwork["id"]] if sort_expression else [last_artwork["id"]]
+            next_cursor = encode_cursor(sort_type, last_key)
+
+        # Drop the internal sort key from the serialized artworks
+        if sort_expression:
+            for artwork in artworks:
+                del artwork["sort_key"]
+
+        if fragment_cache.max_entries:
+            return {"data": encode_artworks(artworks, fields, generation), "next": next_cursor, "status": 200}
+        return {"data": artworks, "next": next_cursor, "status": 200}
+    except Exception as exception:
+        logger.error("get_artworks_by_params exception: %s", exception)
+        return {"data": [], "status": 400}
+
+# Catalog version of the list route, created on first use by `get_catalog_version_cache` and
+# cleared by `invalidate_artworks_caches` whenever artworks change
+catalog_version_cache = None
+
+def get_catalog_version_cache():
+    """
+    Returns the cache of the catalog version (see `load_catalog_version`).
+
+    Settings:
+        - ARTWORK_CACHE_TTL_SECONDS: Seconds the version is cached, a safety net as changes
+          clear it.
+
+    Returns:
+        TTLCache: The cache of the single catalog version.
+    """
+    global catalog_version_cache
+    if catalog_version_cache is None:
+        catalog_version_cache = TTLCache(max_entries=1, ttl=get_app_instance().config.ARTWORK_CACHE_TTL_SECONDS)
+    return catalog_version_cache
+
+async def load_catalog_version():
+    """
+    Reads the catalog version: the number of artworks and their last write time.
+
+    Every insert or update moves the last write time (see `Artwork.updated_at`) and every delete
+    changes the count, so the version is the same in every server process until the next write.
 
-        logger.debug("get_artworks_by_params page: %s, limit: %s", page, limit)
+    Returns:
+        tuple: The number of artworks and the last write time (None without artworks).
+    """
+    version = await Artwork.all().annotate(
+        count=Count("id"), last_modified=Max("updated_at")
+    ).first().values("count", "last_modified")
+    return version["count"], version["last_modified"]
 
-        # Calculate the offset
-        offset = (page - 1) * limit
+async def get_artworks_list_validators(params):
+    """
+    Returns the validators of conditional requests to the artworks list.
 
-        # Fetch paginated data
-        artworks = await Artwork.all().offset(offset).limit(limit)
+    The catalog version is cached until artworks change, so revalidating a list does not query
+    the database. Read it before the artworks: a list read during a write then carries the
+    previous version and is revalidated in full afterwards.
 
-        # Serialize data
-        serialized_artworks = [artwork.to_dict() for artwork in artworks]
-        data_by_params = await format_artworks_by_params(serialized_artworks, params)
+    Invalid query parameters have no validators, so the request is never answered with a 304
+    and `get_artworks_by_params` rejects it with its 400.
 
-        return {"data": data_by_params, "status": 200}
+    Args:
+        params (dict): The query parameters of the list.
+
+    Returns:
+        tuple: The entity tag (see `get_artworks_list_etag`) and the last write of the catalog,
+            or (None, None) if the parameters are invalid or the catalog version is unavailable.
+    """
+    try:
+        get_artworks_filters(params)
+        get_artworks_fields(params)
+        cursor = params.get('cursor', [None])[0]
+        if cursor:
+            decode_cursor(cursor, get_artworks_sort(params)[0])
+    except ValueError:
+        return None, None
+
+    try:
+        catalog_version = await get_catalog_version_cache().get_or_load("catalog", load_catalog_version)
+        return get_artworks_list_etag(catalog_version, params), catalog_version[1]
     except Exception as exception:
-        logger.error("get_artworks_by_params exception: %s", exception)
-        return {"data": [], "status": 400}
+        logger.error("get_artworks_list_validators exception: %s", exception)
+        return None, None
+
+def get_artworks_export(params):
+    """
+    Prepares a streaming export of the artworks matching the list filters.
+
+    The artworks are read in id order, `EXPORT_CHUNK_SIZE` at a time, each chunk being an index
+    range scan starting after the previous chunk's last id. Only one chunk is held in memory and
+    no database connection stays checked out between chunks, whatever the catalog size or the
+    client's download speed.
+
+    Args:
+        params (dict): Query parameters: `format` ("ndjson" or "csv"), the filters of the
+            artworks list (see `get_artworks_filters`) and `fields` (see `get_artworks_fields`).
+
+    Returns:
+        dict: The "chunks" (async iterator of encoded bytes), "content_type", "filename" and
+            status 200, or an error message with status 400 for invalid parameters.
+    """
+    try:
+        export_format = get_artworks_export_format(params)
+        filters = get_artworks_filters(params)
+        fields = get_artworks_fields(params)
+    except ValueError as exception:
+        logger.error("Invalid export parameters: %s", exception)
+        return {"error": str(exception), "data": [], "status": 400}
+
+    chunk_size = get_app_instance().config.EXPORT_CHUNK_SIZE
+    return {
+        "chunks": export_artworks_chunks(export_format, filters, fields, chunk_size),
+        "content_type": ARTWORKS_EXPORT_FORMATS[export_format],
+        "filename": f"artworks.{export_format}",
+        "status": 200,
+    }
+
+async def export_artworks_chunks(export_format, filters, fields, chunk_size):
+    """
+    Reads the filtered artworks chunk by chunk and encodes each chunk.
+
+    Args:
+        export_format (str): "ndjson" or "csv".
+        filters (dict): Keyword arguments for `QuerySet.filter`.
+        fields (tuple): The artwork fields to select, including "id".
+        chunk_size (int): Number of artworks per chunk.
 
-async def get_artwork_by_id(artwork_id):
+    Yields:
+        bytes: The encoded artworks of a chunk (the CSV header comes first).
+    """
+    if export_format == "csv":
+        yield encode_csv_artworks([], fields, header=True)
+
+    last_id = None
+    while True:
+        queryset = Artwork.filter(**filters)
+        if last_id is not None:
+            queryset = queryset.filter(id__gt=last_id)
+        artworks = await queryset.order_by("id").limit(chunk_size).values(*fields)
+        if not artworks:
+            return
+
+        if export_format == "csv":
+            yield encode_csv_artworks(artworks, fields)
+        else:
+            yield encode_ndjson_artworks(artworks)
+
+        if len(artworks) < chunk_size:
+            return
+        last_id = artworks[-1]["id"]
+
+def get_keyset_filter(last_key, sort_expression, descending):
+    """
+    Builds the keyset condition selecting the artworks after a cursor's sort key.
+
+    Args:
+        last_key (list): Sort key of the previous page's last artwork, ending with its id.
+        sort_expression (str): The annotated SQL sort key, or None when sorting by id only.
+        descending (bool): Whether the sort is descending.
+
+    Returns:
+        Q: The filter, written as `key >= v AND (key > v OR id > last_id)` (mirrored when
+            descending) so the sort key index can seek directly to the cursor.
+
+    Raises:
+        ValueError: If the sort key does not match the sort.
+    """
+    comparison, inclusive = ("lt", "lte") if descending else ("gt", "gte")
+
+    if sort_expression is None:
+        if len(last_key) != 1:
+            raise ValueError(f"Unexpected cursor key: {last_key}")
+        return Q(**{f"id__{comparison}": last_key[0]})
+
+    if len(last_key) != 2:
+        raise ValueError(f"Unexpected cursor key: {last_key}")
+    last_value, last_id = last_key
+    return Q(**{f"sort_key__{inclusive}": last_value}) & (
+        Q(**{f"sort_key__{comparison}": last_value}) | Q(**{f"id__{comparison}": last_id})
+    )
+
+# Serialized artworks cache of the detail route, created from the settings on first use by
+# `get_artwork_cache` and invalidated by `invalidate_artworks_caches` when ingest changes artworks
+artwork_cache = None
+
+def get_artwork_cache():
+    """
+    Returns the shared serialized artworks cache.
+
+    Settings:
+        - ARTWORK_CACHE_MAX_ENTRIES: Maximum number of cached artworks (0 disables the cache).
+        - ARTWORK_CACHE_MAX_BYTES: Maximum total JSON size of the cached artworks.
+        - ARTWORK_CACHE_TTL_SECONDS: Seconds an artwork is cached, a safety net as changes
+          invalidate cached artworks.
+
+    Returns:
+        TTLCache: The artworks cache, keyed by artwork id.
+    """
+    global artwork_cache
+    if artwork_cache is None:
+        config = get_app_instance().config
+        artwork_cache = TTLCache(
+            max_entries=config.ARTWORK_CACHE_MAX_ENTRIES,
+            ttl=config.ARTWORK_CACHE_TTL_SECONDS,
+            max_bytes=config.ARTWORK_CACHE_MAX_BYTES,
+            sizeof=json_size,
+        )
+    return artwork_cache
+
+# Pre-encoded artworks of the list route, created from the settings on first use by
+# `get_artwork_fragment_cache` and invalidated with the artworks cache
+artwork_fragment_cache = None
+
+def fragments_size(fragments):
+    """
+    Returns the size in bytes of the encoded fragments of an artwork.
+    """
+    return sum(len(fragment) for fragment in fragments.values())
+
+def get_artwork_fragment_cache():
+    """
+    Returns the shared pre-encoded artworks cache of the list route.
+
+    Settings:
+        - ARTWORK_FRAGMENT_CACHE_MAX_ENTRIES: Maximum number of cached artworks (0 disables the cache).
+        - ARTWORK_FRAGMENT_CACHE_MAX_BYTES: Maximum total size of the encoded artworks.
+        - ARTWORK_CACHE_TTL_SECONDS: Seconds an artwork is cached, as for the artworks cache.
+
+    Returns:
+        TTLCache: The cache, keyed by artwork id, of the JSON encoded artwork by selected fields.
+    """
+    global artwork_fragment_cache
+    if artwork_fragment_cache is None:
+        config = get_app_instance().config
+        artwork_fragment_cache = TTLCache(
+            max_entries=config.ARTWORK_FRAGMENT_CACHE_MAX_ENTRIES,
+            ttl=config.ARTWORK_CACHE_TTL_SECONDS,
+            max_bytes=config.ARTWORK_FRAGMENT_CACHE_MAX_BYTES,
+            sizeof=fragments_size,
+        )
+    return artwork_fragment_cache
+
+def encode_artworks(artworks, fields, generation):
+    """
+    Encodes serialized artworks to JSON, reusing the cached encoding of each artwork.
+
+    Args:
+        artworks (list): The serialized artworks, with the `fields` columns.
+        fields (tuple): The selected fields, part of the cache key.
+        generation (int): The fragment cache `generation` read before the artworks were queried.
+
+    Returns:
+        JSONFragments: The encoded artworks, joined into a JSON array by `json_dumps`.
+    """
+    cache = get_artwork_fragment_cache()
+    fragments = []
+    for artwork in artworks:
+        encoded_fields = cache.get(artwork["id"]) or {}
+        fragment = encoded_fields.get(fields)
+        if fragment is None:
+            fragment = json_dumps(artwork)
+            cache.set(artwork["id"], {**encoded_fields, fields: fragment}, generation)
+        fragments.append(fragment)
+    return JSONFragments(fragments)
+
+def invalidate_artworks_caches(artwork_ids):
+    """
+    Drops the cached copies of changed artworks (artworks change handler).
+
+    Args:
+        artwork_ids (list): The changed artwork ids, or None when any artwork may have changed.
+    """
+    if artwork_ids is None:
+        get_artwork_cache().clear()
+        get_artwork_fragment_cache().clear()
+    else:
+        for artwork_id in artwork_ids:
+            get_artwork_cache().invalidate(artwork_id)
+            get_artwork_fragment_cache().invalidate(artwork_id)
+
+    # Search results embed artworks and rank new ones, so any change makes them stale
+    get_search_cache().clear()
+    get_catalog_version_cache().clear()
+
+async def get_artwork_by_id(artwork_id, params=None):
     """
     Retrieves a single artwork's data based on its ID.
 
+    Serialized artworks are cached (see `get_artwork_cache`), so a cache hit does not query the
+    database. Concurrent misses of the same artwork share a single query. The cached artwork also
+    holds the validators of conditional requests, so a revalidation is answered from memory.
+
     Args:
         artwork_id (str): The ID of the artwork to retrieve.
+        params (dict, optional): Query parameters, `fields` selects a sparse fieldset
+            (see `get_artworks_fields`).
 
     Returns:
         dict: A dictionary containing the artwork data and a status code.
             - "data": The serialized artwork data or an empty list if not found.
-            - "status": HTTP status code (200 for success, 400 for errors).
+            - "status": HTTP status code (200 for success, 404 if not found, 400 for errors).
+            - "etag", "last_modified": The entity tag of the representation (see `get_artwork_etag`)
+              and the last write of the artwork, for found artworks only.
 
     Logs:
         Logs the artwork ID being queried and any exceptions encountered.
 
-    Example: >>> await get_artwork_by_id("123")
-        {"data": {"id": "123", "title": "Mona Lisa"}, "status": 200}
+    Example: >>> await get_artwork_by_id("123", {"fields": ["title"]})
+        {"data": {"id": 123, "title": "Mona Lisa"}, "status": 200}
     """
     logger.info("get_artwork_by_id artwork_id: %s", artwork_id)
     try:
-        # Find artwork by id
-        artwork = await Artwork.get_or_none(id=artwork_id)
+        artwork_id = int(artwork_id)
+        fields = get_artworks_fields(params or {})
+
+        serialized_artwork = await get_artwork_cache().get_or_load(
+            artwork_id,
+            lambda: Artwork.filter(id=artwork_id).first().values(*ARTWORK_CACHED_FIELDS),
+            cacheable=lambda artwork: artwork is not None,
+        )
+
+        if serialized_artwork is None:
+            return {"data": [], "status": 404}
+
+        # Copy the requested fields, leaving the cached artwork untouched
+        return {
+            "data": {field: serialized_artwork[field] for field in fields},
+            "status": 200,
+            "etag": get_artwork_etag(serialized_artwork, fields),
+            "last_modified": serialized_artwork["updated_at"],
+        }
+    except Exception as exception:
+        logger.error("get_artwork_by_id exception: %s", exception)
+        return {"data": [], "status": 400}
 
-        # Serialize data
-        serialized_artwork = artwork.to_dict()
+async def get_artworks_by_ids(params):
+    """
+    Retrieves several artworks by ID in a single lookup.
+
+    Cached artworks (see `get_artwork_cache`) are served from memory, the others are read with
+    a single `id IN (...)` query and cached, as for the detail route.
+
+    Args:
+        params (dict): Query parameters, `ids` lists the artwork ids (see `get_artworks_batch_ids`)
+            and `fields` selects a sparse fieldset (see `get_artworks_fields`).
 
-        return {"data": serialized_artwork, "status": 200}
+    Returns:
+        dict: A dictionary containing the artworks and a status code.
+            - "data": The serialized artworks in request order, an unknown id is returned as
+              `{"id": ..., "error": "Artwork not found"}`.
+            - "status": HTTP status code (200 for success, 400 for invalid parameters or errors).
+
+    Example: >>> await get_artworks_by_ids({"ids": ["12,99"], "fields": ["title"]})
+        {"data": [{"id": 12, "title": "Mona Lisa"}, {"id": 99, "error": "Artwork not found"}], "status": 200}
+    """
+    try:
+        artwork_ids = get_artworks_batch_ids(params, get_app_instance().config.ARTWORKS_MAX_BATCH_SIZE)
+        fields = get_artworks_fields(params)
+    except ValueError as exception:
+        logger.error("Invalid query parameters: %s", exception)
+        return {"error": str(exception), "data": [], "status": 400}
+
+    try:
+        cache = get_artwork_cache()
+        artworks = {}
+        for artwork_id in set(artwork_ids):
+            serialized_artwork = cache.get(artwork_id)
+            if serialized_artwork is not None:
+                artworks[artwork_id] = serialized_artwork
+
+        missing_ids = [artwork_id for artwork_id in set(artwork_ids) if artwork_id not in artworks]
+        if missing_ids:
+            generation = cache.generation
+            for serialized_artwork in await Artwork.filter(id__in=missing_ids).values(*ARTWORK_CACHED_FIELDS):
+                artworks[serialized_artwork["id"]] = serialized_artwork
+                cache.set(serialized_artwork["id"], serialized_artwork, generation)
+
+        return {
+            "data": [
+                {field: artworks[artwork_id][field] for field in fields}
+                if artwork_id in artworks
+                else {"id": artwork_id, "error": "Artwork not found"}
+                for artwork_id in artwork_ids
+            ],
+            "status": 200,
+        }
     except Exception as exception:
-        logger.error("get_artwork_by_id exception: %s", exception)
+        logger.error("get_artworks_by_ids exception: %s", exception)
         return {"data": [], "status": 400}
 
+# Search results cache, created from the settings on first use by `get_search_cache`
+search_cache = None
+
+def get_search_cache():
+    """
+    Returns the shared search results cache.
+
+    Settings:
+        - SEARCH_CACHE_MAX_ENTRIES: Maximum number of cached searches (0 disables the cache).
+        - SEARCH_CACHE_TTL_SECONDS: Seconds a cached search is fresh.
+        - SEARCH_CACHE_STALE_SECONDS: Seconds an expired search is served while it is refreshed.
+
+    Returns:
+        TTLCache: The search cache.
+    """
+    global search_cache
+    if search_cache is None:
+        config = get_app_instance().config
+        search_cache = TTLCache(
+            max_entries=config.SEARCH_CACHE_MAX_ENTRIES,
+            ttl=config.SEARCH_CACHE_TTL_SECONDS,
+            stale_ttl=config.SEARCH_CACHE_STALE_SECONDS,
+        )
+    return search_cache
+
+# Full-text matches on the weighted search vector (title A, artist B, terms C, description D)
+# and trigram matches on the title and artist (typos), both served by GIN indexes
+SEARCH_ARTWORKS_QUERY = """
+    SELECT "artwork"."id"
+    FROM "artwork", websearch_to_tsquery('english', $1) AS "query"
+    WHERE "artwork"."search_vector" @@ "query"
+        OR "artwork"."title" % $1
+        OR "artwork"."artist_title" % $1
+    ORDER BY
+        ts_rank_cd("artwork"."search_vector", "query")
+            + GREATEST(similarity("artwork"."title", $1), similarity("artwork"."artist_title", $1)) DESC,
+        "artwork"."id"
+    LIMIT $2 OFFSET $3
+"""
+
 async def search_artworks(params):
     """
-    Searches for artworks based on query parameters by querying an external API.
+    Searches for artworks based on query parameters.
+
+    Results are cached (see `get_search_cache`) by normalized query, pagination and fields, and
+    concurrent identical searches are coalesced into a single lookup.
+
+    The search runs on the local database by default (`SEARCH_BACKEND`): a PostgreSQL full-text
+    search on the title, artist, terms and description, ranked by field weight, combined with
+    trigram similarity so misspelled titles and artist names still match. The external API is
+    used when `SEARCH_BACKEND` is "upstream", or as a fallback when the local search fails
+    (`SEARCH_UPSTREAM_FALLBACK`).
 
     Args:
         params (dict): Query parameters containing the search criteria. Expected keys include:
             - 'q' (list): The search query string (mandatory).
+            - 'page' and 'limit' (list): Offset pagination (optional).
+            - 'fields' (list): Sparse fieldset (optional).
 
     Returns:
         dict: A dictionary containing the following keys:
@@ -145,31 +637,267 @@ async def search_artworks(params):
     except KeyError:
         return {"error": "Artwork not found", 'status': 404}
 
-    query_params = {
-        "q": search_query,
+    config = get_app_instance().config
+    try:
+        fields = get_artworks_fields(params)
+    except ValueError as exception:
+        logger.error("Invalid query parameters: %s", exception)
+        return {"error": str(exception), "data": [], "status": 400}
+
+    page, limit = get_artworks_pagination(params, config.ARTWORKS_MAX_LIMIT)
+
+    # Identical concurrent searches share one lookup, and only successful results are cached
+    return await get_search_cache().get_or_load(
+        get_search_cache_key(search_query, page, limit, fields),
+        lambda: run_search(search_query, page, limit, fields),
+        cacheable=lambda result: result["status"] == 200,
+    )
+
+async def run_search(search_query, page, limit, fields):
+    """
+    Runs a search on the configured backend, without caching.
+
+    Args:
+        search_query (str): The search query string.
+        page (int): The 1-based page number.
+        limit (int): The page size.
+        fields (tuple): The artwork fields to select.
+
+    Returns:
+        dict: The matching artworks and the HTTP status code, or an error message.
+    """
+    config = get_app_instance().config
+    if config.SEARCH_BACKEND != "local":
+        return await search_upstream_artworks(search_query, page, limit, fields)
+
+    try:
+        artworks = await search_local_artworks(search_query, page, limit, fields)
+        return {"data": artworks, "status": 200}
+    except Exception as exception:
+        logger.error("search_local_artworks exception: %s", exception)
+        if config.SEARCH_UPSTREAM_FALLBACK:
+            return await search_upstream_artworks(search_query, page, limit, fields)
+        return {"error": "Artwork search is unavailable", "status": 503}
+
+async def search_local_artworks(search_query, page, limit, fields):
+    """
+    Searches the local artworks, best matches first.
+
+    Args:
+        search_query (str): The search query, in web search syntax ("quoted phrases", -exclusions, or).
+        page (int): The 1-based page number.
+        limit (int): The page size.
+        fields (tuple): The artwork fields to select.
+
+    Returns:
+        list: The serialized matching artworks of the page, in rank order.
+    """
+    rows = await connections.get("default").execute_query_dict(
+        SEARCH_ARTWORKS_QUERY, [search_query, limit, (page - 1) * limit]
+    )
+    artwork_ids = [row["id"] for row in rows]
+
+    # Hydrate the ranked ids through the ORM, which decodes the JSON columns
+    artworks = {
+        artwork["id"]: artwork for artwork in await Artwork.filter(id__in=artwork_ids).values(*fields)
     }
+    return [artworks[artwork_id] for artwork_id in artwork_ids if artwork_id in artworks]
+
+async def search_upstream_artworks(search_query, page, limit, fields):
+    """
+    Searches for artworks by querying the external API.
 
-    response = await handle_get_request(get_app_instance().config.ARTWORKS_SEARCH_API, query_params)
+    Args:
+        search_query (str): The search query string.
+        page (int): The 1-based page number.
+        limit (int): The page size.
+        fields (tuple): The artwork fields to select.
+
+    Returns:
+        dict: The matching artworks of the page in the shape of the local search (see
+            `format_upstream_artwork`) and status 200, or an error message with the upstream
+            status (or 404 if the response has no results).
+    """
+    config = get_app_instance().config
+    response = await handle_get_request(
+        config.ARTWORKS_SEARCH_API,
+        {"q": search_query, "page": page, "limit": limit, "fields": ",".join(ARTWORK_API_FIELDS)},
+        timeout=config.SEARCH_REQUEST_TIMEOUT,
+        max_retries=config.SEARCH_MAX_RETRIES,
+    )
+
+    if response.get("status") != 200:
+        # Upstream throttled, failing or short-circuited: surface its status instead of a 404
+        return {"error": "Artwork search is unavailable", "status": response.get("status", 500)}
 
     try:
-        return {"data": response['data']['data'], "status": 200}
+        artworks = [format_upstream_artwork(item, fields) for item in response['data']['data']]
+        return {"data": artworks, "status": 200}
     except Exception as exception:
         logger.error("search_artworks exception: %s", exception)
         return {"error": "Artwork not found", 'status': 404}
 
-async def get_artworks_recommendations():
+def get_cache_stats():
+    """
+    Returns the counters of the in-process caches.
+
+    Returns:
+        dict: The statistics of each cache, by name.
+    """
+    return {
+        "artworks": get_artwork_cache().stats(),
+        "artwork_fragments": get_artwork_fragment_cache().stats(),
+        "catalog_version": get_catalog_version_cache().stats(),
+        "search": get_search_cache().stats(),
+        "similar": get_similar_cache().stats(),
+        "recommendations": get_recommendation_cache().stats(),
+    }
+
+# Recommendation results cache, created from the settings on first use by `get_recommendation_cache`.
+# Keys include the recommendation index version, which changes with every rebuild after ingest
+recommendation_cache = None
+
+# Request counts of the preference profiles, the most requested are pre-warmed after index rebuilds
+recommendation_profile_counts = Counter()
+
+# Background pre-warm task, see `schedule_recommendation_cache_prewarm`
+recommendation_prewarm_task = None
+
+def get_recommendation_cache():
+    """
+    Returns the shared recommendation results cache.
+
+    Settings:
+        - RECOMMENDATION_CACHE_MAX_ENTRIES: Maximum number of cached results (0 disables the cache).
+        - RECOMMENDATION_CACHE_TTL_SECONDS: Seconds a result is cached, a safety net as index
+          rebuilds change the keys.
+
+    Returns:
+        TTLCache: The recommendations cache, keyed by index version and preference profile.
+    """
+    global recommendation_cache
+    if recommendation_cache is None:
+        config = get_app_instance().config
+        recommendation_cache = TTLCache(
+            max_entries=config.RECOMMENDATION_CACHE_MAX_ENTRIES, ttl=config.RECOMMENDATION_CACHE_TTL_SECONDS
+        )
+    return recommendation_cache
+
+def count_recommendation_profile(profile):
+    """
+    Counts a request of a preference profile, keeping the most requested profiles only.
+
+    Args:
+        profile (tuple): The preference profile (see `get_recommendation_profile`).
+    """
+    recommendation_profile_counts[profile] += 1
+
+    # Bounded to a few times the pre-warmed profiles: drop the least requested half when full
+    max_profiles = max(get_app_instance().config.RECOMMENDATION_CACHE_PREWARM, 1) * 8
+    if len(recommendation_profile_counts) > max_profiles:
+        most_requested = recommendation_profile_counts.most_common(max_profiles // 2)
+        recommendation_profile_counts.clear()
+        recommendation_profile_counts.update(dict(most_requested))
+
+async def load_recommendations(profile):
+    """
+    Computes the recommendations of a preference profile on the shared index, without caching.
+
+    Args:
+        profile (tuple): The preference profile (see `get_recommendation_profile`).
+
+    Returns:
+        list: The recommended artworks.
+    """
+    config = get_app_instance().config
+    style_title, medium_display, category_titles, date_start, date_end, k = profile
+    preferences = {
+        "style_title": style_title,
+        "medium_display": medium_display,
+        "category_titles": list(category_titles),
+        "date_start": date_start,
+        "date_end": date_end,
+    }
+    weights = {
+        "style_title": config.RECOMMENDATION_STYLE_WEIGHT,
+        "medium_display": config.RECOMMENDATION_MEDIUM_WEIGHT,
+        "category_titles": config.RECOMMENDATION_CATEGORY_WEIGHT,
+    }
+    _, recommendations = await run_index_query(
+        "recommend", preferences, k, weights, config.RECOMMENDATION_DATE_TIEBREAK
+    )
+    return recommendations
+
+def schedule_recommendation_cache_prewarm(index):
+    """
+    Drops the results of previous indexes and pre-warms the most requested profiles in the
+    background (recommendation index refresh handler).
+
+    Args:
+        index (RecommendationIndex): The new index.
+    """
+    global recommendation_prewarm_task
+    get_recommendation_cache().clear()
+    if recommendation_prewarm_task is not None and not recommendation_prewarm_task.done():
+        recommendation_prewarm_task.cancel()
+    recommendation_prewarm_task = asyncio.ensure_future(prewarm_recommendation_cache(index.version))
+
+async def prewarm_recommendation_cache(index_version):
+    """
+    Computes and caches the results of the most requested preference profiles, one at a time so
+    live requests keep most of the recommendation executor.
+
+    Settings:
+        - RECOMMENDATION_CACHE_PREWARM: Number of profiles pre-warmed (0 disables pre-warming).
+
+    Args:
+        index_version (int): Version of the index to pre-warm, pre-warming stops once it is replaced.
+    """
+    cache = get_recommendation_cache()
+    profiles = [
+        profile
+        for profile, _ in recommendation_profile_counts.most_common(
+            get_app_instance().config.RECOMMENDATION_CACHE_PREWARM
+        )
+    ]
+    for profile in profiles:
+        if get_recommendation_index_version() != index_version:
+            return
+        try:
+            await cache.get_or_load((index_version, profile), lambda profile=profile: load_recommendations(profile))
+        except Exception as exception:
+            logger.warning("Pre-warming recommendations %s failed: %s", profile, exception)
+
+    if profiles:
+        logger.info("Recommendations pre-warmed: %s profiles", len(profiles))
+
+async def get_artworks_recommendations(params=None):
     """
     Generate artwork recommendations based on user preferences.
 
-    The function retrieves all artworks from the database and filters them based on the user's preferences.
-    It also computes diversity by considering the temporal proximity of artworks.
+    Artworks matching any preference are scored with the in-memory recommendation index (see
+    `RecommendationIndex`), built once and refreshed after ingest, so a request does not read
+    the database. They are ranked by weighted score, then by temporal proximity to the user's
+    average preferred time period.
 
-    User preferences include:
+    Results are cached (see `get_recommendation_cache`) by normalized preference profile and
+    index version, and concurrent identical requests share one query. The most requested
+    profiles are computed again as soon as a rebuilt index replaces the previous one.
+
+    User preferences include (see `get_recommendation_preferences`):
         - `style_title`: The artistic style of the artwork (e.g., "Post-Impressionism").
         - `medium_display`: The medium used in the artwork (e.g., "Oil on canvas").
         - `category_titles`: Categories associated with the artwork (e.g., "Painting and Sculpture of Europe").
+        - `date_start` / `date_end`: Optional years bounding the recommended artworks.
+        - `k`: Number of recommendations (default: RECOMMENDATIONS_DEFAULT_K).
+
+    Settings:
+        - RECOMMENDATION_STYLE_WEIGHT / RECOMMENDATION_MEDIUM_WEIGHT / RECOMMENDATION_CATEGORY_WEIGHT:
+          Scores of a style, medium and category match.
+        - RECOMMENDATION_DATE_TIEBREAK: Ranks equal scores by temporal proximity.
 
-    Recommendations are returned as a list of artworks sorted by temporal proximity to the user's average preferred time period.
+    Args:
+        params (dict, optional): Query parameters or JSON body with the preferences.
 
     Returns:
         dict: A dictionary containing either:
@@ -177,60 +905,106 @@ async def get_artworks_recommendations():
               - "status" (int): HTTP status code.
               - OR "error" (str): An error message in case of failure.
     """
+    config = get_app_instance().config
     try:
-        # Fetch all artworks from the database
-        async with in_transaction() as conn:
-            artworks = await Artwork.all().values()
-
-        # Convert database records to a Pandas DataFrame
-        artworks_df = pandas.DataFrame(artworks)
-
-        # Handle edge case if no artworks exist
-        if artworks_df.empty:
-            return {"recommendations": [], 'status': 200}
-
-        # Filter artworks based on user preferences
-        filtered_artworks = artworks_df[
-            (artworks_df["style_title"] == user_preferences["style_title"]) |
-            (artworks_df["medium_display"] == user_preferences["medium_display"]) |
-            (artworks_df["category_titles"].apply(lambda x: any(cat in x for cat in user_preferences["category_titles"])))
-        ]
-
-        # Compute diversity by time period
-        if "date_start" in artworks_df.columns and "date_end" in artworks_df.columns:
-            # Calculate avg_date for the entire DataFrame
-            artworks_df["avg_date"] = artworks_df[["date_start", "date_end"]].mean(axis=1, skipna=True)
-
-            # Add avg_date to the filtered DataFrame
-            filtered_artworks = filtered_artworks.copy()
-            filtered_artworks["avg_date"] = filtered_artworks[["date_start", "date_end"]].mean(axis=1, skipna=True)
-
-            # Calculate user_date_preference based on filtered artworks
-            user_date_preference = filtered_artworks["avg_date"].mean()
-
-            # Compute date_similarity for filtered artworks
-            filtered_artworks["date_similarity"] = numpy.abs(filtered_artworks["avg_date"] - user_date_preference)
-
-            # Add a scoring system to prioritize matches
-            filtered_artworks["score"] = (
-                    (filtered_artworks["style_title"] == user_preferences["style_title"]).astype(
-                        int) * 3 +  # High priority
-                    (filtered_artworks["medium_display"] == user_preferences["medium_display"]).astype(
-                        int) * 2 +  # Medium priority
-                    (filtered_artworks["category_titles"].apply(
-                        lambda x: any(cat in x for cat in user_preferences["category_titles"]))).astype(int)
-            # Low priority
-            )
+        preferences, k = get_recommendation_preferences(
+            params or {}, config.RECOMMENDATIONS_DEFAULT_K, config.RECOMMENDATIONS_MAX_K
+        )
+    except ValueError as exception:
+        logger.error("Invalid recommendation parameters: %s", exception)
+        return {"error": str(exception), "recommendations": [], "status": 400}
+
+    profile = get_recommendation_profile(preferences, k)
+    count_recommendation_profile(profile)
+    try:
+        index = await get_recommendation_index()
+        recommendations = await get_recommendation_cache().get_or_load(
+            (index.version, profile), lambda: load_recommendations(profile)
+        )
+        return {"recommendations": recommendations, 'status': 200}
+    except ExecutorOverloadedError as exception:
+        logger.warning("get_artworks_recommendations overloaded: %s", exception)
+        return {"error": "Recommendations are overloaded, retry later", 'status': 503}
+    except asyncio.TimeoutError:
+        logger.warning("get_artworks_recommendations timed out")
+        return {"error": "Recommendations timed out", 'status': 504}
+    except Exception as exception:
+        logger.error("get_artworks_recommendations exception: %s", exception)
+        return {"error": "Artwork not found", 'status': 404}
 
-            # Sort first by score, then by temporal similarity
-            filtered_artworks = filtered_artworks.sort_values(by=["score", "date_similarity"], ascending=[False, True]).head(5)
+# "More like this" results cache, created from the settings on first use by `get_similar_cache`.
+# Keys include the recommendation index version, so a rebuilt index never serves older results
+similar_cache = None
 
-        # Format the response
-        recommendations = filtered_artworks[
-            ["id", "title", "artist_title", "style_title", "medium_display", "thumbnail"]
-        ].to_dict(orient="records")
+def get_similar_cache():
+    """
+    Returns the shared similar artworks cache (precomputed neighbors of the hottest artworks).
 
-        return {"recommendations": recommendations, 'status': 200}
+    Settings:
+        - SIMILAR_CACHE_MAX_ENTRIES: Maximum number of cached neighbor lists (0 disables the cache).
+
+    Returns:
+        TTLCache: The similar artworks cache, keyed by index version, artwork id and k.
+    """
+    global similar_cache
+    if similar_cache is None:
+        config = get_app_instance().config
+        similar_cache = TTLCache(max_entries=config.SIMILAR_CACHE_MAX_ENTRIES, ttl=config.ARTWORK_CACHE_TTL_SECONDS)
+    return similar_cache
+
+async def get_similar_artworks(artwork_id, params=None):
+    """
+    Finds the artworks most similar to an artwork by content ("more like this").
+
+    Similarity is the cosine of the TF-IDF weighted terms, materials, categories, style and
+    medium of the artworks, blended with date proximity (see `RecommendationIndex.similar`).
+    Neighbor lists are cached per artwork, so the hottest artworks are answered in O(1).
+
+    Settings:
+        - SIMILAR_DEFAULT_K: Number of similar artworks when `k` is not given.
+        - SIMILAR_DATE_WEIGHT: Share of the date proximity in the similarity, between 0 and 1.
+        - SIMILAR_DATE_SCALE: Years over which the date proximity decays.
+
+    Args:
+        artwork_id (str): The ID of the artwork.
+        params (dict, optional): Query parameters, `k` is the number of similar artworks
+            (at most RECOMMENDATIONS_MAX_K).
+
+    Returns:
+        dict: The similar artworks with their "similarity" score and status 200, status 404 if
+            the artwork does not exist, or status 400 for invalid parameters.
+    """
+    config = get_app_instance().config
+    params = params or {}
+    try:
+        artwork_id = int(artwork_id)
+        k = int(params.get('k', [config.SIMILAR_DEFAULT_K])[0])
+        if not 1 <= k <= config.RECOMMENDATIONS_MAX_K:
+            raise ValueError(f"k must be between 1 and {config.RECOMMENDATIONS_MAX_K}")
+    except (ValueError, IndexError) as exception:
+        logger.error("Invalid similar artworks parameters: %s", exception)
+        return {"error": str(exception), "data": [], "status": 400}
+
+    try:
+        cache = get_similar_cache()
+        similar_artworks = cache.get((get_recommendation_index_version(), artwork_id, k))
+        if similar_artworks is None:
+            index_version, similar_artworks = await run_index_query(
+                "similar", artwork_id, k, config.SIMILAR_DATE_WEIGHT, config.SIMILAR_DATE_SCALE
+            )
+            if similar_artworks is not None:
+                cache.set((index_version, artwork_id, k), similar_artworks)
+
+        if similar_artworks is None:
+            return {"error": "Artwork not found", "data": [], "status": 404}
+
+        return {"data": similar_artworks, "status": 200}
+    except ExecutorOverloadedError as exception:
+        logger.warning("get_similar_artworks overloaded: %s", exception)
+        return {"error": "Similar artworks are overloaded, retry later", "data": [], "status": 503}
+    except asyncio.TimeoutError:
+        logger.warning("get_similar_artworks timed out")
+        return {"error": "Similar artworks timed out", "data": [], "status": 504}
     except Exception as exception:
-        logger.error("get_artworks_recommendations exception: %s", exception)
-        return {"error": "Artwork not found", 'status': 404}
\ No newline at end of file
+        logger.error("get_similar_artworks exception: %s", exception)
+        return {"error": "Similar artworks are unavailable", "data": [], "status": 500}
@@ -0,0 +1,129 @@
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from artworks_core.artworks_data_writer import get_sync_checkpoint, update_artworks
+from artworks_settings import get_app_instance
+from artworks_utils import advisory_lock, logger
+
+# PostgreSQL advisory lock key reserved for the artworks sync, shared by all workers and replicas
+SYNC_LOCK_KEY = 427001
+
+# State and statistics of the scheduled updates run by this process, for inspection
+update_status = {
+    "running": False,
+    "runs": 0,
+    "skipped_runs": 0,
+    "next_run_at": None,
+    "last_started_at": None,
+    "last_finished_at": None,
+    "last_duration": None,
+    "last_result": None,
+    "last_error": None,
+    "last_summary": None,
+}
+
+async def run_scheduled_update(**update_options):
+    """
+    Runs one artworks update, unless another worker is already running one.
+
+    A PostgreSQL advisory lock makes the update single-flight across processes and replicas,
+    and the run is cancelled after `UPDATE_MAX_RUNTIME_SECONDS`. A cancelled or failed run
+    leaves its sync checkpoint behind, so the next run resumes where it stopped.
+
+    Args:
+        **update_options: Options passed to `update_artworks` (mode, page_size, batch_size, ...).
+
+    Returns:
+        dict: The update summary, or None if the update was skipped, timed out or failed.
+    """
+    config = get_app_instance().config
+
+    async with advisory_lock(SYNC_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.info("Artworks update already running on another worker, skipping this run")
+            update_status["skipped_runs"] += 1
+            return None
+
+        started_at = time.monotonic()
+        update_status.update(
+            running=True,
+            last_started_at=datetime.now(timezone.utc).isoformat(),
+            last_error=None,
+        )
+
+        summary = None
+        try:
+            summary = await asyncio.wait_for(
+                update_artworks(**update_options),
+                timeout=config.UPDATE_MAX_RUNTIME_SECONDS,
+            )
+            update_status["last_result"] = "completed" if summary is not None else "empty"
+        except asyncio.TimeoutError:
+            logger.error("Artworks update exceeded %ss and was cancelled", config.UPDATE_MAX_RUNTIME_SECONDS)
+            update_status.update(last_result="timed_out", last_error="Maximum runtime exceeded")
+        except Exception as exception:
+            logger.error("Artworks update failed: %s", exception)
+            update_status.update(last_result="failed", last_error=str(exception))
+        finally:
+            update_status.update(
+                running=False,
+                runs=update_status["runs"] + 1,
+                last_finished_at=datetime.now(timezone.utc).isoformat(),
+                last_duration=round(time.monotonic() - started_at, 3),
+                last_summary=summary,
+            )
+
+        return summary
+
+async def schedule_artworks_updates(**update_options):
+    """
+    Runs the artworks update periodically until cancelled.
+
+    The first run starts `UPDATE_INITIAL_DELAY_SECONDS` after startup, then every
+    `UPDATE_INTERVAL_SECONDS`. Each delay gets up to `UPDATE_JITTER_SECONDS` of random jitter,
+    so replicas started together do not all wake up at the same moment. A run that fails
+    (e.g. the database is unavailable) is recorded in `update_status` and the schedule goes on.
+
+    Args:
+        **update_options: Options passed to `update_artworks` (mode, page_size, batch_size, ...).
+    """
+    config = get_app_instance().config
+    delay = config.UPDATE_INITIAL_DELAY_SECONDS
+
+    while True:
+        delay += random.uniform(0, config.UPDATE_JITTER_SECONDS)
+        next_run_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        update_status["next_run_at"] = next_run_at.isoformat()
+        logger.info("Next artworks update at %s", update_status["next_run_at"])
+
+        await asyncio.sleep(delay)
+        try:
+            await run_scheduled_update(**update_options)
+        except Exception as exception:
+            # E.g. the update lock could not be taken: keep the schedule, retry next interval
+            logger.error("Scheduled artworks update failed: %s", exception)
+            update_status.update(last_result="failed", last_error=str(exception))
+
+        delay = config.UPDATE_INTERVAL_SECONDS
+
+async def get_update_status():
+    """
+    Returns the state of the scheduled updates of this process and the shared sync checkpoint.
+
+    Returns:
+        dict: A dictionary containing the update statistics and a "checkpoint" entry.
+    """
+    checkpoint = await get_sync_checkpoint()
+    return {
+        **update_status,
+        "checkpoint": {
+            "mode": checkpoint.mode,
+            "status": checkpoint.status,
+            "last_completed_page": checkpoint.last_completed_page,
+            "total_pages": checkpoint.total_pages,
+            "watermark": checkpoint.watermark,
+            "updated_at": checkpoint.updated_at.isoformat() if checkpoint.updated_at else None,
+        },
+    }
@@ -1,125 +1,383 @@
+import asyncio
 import math
+import time
 
+from tortoise.transactions import in_transaction
+
+from artworks_core.artworks_data_helper import (
+    ARTWORK_FIELDS,
+    compute_artwork_fingerprint,
+    get_artworks_query_params,
+    get_latest_timestamp,
+    normalize_artwork_payload,
+)
+from artworks_core.artworks_data_events import publish_artworks_changed
 from artworks_core.artworks_data_reader import get_total_artworks
-from artworks_core.models import Artwork
+from artworks_core.models import Artwork, SyncCheckpoint
 from artworks_utils import handle_get_request, logger
 from artworks_settings import get_app_instance
 
-async def create_if_not_exists(model, **fields):
+# Name of the checkpoint tracking the artworks sync
+SYNC_CHECKPOINT_NAME = "artworks"
+
+# The AIC search API only pages through the first 10,000 results of a query
+AIC_SEARCH_WINDOW = 10000
+
+async def upsert_artworks_batch(batch):
     """
-    Create a record in the database if it does not already exist.
+    Upserts a batch of artworks keyed on the upstream AIC id.
+
+    Each payload is fingerprinted, then the stored fingerprints of the batch are read with a
+    single `aic_id IN (...)` lookup on the unique index. Inserting, updating or skipping an
+    artwork is an O(1) fingerprint comparison, and all new or changed artworks are written with
+    a single `INSERT ... ON CONFLICT ("aic_id") DO UPDATE` statement. Once committed, the ids of
+    the updated artworks are published (see `publish_artworks_changed`).
 
     Args:
-        model: The Tortoise model class.
-        **fields: The fields to use for existence check and creation.
+        batch (list): List of artwork dictionaries as returned by the AIC API.
 
     Returns:
-        Tuple of (instance, created):
-            - instance: The retrieved or newly created instance.
-            - created: Boolean indicating whether the record was created.
+        dict: Counts of "inserted", "updated", "unchanged" and "skipped" (no upstream id) artworks.
     """
-    try:
-        # Check for existence
-        instance = await model.get_or_none(**fields)
-        if instance:
-            logger.info("Record with fields %s already exists. Skipping...", fields)
-            return instance, False
-
-        # Create the record if it doesn't exist
-        instance = await model.create(**fields)
-        logger.info("Created new record with fields: %s", fields)
-        return instance, True
-    except Exception as exception:
-        logger.error("Error in create_if_not_exists: %s", exception)
-        raise
-
-async def save_artworks_page(data):
+    stats = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+
+    # Normalize the payloads, the last occurrence of an upstream id wins
+    artworks_data = {}
+    for item in batch:
+        artwork_data = normalize_artwork_payload(item)
+        if artwork_data["aic_id"] is None:
+            stats["skipped"] += 1
+            continue
+        artwork_data["fingerprint"] = compute_artwork_fingerprint(artwork_data)
+        artworks_data[artwork_data["aic_id"]] = artwork_data
+
+    if not artworks_data:
+        return stats
+
+    async with in_transaction() as connection:
+        existing_artworks = {
+            aic_id: (artwork_id, fingerprint)
+            for artwork_id, aic_id, fingerprint in await Artwork.filter(
+                aic_id__in=list(artworks_data)
+            ).using_db(connection).values_list("id", "aic_id", "fingerprint")
+        }
+
+        changed_artworks = []
+        updated_ids = []
+        for aic_id, artwork_data in artworks_data.items():
+            if aic_id not in existing_artworks:
+                stats["inserted"] += 1
+            elif existing_artworks[aic_id][1] != artwork_data["fingerprint"]:
+                stats["updated"] += 1
+                updated_ids.append(existing_artworks[aic_id][0])
+            else:
+                stats["unchanged"] += 1
+                continue
+            changed_artworks.append(Artwork(**artwork_data))
+
+        if changed_artworks:
+            await Artwork.bulk_create(
+                changed_artworks,
+                on_conflict=["aic_id"],
+                update_fields=[*ARTWORK_FIELDS, "fingerprint", "updated_at"],
+                using_db=connection,
+            )
+
+    # Announce the committed changes so the servers invalidate their cached copies
+    if changed_artworks:
+        await publish_artworks_changed(updated_ids)
+
+    return stats
+
+async def save_artworks_page(data, batch_size=None):
     """
-    Saves a list of artworks to the database.
+    Saves a list of artworks to the database using batched upserts.
 
     Args:
         data (list): List of artwork dictionaries to be saved.
+        batch_size (int, optional): Number of artworks per upsert statement.
+            Defaults to the `INGEST_BATCH_SIZE` setting.
 
     Returns:
-        list: The input data list for potential further processing.
+        dict: Counts of "inserted", "updated", "unchanged" and "skipped" artworks for the page.
     """
-    logger.info("Saving data: %s artworks", len(data))
+    stats = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
 
     if not data:
-        return None
+        return stats
 
-    for item in data:
-        artwork_data = {
-            "title": item.get("title", "Unknown Title"),
-            "artist_title": item.get("artist_title", "Unknown Artist"),
-            "place_of_origin": item.get("place_of_origin", "Unknown Origin"),
-            "thumbnail": item.get("thumbnail", None),
-            "date_start": item.get("date_start", None),
-            "date_end": item.get("date_end", None),
-            "date_display": item.get("date_display", None),
-            "artist_display": item.get("artist_display", None),
-            "description": item.get("description", None),
-            "short_description": item.get("short_description", None),
-            "classification_title": item.get("classification_title", None),
-            "style_title": item.get("style_title", None),
-            "medium_display": item.get("medium_display", None),
-            "material_titles": item.get("material_titles", []),
-            "term_titles": item.get("term_titles", []),
-            "category_titles": item.get("category_titles", []),
-        }
+    logger.info("Saving data: %s artworks", len(data))
+
+    batch_size = batch_size or get_app_instance().config.INGEST_BATCH_SIZE
 
+    for batch_start in range(0, len(data), batch_size):
+        batch = data[batch_start:batch_start + batch_size]
         try:
-            artwork, created = await create_if_not_exists(Artwork, **artwork_data)
-            if created:
-                logger.info("Saved artwork with ID: %s", artwork.id)
-            else:
-                logger.info("Skipped existing artwork: %s", artwork_data["title"])
+            batch_stats = await upsert_artworks_batch(batch)
         except Exception as exception:
-            logger.error("Error saving artwork: %s", exception)
+            logger.error("Error saving artworks batch: %s", exception)
+            raise
+
+        logger.info(
+            "Saved artworks batch: %s inserted, %s updated, %s unchanged, %s skipped",
+            batch_stats["inserted"], batch_stats["updated"], batch_stats["unchanged"], batch_stats["skipped"],
+        )
+        for key, value in batch_stats.items():
+            stats[key] += value
+
+    return stats
+
+async def fetch_artworks_page(page, page_size, since=None):
+    """
+    Fetches a single page of artworks from the Art Institute of Chicago API.
+
+    Args:
+        page (int): The 1-based page number.
+        page_size (int): Number of artworks per page.
+        since (str, optional): ISO-8601 upstream timestamp, fetches only artworks modified since then.
+
+    Returns:
+        list: The artworks of the page, or None if the page could not be fetched.
+    """
+    config = get_app_instance().config
+    api_url = config.ARTWORKS_API if since is None else config.ARTWORKS_SEARCH_API
+    query_params = get_artworks_query_params(page, page_size, since)
+
+    response = await handle_get_request(api_url, query_params)
 
-    return data
+    if response.get("status") != 200:
+        logger.error("Fetching page %s failed with status %s", page, response.get("status"))
+        return None
+
+    try:
+        return response["data"]["data"]
+    except (KeyError, TypeError) as exception:
+        logger.error("Data processing error on page %s: %s", page, exception)
+        return None
 
-async def update_artworks():
+async def get_sync_checkpoint():
+    """
+    Loads the artworks sync checkpoint, creating it on first use.
+
+    Returns:
+        SyncCheckpoint: The checkpoint of the artworks sync.
+    """
+    checkpoint, _ = await SyncCheckpoint.get_or_create(name=SYNC_CHECKPOINT_NAME)
+    return checkpoint
+
+async def update_artworks(
+    mode=None,
+    page_size=None,
+    batch_size=None,
+    fetch_concurrency=None,
+    writer_concurrency=None,
+    queue_size=None,
+):
     """
     Fetches artworks from the Art Institute of Chicago API and saves them to the local database.
 
+    Pages are fetched by `fetch_concurrency` concurrent fetchers and handed to `writer_concurrency`
+    database writers through a bounded queue. When the writers fall behind, the fetchers block on
+    the full queue, so at most `queue_size` pages are held in memory at any time.
+
+    Progress is persisted in a `SyncCheckpoint` after every saved page. An interrupted run (crash,
+    failed pages) resumes after the last page saved without gaps, and a completed run records the
+    newest upstream `updated_at` as the watermark of the next delta run. A page that cannot be
+    fetched is reported in "failed_pages", while a database error stops the run and is raised.
+
+    Modes:
+        - "full": Re-reads the whole collection from the artworks listing API.
+        - "delta": Reads only the artworks modified since the watermark, through the search API
+          sorted by modification time. Falls back to "full" without a watermark, or when the
+          changes exceed the search API's result window.
+
+    Args:
+        mode (str, optional): "full" or "delta" (default: `INGEST_SYNC_MODE`).
+        page_size (int, optional): Artworks per page (default: `INGEST_PAGE_SIZE`).
+        batch_size (int, optional): Artworks per upsert statement (default: `INGEST_BATCH_SIZE`).
+        fetch_concurrency (int, optional): Concurrent page fetchers (default: `INGEST_FETCH_CONCURRENCY`).
+        writer_concurrency (int, optional): Concurrent database writers (default: `INGEST_WRITER_CONCURRENCY`).
+        queue_size (int, optional): Maximum fetched pages waiting to be written (default: `INGEST_QUEUE_SIZE`).
+
     Returns:
-        bool: True if the update was successful, False otherwise.
+        dict: Summary of the run ("mode", "start_page", "total_pages", "pages", "inserted",
+            "updated", "unchanged", "skipped", "failed_pages", "duration"), or None if there was
+            nothing to update.
     """
+    config = get_app_instance().config
+    mode = mode or config.INGEST_SYNC_MODE
+    page_size = page_size or config.INGEST_PAGE_SIZE
+    fetch_concurrency = fetch_concurrency or config.INGEST_FETCH_CONCURRENCY
+    writer_concurrency = writer_concurrency or config.INGEST_WRITER_CONCURRENCY
+    queue_size = queue_size or config.INGEST_QUEUE_SIZE
+
     logger.info("Starting database update")
 
-    page_size = 100
-    logger.info("Page size: %s", page_size)
+    checkpoint = await get_sync_checkpoint()
+    logger.info("Sync checkpoint: %s", checkpoint)
+
+    # Resume an interrupted run (a delta request also completes an interrupted full run first),
+    # pages only line up with the same page size
+    resume = (
+        checkpoint.status == "running"
+        and mode in (checkpoint.mode, "delta")
+        and checkpoint.page_size == page_size
+    )
+    if resume:
+        mode, since = checkpoint.mode, checkpoint.run_since
+    elif mode == "delta" and checkpoint.watermark is not None:
+        since = checkpoint.watermark
+    else:
+        mode, since = "full", None
 
-    total_artworks = await get_total_artworks()
+    logger.info(
+        "Mode: %s, since: %s, page size: %s, fetchers: %s, writers: %s, queue size: %s",
+        mode, since, page_size, fetch_concurrency, writer_concurrency, queue_size,
+    )
+
+    total_artworks = await get_total_artworks(since)
     logger.info("Total artworks: %s", total_artworks)
 
     if total_artworks <= 0:
         logger.warning("No artworks found to update.")
-        return False
+        return None
+
+    if since is not None and total_artworks > AIC_SEARCH_WINDOW:
+        logger.warning("%s changed artworks exceed the search window, running a full sync", total_artworks)
+        resume, mode, since = False, "full", None
+        total_artworks = await get_total_artworks()
 
     total_pages = math.ceil(total_artworks / page_size)  # Ensure correct page calculation
-    logger.info("Total pages: %s", total_pages)
 
-    for page in range(1, total_pages + 1):  # Loop through all pages
-        logger.info("Processing page: %s", page)
+    if resume:
+        start_page = checkpoint.last_completed_page + 1
+    else:
+        start_page = 1
+        checkpoint.mode = mode
+        checkpoint.status = "running"
+        checkpoint.page_size = page_size
+        checkpoint.last_completed_page = 0
+        checkpoint.run_since = since
+        checkpoint.run_watermark = None
+    checkpoint.total_pages = total_pages
+    await checkpoint.save()
 
-        query_params = {
-            "page": page,
-            "limit": page_size,
-        }
+    logger.info("Total pages: %s, starting at page %s", total_pages, start_page)
 
-        response = await handle_get_request(get_app_instance().config.ARTWORKS_API, query_params)
+    summary = {
+        "mode": mode,
+        "start_page": start_page,
+        "total_pages": total_pages,
+        "pages": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 0,
+        "failed_pages": [],
+    }
 
-        try:
-            data = response.get("data", {}).get("data", [])
-            await save_artworks_page(data)
-        except KeyError as exception:
-            logger.error("Data processing error on page %s: %s", page, exception)
-            continue
-        except Exception as exception:
-            logger.error("Unexpected error on page %s: %s", page, exception)
-            continue
+    pending_pages = asyncio.Queue()
+    for page in range(start_page, total_pages + 1):
+        pending_pages.put_nowait(page)
+
+    # Bounded hand-off between fetchers and writers, provides the backpressure
+    fetched_pages = asyncio.Queue(maxsize=queue_size)
+
+    # Pages saved ahead of the checkpoint, which only advances over contiguous pages
+    saved_pages = set()
+    checkpoint_lock = asyncio.Lock()
+
+    async def save_checkpoint(page, data):
+        async with checkpoint_lock:
+            saved_pages.add(page)
+            while checkpoint.last_completed_page + 1 in saved_pages:
+                checkpoint.last_completed_page += 1
+                saved_pages.remove(checkpoint.last_completed_page)
+            checkpoint.run_watermark = get_latest_timestamp(
+                [checkpoint.run_watermark, *(item.get("updated_at") for item in data)]
+            )
+            await checkpoint.save(update_fields=["last_completed_page", "run_watermark", "updated_at"])
+
+    async def fetch_pages():
+        while True:
+            try:
+                page = pending_pages.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            logger.info("Fetching page: %s/%s", page, total_pages)
+            data = await fetch_artworks_page(page, page_size, since)
+            if data is None:
+                summary["failed_pages"].append(page)
+                continue
+            await fetched_pages.put((page, data))
+
+    async def write_pages():
+        while True:
+            item = await fetched_pages.get()
+            try:
+                if item is None:
+                    return
+
+                page, data = item
+                try:
+                    page_stats = await save_artworks_page(data, batch_size)
+                    await save_checkpoint(page, data)
+                except Exception as exception:
+                    # The database is failing, not the page: stop the run, the checkpoint resumes it
+                    logger.error("Saving page %s failed, stopping the update: %s", page, exception)
+                    raise
+
+                summary["pages"] += 1
+                for key, value in page_stats.items():
+                    summary[key] += value
+
+                pages_done = summary["pages"] + len(summary["failed_pages"])
+                pages_total = total_pages - start_page + 1
+                elapsed = time.monotonic() - started_at
+                logger.info(
+                    "Progress: %s/%s pages (%.1f%%), %.1f artworks/s",
+                    pages_done, pages_total, 100 * pages_done / pages_total,
+                    sum(summary[key] for key in ("inserted", "updated", "unchanged")) / max(elapsed, 1e-6),
+                )
+            finally:
+                fetched_pages.task_done()
+
+    async def feed_writers():
+        await asyncio.gather(*fetchers)
+        # One stop marker per writer, queued behind the remaining pages
+        for _ in writers:
+            await fetched_pages.put(None)
+
+    started_at = time.monotonic()
+    fetchers = [asyncio.create_task(fetch_pages()) for _ in range(fetch_concurrency)]
+    writers = [asyncio.create_task(write_pages()) for _ in range(writer_concurrency)]
+    feeder = asyncio.create_task(feed_writers())
+
+    try:
+        # A failed writer stops the run, instead of leaving the fetchers blocked on the full queue
+        done, _ = await asyncio.wait([feeder, *writers], return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+    finally:
+        for task in (feeder, *fetchers, *writers):
+            task.cancel()
+
+    summary["failed_pages"].sort()
+    summary["duration"] = round(time.monotonic() - started_at, 3)
+
+    if not summary["failed_pages"]:
+        # Promote the run's newest modification time to the next delta run's watermark
+        checkpoint.status = "completed"
+        checkpoint.watermark = get_latest_timestamp([checkpoint.watermark, checkpoint.run_watermark])
+        await checkpoint.save()
+    else:
+        logger.warning("Sync checkpoint kept at page %s, the next run resumes from there", checkpoint.last_completed_page)
 
-    logger.info("Database update completed")
-    return True
+    logger.info(
+        "Database update completed in %.1fs: %s pages, %s inserted, %s updated, %s unchanged, %s skipped, "
+        "failed pages: %s",
+        summary["duration"], summary["pages"], summary["inserted"], summary["updated"], summary["unchanged"],
+        summary["skipped"], summary["failed_pages"],
+    )
+    return summary
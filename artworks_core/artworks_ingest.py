@@ -0,0 +1,115 @@
+"""
+Standalone artworks ingest worker.
+
+Runs the artworks update in its own process, so parsing upstream pages and writing them to the
+database never competes with live requests on the web server's event loop. The update takes
+the same advisory lock as the server's scheduler, so both can be deployed side by side.
+
+Usage:
+    python -m artworks_core.artworks_ingest [--mode full|delta] [--page-size N] [--batch-size N]
+                                            [--concurrency N] [--writers N] [--queue-size N]
+                                            [--schedule]
+
+Exit codes:
+    - 0: The update completed without failed pages (or the scheduler was stopped).
+    - 1: The update failed, timed out, left failed pages or was skipped because another worker
+      holds the lock.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from tortoise import Tortoise
+
+from artworks_core.artworks_data_scheduler import run_scheduled_update, schedule_artworks_updates, update_status
+from artworks_settings import initialize_app_env
+from artworks_utils import close_http_client, init_database, init_http_client, logger
+
+def parse_args(argv=None):
+    """
+    Parses the command line arguments of the ingest worker.
+
+    Args:
+        argv (list, optional): Arguments to parse (default: `sys.argv[1:]`).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m artworks_core.artworks_ingest",
+        description="Fetches artworks from the Art Institute of Chicago API into the local database.",
+    )
+    parser.add_argument("--mode", choices=("full", "delta"), help="Sync mode (default: INGEST_SYNC_MODE).")
+    parser.add_argument("--page-size", type=int, help="Artworks per upstream page (default: INGEST_PAGE_SIZE).")
+    parser.add_argument("--batch-size", type=int, help="Artworks per upsert statement (default: INGEST_BATCH_SIZE).")
+    parser.add_argument(
+        "--concurrency", type=int, help="Concurrent upstream page fetchers (default: INGEST_FETCH_CONCURRENCY)."
+    )
+    parser.add_argument("--writers", type=int, help="Concurrent database writers (default: INGEST_WRITER_CONCURRENCY).")
+    parser.add_argument("--queue-size", type=int, help="Fetched pages buffered in memory (default: INGEST_QUEUE_SIZE).")
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="Keep running and update on the UPDATE_INTERVAL_SECONDS schedule instead of once.",
+    )
+    return parser.parse_args(argv)
+
+async def run_ingest(args):
+    """
+    Runs the artworks update once, or on schedule, with the given command line options.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    update_options = {
+        "mode": args.mode,
+        "page_size": args.page_size,
+        "batch_size": args.batch_size,
+        "fetch_concurrency": args.concurrency,
+        "writer_concurrency": args.writers,
+        "queue_size": args.queue_size,
+    }
+
+    await init_database()
+    await init_http_client()
+    try:
+        if args.schedule:
+            await schedule_artworks_updates(**update_options)
+            return 0
+
+        summary = await run_scheduled_update(**update_options)
+        print(json.dumps({"result": update_status["last_result"], "summary": summary}, indent=2))
+
+        if summary is None:
+            return 0 if update_status["last_result"] == "empty" else 1
+        return 1 if summary["failed_pages"] else 0
+    finally:
+        await close_http_client()
+        await Tortoise.close_connections()
+
+def main(argv=None):
+    """
+    Entry point of the ingest worker.
+
+    Args:
+        argv (list, optional): Command line arguments (default: `sys.argv[1:]`).
+
+    Returns:
+        int: The process exit code.
+    """
+    args = parse_args(argv)
+    initialize_app_env()
+    logger.info("Starting ArtBloom ingest worker %s", "🚚")
+
+    try:
+        return asyncio.run(run_ingest(args))
+    except KeyboardInterrupt:
+        logger.info("Ingest worker interrupted.")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,520 @@
+import asyncio
+import itertools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy
+import pandas
+
+from artworks_core.models import Artwork
+from artworks_settings import get_app_instance
+from artworks_utils import logger, BoundedExecutor
+
+# Columns read from the database to build the index (descriptions are never loaded)
+RECOMMENDATION_INDEX_FIELDS = (
+    "id",
+    "title",
+    "artist_title",
+    "style_title",
+    "medium_display",
+    "thumbnail",
+    "classification_title",
+    "date_start",
+    "date_end",
+    "category_titles",
+    "term_titles",
+    "material_titles",
+)
+
+# Fields of the recommended artworks returned by the API
+RECOMMENDATION_FIELDS = ("id", "title", "artist_title", "style_title", "medium_display", "thumbnail")
+
+# Content features of the "more like this" similarity: list fields and single value fields
+SIMILARITY_LIST_FIELDS = ("term_titles", "material_titles", "category_titles")
+SIMILARITY_VALUE_FIELDS = ("style_title", "medium_display")
+
+# Version of each built index, used to key the results computed from it
+index_versions = itertools.count(1)
+
+# Default scoring weights of the style, medium and category matches
+RECOMMENDATION_WEIGHTS = {"style_title": 3.0, "medium_display": 2.0, "category_titles": 1.0}
+
+
+class RecommendationIndex:
+    """
+    Compact in-memory feature matrix of the catalog, scored with vectorized NumPy operations.
+
+    Features:
+        - style_title, medium_display, classification_title: Integer codes (-1 when missing),
+          so a preference match is a single array comparison.
+        - category_titles: Multi-hot category bitmap, packed 8 categories per byte, so "any
+          preferred category" is a bitwise AND over the rows.
+        - avg_date: Mean of date_start and date_end (NaN when both are missing).
+        - Content features (similarity): A sparse TF-IDF matrix with one column per term,
+          material, category, style and medium value, stored both by artwork (CSR: offsets,
+          feature columns, weights) and by feature (postings: offsets, artwork rows, weights).
+    """
+
+    def __init__(self, artworks):
+        """
+        Args:
+            artworks (list): Artwork dictionaries with the `RECOMMENDATION_INDEX_FIELDS`.
+        """
+        self.version = next(index_versions)
+        self.size = len(artworks)
+        self.ids = numpy.fromiter((artwork["id"] for artwork in artworks), dtype=numpy.int64, count=self.size)
+        self.records = [{field: artwork[field] for field in RECOMMENDATION_FIELDS} for artwork in artworks]
+
+        self.codes = {}
+        self.vocabularies = {}
+        for field in ("style_title", "medium_display", "classification_title"):
+            codes, uniques = pandas.factorize(pandas.Series([artwork[field] for artwork in artworks], dtype=object))
+            self.codes[field] = codes.astype(numpy.int32)
+            self.vocabularies[field] = {value: code for code, value in enumerate(uniques)}
+
+        self.category_vocabulary = {}
+        rows, columns = [], []
+        for row, artwork in enumerate(artworks):
+            for category in artwork["category_titles"] or []:
+                rows.append(row)
+                columns.append(self.category_vocabulary.setdefault(category, len(self.category_vocabulary)))
+        categories = numpy.zeros((self.size, max(len(self.category_vocabulary), 1)), dtype=bool)
+        categories[rows, columns] = True
+        self.category_bitmap = numpy.packbits(categories, axis=1)
+
+        dates = numpy.array(
+            [[artwork["date_start"], artwork["date_end"]] for artwork in artworks], dtype=numpy.float64
+        ).reshape(self.size, 2)
+        known_dates = ~numpy.isnan(dates)
+        date_counts = known_dates.sum(axis=1)
+        self.avg_date = numpy.full(self.size, numpy.nan)
+        numpy.divide(numpy.where(known_dates, dates, 0).sum(axis=1), date_counts, out=self.avg_date, where=date_counts > 0)
+
+        self.feature_vocabulary = {}
+        feature_rows, feature_columns = [], []
+        for row, artwork in enumerate(artworks):
+            features = {(field, value) for field in SIMILARITY_LIST_FIELDS for value in artwork[field] or []}
+            features.update((field, artwork[field]) for field in SIMILARITY_VALUE_FIELDS if artwork[field])
+            for feature in features:
+                feature_rows.append(row)
+                feature_columns.append(self.feature_vocabulary.setdefault(feature, len(self.feature_vocabulary)))
+        rows = numpy.array(feature_rows, dtype=numpy.int64)
+        columns = numpy.array(feature_columns, dtype=numpy.int64)
+
+        # Rare features weigh more: smoothed inverse document frequency
+        document_frequencies = numpy.bincount(columns, minlength=len(self.feature_vocabulary))
+        weights = (numpy.log((1 + self.size) / (1 + document_frequencies)) + 1)[columns]
+        self.feature_norms = numpy.sqrt(numpy.bincount(rows, weights=weights ** 2, minlength=self.size))
+
+        # Rows were appended in order, so the features are already grouped by artwork
+        self.row_offsets = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(rows, minlength=self.size))))
+        self.row_features = columns
+        self.row_weights = weights
+
+        posting_order = numpy.argsort(columns, kind="stable")
+        self.posting_offsets = numpy.concatenate(([0], numpy.cumsum(document_frequencies)))
+        self.posting_rows = rows[posting_order]
+        self.posting_weights = weights[posting_order]
+
+    def match(self, field, value):
+        """
+        Returns the rows whose categorical feature equals a value.
+
+        Args:
+            field (str): "style_title", "medium_display" or "classification_title".
+            value (str): The preferred value.
+
+        Returns:
+            numpy.ndarray: Boolean mask over the catalog.
+        """
+        code = self.vocabularies[field].get(value)
+        if code is None:
+            return numpy.zeros(self.size, dtype=bool)
+        return self.codes[field] == code
+
+    def match_categories(self, category_titles):
+        """
+        Returns the rows having at least one of the given categories.
+
+        Args:
+            category_titles (list): The preferred categories.
+
+        Returns:
+            numpy.ndarray: Boolean mask over the catalog.
+        """
+        columns = [self.category_vocabulary[title] for title in category_titles if title in self.category_vocabulary]
+        if not columns:
+            return numpy.zeros(self.size, dtype=bool)
+
+        query = numpy.zeros(self.category_bitmap.shape[1] * 8, dtype=bool)
+        query[columns] = True
+        return numpy.bitwise_and(self.category_bitmap, numpy.packbits(query)).any(axis=1)
+
+    def recommend(self, preferences, k=5, weights=None, date_tiebreak=True):
+        """
+        Ranks the artworks matching any preference by score, then by temporal similarity.
+
+        The score is the weighted sum of the style, medium and category matches. The temporal
+        similarity is the distance of an artwork's avg_date to the mean avg_date of all matching
+        artworks (artworks without dates come last). Remaining ties are broken by id.
+
+        Args:
+            preferences (dict): Preferred "style_title", "medium_display" and "category_titles",
+                and optional "date_start" / "date_end" years bounding the artworks' avg_date.
+            k (int): Number of recommendations.
+            weights (dict, optional): Weights of the matches, defaults to `RECOMMENDATION_WEIGHTS`.
+            date_tiebreak (bool): Whether equal scores are ranked by temporal similarity
+                before the id.
+
+        Returns:
+            list: The top-k artworks, as dictionaries with the `RECOMMENDATION_FIELDS`.
+        """
+        weights = weights or RECOMMENDATION_WEIGHTS
+        style_match = self.match("style_title", preferences.get("style_title"))
+        medium_match = self.match("medium_display", preferences.get("medium_display"))
+        category_match = self.match_categories(preferences.get("category_titles") or [])
+
+        matches = style_match | medium_match | category_match
+        # NaN comparisons are False, so a date range excludes undated artworks
+        if preferences.get("date_start") is not None:
+            matches &= self.avg_date >= preferences["date_start"]
+        if preferences.get("date_end") is not None:
+            matches &= self.avg_date <= preferences["date_end"]
+
+        candidates = numpy.flatnonzero(matches)
+        if candidates.size == 0 or k <= 0:
+            return []
+
+        scores = (
+            style_match[candidates] * weights["style_title"]
+            + medium_match[candidates] * weights["medium_display"]
+            + category_match[candidates] * weights["category_titles"]
+        )
+
+        dates = self.avg_date[candidates]
+        known_dates = ~numpy.isnan(dates)
+        date_distances = numpy.full(candidates.size, numpy.inf)  # Undated artworks come last
+        if not date_tiebreak:
+            date_distances[:] = 0
+        elif known_dates.any():
+            date_distances[known_dates] = numpy.abs(dates[known_dates] - dates[known_dates].mean())
+
+        pool = numpy.arange(candidates.size)
+        if candidates.size > k:
+            # Keep the rows scoring above the k-th score, plus the closest dates among its ties
+            kth_score = -numpy.partition(-scores, k - 1)[k - 1]
+            ties = numpy.flatnonzero(scores == kth_score)
+            needed = k - numpy.count_nonzero(scores > kth_score)
+            if ties.size > needed:
+                kth_distance = numpy.partition(date_distances[ties], needed - 1)[needed - 1]
+                ties = ties[date_distances[ties] <= kth_distance]
+            pool = numpy.concatenate((numpy.flatnonzero(scores > kth_score), ties))
+
+        ranked = pool[numpy.lexsort((self.ids[candidates[pool]], date_distances[pool], -scores[pool]))][:k]
+        return [self.records[row] for row in candidates[ranked]]
+
+    def similar(self, artwork_id, k=10, date_weight=0.0, date_scale=50.0):
+        """
+        Finds the artworks most similar to an artwork by content ("more like this").
+
+        The cosine similarity of the TF-IDF content features is computed against the whole
+        catalog with a sparse dot product: the postings of the artwork's features are gathered
+        and summed per artwork with `numpy.bincount`, so the cost depends on the postings of
+        its features, not on the catalog size. Date proximity can be blended in.
+
+        Args:
+            artwork_id (int): The artwork id.
+            k (int): Number of similar artworks.
+            date_weight (float): Share of the date proximity in the score, between 0 and 1.
+            date_scale (float): Years over which the date proximity decays by a factor e.
+
+        Returns:
+            list: The top-k similar artworks, with the `RECOMMENDATION_FIELDS` and their
+                "similarity" score, or None if the artwork is not in the index.
+        """
+        row = numpy.searchsorted(self.ids, artwork_id)
+        if row >= self.size or self.ids[row] != artwork_id:
+            return None
+
+        features = self.row_features[self.row_offsets[row]:self.row_offsets[row + 1]]
+        if features.size == 0 or k <= 0:
+            return []
+
+        # Gather the postings of every feature of the artwork in one index array
+        starts = self.posting_offsets[features]
+        counts = self.posting_offsets[features + 1] - starts
+        postings = numpy.arange(counts.sum()) + numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts)
+        query_weights = numpy.repeat(self.row_weights[self.row_offsets[row]:self.row_offsets[row + 1]], counts)
+        dot_products = numpy.bincount(
+            self.posting_rows[postings], weights=self.posting_weights[postings] * query_weights, minlength=self.size
+        )
+
+        candidates = numpy.flatnonzero(dot_products)
+        candidates = candidates[candidates != row]
+        if candidates.size == 0:
+            return []
+
+        scores = dot_products[candidates] / (self.feature_norms[row] * self.feature_norms[candidates])
+        if date_weight > 0:
+            # Undated artworks get no proximity
+            proximity = numpy.nan_to_num(numpy.exp(-numpy.abs(self.avg_date[candidates] - self.avg_date[row]) / date_scale))
+            scores = (1 - date_weight) * scores + date_weight * proximity
+
+        if candidates.size > k:
+            best = numpy.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[best], scores[best]
+
+        ranked = numpy.lexsort((self.ids[candidates], -scores))
+        return [
+            {**self.records[candidate], "similarity": round(float(score), 4)}
+            for candidate, score in zip(candidates[ranked], scores[ranked])
+        ]
+
+
+# Shared index, built by `refresh_recommendation_index`
+recommendation_index = None
+
+# Executor running the index builds and queries, see `get_recommendation_executor`
+recommendation_executor = None
+
+# Index of a recommendation worker process, preloaded by `init_worker_index`
+worker_index = None
+
+# First build of the index, shared by the requests arriving before it is ready
+initial_build_task = None
+
+# Background refresh state, see `schedule_recommendation_index_refresh`
+refresh_task = None
+refresh_pending = False
+
+# Time of the last artworks change, rebuilds wait for a quiet period after it
+last_change_at = 0.0
+
+# Functions called with each newly built index (e.g. to pre-warm the results caches)
+index_refresh_handlers = []
+
+def register_index_refresh_handler(handler):
+    """
+    Registers a function called whenever a new recommendation index replaces the shared one.
+
+    Args:
+        handler (callable): Function taking the new `RecommendationIndex`.
+    """
+    if handler not in index_refresh_handlers:
+        index_refresh_handlers.append(handler)
+
+def init_worker_index(artworks):
+    """
+    Builds the index of a recommendation worker process (process pool initializer).
+
+    Args:
+        artworks (list): Artwork dictionaries with the `RECOMMENDATION_INDEX_FIELDS`.
+    """
+    global worker_index
+    worker_index = RecommendationIndex(artworks)
+
+def query_index(index, method, *args):
+    """
+    Calls a query method of an index (thread pool or inline task).
+
+    Args:
+        index (RecommendationIndex): The index, None for the worker process index.
+        method (str): "recommend" or "similar".
+        *args: The method's arguments.
+
+    Returns:
+        The method's result.
+    """
+    return getattr(index or worker_index, method)(*args)
+
+def create_recommendation_executor(artworks=None):
+    """
+    Creates the executor of the recommendation queries from the settings.
+
+    Settings:
+        - RECOMMENDATION_EXECUTOR: "thread" (thread pool), "process" (process pool with a warm
+          index per worker) or "inline" (on the event loop).
+        - RECOMMENDATION_WORKERS: Number of threads or processes.
+        - RECOMMENDATION_MAX_PENDING: Maximum number of queued or running queries.
+        - RECOMMENDATION_TIMEOUT_SECONDS: Seconds a request waits for its query.
+
+    Args:
+        artworks (list, optional): Catalog preloaded in every worker process (process executor).
+
+    Returns:
+        BoundedExecutor: The executor.
+    """
+    config = get_app_instance().config
+    if config.RECOMMENDATION_EXECUTOR == "process":
+        executor = ProcessPoolExecutor(
+            max_workers=config.RECOMMENDATION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker_index,
+            initargs=(artworks or [],),
+        )
+    elif config.RECOMMENDATION_EXECUTOR == "thread":
+        executor = ThreadPoolExecutor(max_workers=config.RECOMMENDATION_WORKERS, thread_name_prefix="recommendations")
+    else:
+        executor = None
+
+    return BoundedExecutor(
+        executor, max_pending=config.RECOMMENDATION_MAX_PENDING, timeout=config.RECOMMENDATION_TIMEOUT_SECONDS
+    )
+
+def get_recommendation_executor():
+    """
+    Returns the shared executor of the recommendation queries.
+
+    Returns:
+        BoundedExecutor: The executor.
+    """
+    global recommendation_executor
+    if recommendation_executor is None:
+        recommendation_executor = create_recommendation_executor()
+    return recommendation_executor
+
+def close_recommendation_executor():
+    """
+    Shuts the recommendation executor down (server shutdown).
+    """
+    global recommendation_executor
+    if recommendation_executor is not None:
+        recommendation_executor.shutdown()
+        recommendation_executor = None
+
+async def run_index_query(method, *args):
+    """
+    Runs a query on the shared index through the recommendation executor.
+
+    With a process executor, the query runs on the warm index of a worker process, otherwise
+    on the shared index in a pool thread (NumPy releases the GIL on the array operations).
+
+    Args:
+        method (str): "recommend" or "similar".
+        *args: The method's arguments.
+
+    Returns:
+        tuple: The index version and the method's result.
+
+    Raises:
+        ExecutorOverloadedError: If too many queries are pending.
+        asyncio.TimeoutError: If the query does not finish within the timeout.
+    """
+    index = await get_recommendation_index()
+    executor = get_recommendation_executor()
+    if isinstance(executor.executor, ProcessPoolExecutor):
+        return index.version, await executor.run(query_index, None, method, *args)
+    return index.version, await executor.run(query_index, index, method, *args)
+
+async def load_recommendation_index(artworks=None):
+    """
+    Builds a recommendation index from the artworks in the database.
+
+    The build runs in a thread, so it does not block the event loop.
+
+    Args:
+        artworks (list, optional): Artwork dictionaries with the `RECOMMENDATION_INDEX_FIELDS`
+            (e.g. read from a snapshot), used instead of the database.
+
+    Returns:
+        tuple: The new index and the artworks it was built from.
+    """
+    if artworks is None:
+        artworks = await Artwork.all().order_by("id").values(*RECOMMENDATION_INDEX_FIELDS)
+    else:
+        artworks = sorted(artworks, key=lambda artwork: artwork["id"])
+    index = await asyncio.get_running_loop().run_in_executor(None, RecommendationIndex, artworks)
+    return index, artworks
+
+async def refresh_recommendation_index(artworks=None):
+    """
+    Rebuilds the shared recommendation index, replacing the previous one once built.
+
+    With a process executor, a new pool preloaded with the new catalog replaces the previous
+    one, which finishes its running queries in the background.
+
+    Args:
+        artworks (list, optional): Artworks to build the index from instead of the database
+            (see `load_recommendation_index`).
+
+    Returns:
+        RecommendationIndex: The new index.
+    """
+    global recommendation_index, recommendation_executor
+    started_at = time.monotonic()
+    index, artworks = await load_recommendation_index(artworks)
+
+    if get_app_instance().config.RECOMMENDATION_EXECUTOR == "process":
+        previous_executor = recommendation_executor
+        recommendation_executor = create_recommendation_executor(artworks)
+        if previous_executor is not None:
+            previous_executor.executor.shutdown(wait=False)
+
+    recommendation_index = index
+    logger.info(
+        "Recommendation index built: %s artworks, %s categories in %.2fs",
+        recommendation_index.size, len(recommendation_index.category_vocabulary), time.monotonic() - started_at,
+    )
+
+    for handler in index_refresh_handlers:
+        try:
+            handler(recommendation_index)
+        except Exception as exception:
+            logger.error("Recommendation index refresh handler %s failed: %s", handler, exception)
+    return recommendation_index
+
+async def get_recommendation_index():
+    """
+    Returns the shared recommendation index, building it on first use.
+
+    Requests arriving while the first build runs wait for it instead of starting their own, and
+    a cancelled request does not cancel it. A failed build is retried by the next request.
+
+    Returns:
+        RecommendationIndex: The index.
+    """
+    global initial_build_task
+    if recommendation_index is not None:
+        return recommendation_index
+    if initial_build_task is None or initial_build_task.done():
+        initial_build_task = asyncio.ensure_future(refresh_recommendation_index())
+    return await asyncio.shield(initial_build_task)
+
+def get_recommendation_index_version():
+    """
+    Returns the version of the shared recommendation index.
+
+    Returns:
+        int: The version, or None if the index is not built yet.
+    """
+    return recommendation_index.version if recommendation_index is not None else None
+
+def schedule_recommendation_index_refresh(_artwork_ids=None):
+    """
+    Rebuilds the recommendation index in the background (artworks change handler).
+
+    Ingest publishes a change after every batch, so the rebuild waits until no change arrived
+    for `RECOMMENDATION_INDEX_REFRESH_DELAY_SECONDS`, i.e. until the ingest run is done. Changes
+    arriving during a rebuild trigger a single extra rebuild, after another quiet period.
+    """
+    global refresh_task, refresh_pending, last_change_at
+    refresh_pending = True
+    last_change_at = time.monotonic()
+    if refresh_task is None or refresh_task.done():
+        refresh_task = asyncio.ensure_future(run_recommendation_index_refreshes())
+
+async def run_recommendation_index_refreshes():
+    """
+    Rebuilds the recommendation index until no change is pending, each time after a quiet period.
+    """
+    global refresh_pending
+    quiet_period = get_app_instance().config.RECOMMENDATION_INDEX_REFRESH_DELAY_SECONDS
+    while refresh_pending:
+        while (remaining := last_change_at + quiet_period - time.monotonic()) > 0:
+            await asyncio.sleep(remaining)
+        refresh_pending = False
+        try:
+            await refresh_recommendation_index()
+        except Exception as exception:
+            logger.error("Recommendation index refresh failed: %s", exception)
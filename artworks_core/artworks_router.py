@@ -1,6 +1,19 @@
-from sanic import Blueprint, json
-
-from .artworks_data_reader import get_artworks_by_params, get_artwork_by_id, search_artworks, get_artworks_recommendations
+from sanic import Blueprint
+
+from artworks_settings import get_app_instance
+from artworks_utils import get_cache_headers, is_not_modified, json_response, logger, not_modified_response
+from .artworks_data_reader import (
+    get_artworks_by_params,
+    get_artworks_list_validators,
+    get_artwork_by_id,
+    get_artworks_by_ids,
+    get_artworks_export,
+    search_artworks,
+    get_artworks_recommendations,
+    get_cache_stats,
+    get_similar_artworks,
+)
+from .artworks_data_scheduler import get_update_status
 
 # Create a Blueprint for the routes
 artworks_router = Blueprint("artworks_router")
@@ -16,38 +29,117 @@ async def handle_fallback(request):
     Returns:
         sanic.response: JSON response indicating that the path does not exist.
     """
-    return json({"message": "This path does not exist."}, status=404)
+    return json_response({"message": "This path does not exist."}, status=404)
 
 @artworks_router.get("/artworks")
 async def get_artworks(request):
     """
     Handles requests to /artworks and returns artwork data based on query parameters.
 
+    The list carries an entity tag of the catalog version and query parameters. A request whose
+    `If-None-Match` (or `If-Modified-Since`) still matches gets a 304, without reading artworks.
+
     Args:
         request (sanic.Request): The HTTP request object containing query parameters.
 
     Returns:
-        sanic.response: JSON response with artwork data or an error message.
+        sanic.response: JSON response with artwork data or an error message, or 304 Not Modified.
     """
+    etag, last_modified = await get_artworks_list_validators(request.args)
+    headers = get_cache_headers(etag, last_modified, get_app_instance().config.ARTWORKS_CACHE_MAX_AGE_SECONDS)
+    if is_not_modified(request.headers, etag, last_modified):
+        return not_modified_response(headers)
+
     result = await get_artworks_by_params(request.args)
-    return json(result)
+    if result["status"] != 200:
+        return json_response(result)
+    return json_response(result, headers=headers)
+
+@artworks_router.get("/artworks/export")
+async def export_artworks_route(request):
+    """
+    Handles requests to /artworks/export and streams every matching artwork.
+
+    Args:
+        request (sanic.Request): The HTTP request object, `format` is "ndjson" (default) or "csv",
+            with the filters and `fields` of the /artworks list.
+
+    Returns:
+        sanic.response: Streamed NDJSON or CSV attachment, or a JSON error message.
+    """
+    result = get_artworks_export(request.args)
+    if result["status"] != 200:
+        return json_response(result)
+
+    response = await request.respond(
+        content_type=result["content_type"],
+        headers={"Content-Disposition": f'attachment; filename="{result["filename"]}"'},
+    )
+    try:
+        async for chunk in result["chunks"]:
+            await response.send(chunk)
+    except Exception as exception:
+        # Headers are already sent: abort the transfer so the client sees a truncated download
+        logger.error("export_artworks exception: %s", exception)
+        raise
+    await response.eof()
 
 @artworks_router.get("/artworks/<artwork_id>")
 async def get_artwork_by_id_route(request, artwork_id):
     """
     Handles requests to /artworks/<artwork_id> and returns a single artwork's data.
 
+    The artwork carries an entity tag of its content fingerprint and selected fields. A request
+    whose `If-None-Match` (or `If-Modified-Since`) still matches gets a 304, without a body.
+
     Args:
-        request (sanic.Request): The HTTP request object.
+        request (sanic.Request): The HTTP request object, `fields` selects a sparse fieldset.
         artwork_id (str): The ID of the artwork to retrieve.
 
     Returns:
-        sanic.response: JSON response with the artwork data or an error message.
+        sanic.response: JSON response with the artwork data or an error message, or 304 Not Modified.
+    """
+    result = await get_artwork_by_id(artwork_id, request.args)
+    if not result:
+        return json_response({"error": "Artwork not found"}, status=404)
+    if result["status"] != 200:
+        return json_response(result)
+
+    etag, last_modified = result.pop("etag"), result.pop("last_modified")
+    headers = get_cache_headers(etag, last_modified, get_app_instance().config.ARTWORKS_CACHE_MAX_AGE_SECONDS)
+    if is_not_modified(request.headers, etag, last_modified):
+        return not_modified_response(headers)
+    return json_response(result, headers=headers)
+
+@artworks_router.get("/artworks/<artwork_id>/similar")
+async def get_similar_artworks_route(request, artwork_id):
+    """
+    Handles requests to /artworks/<artwork_id>/similar and returns the most similar artworks.
+
+    Args:
+        request (sanic.Request): The HTTP request object, `k` is the number of similar artworks.
+        artwork_id (str): The ID of the artwork.
+
+    Returns:
+        sanic.response: JSON response with the similar artworks, most similar first.
     """
-    result = await get_artwork_by_id(artwork_id)
-    if result:
-        return json(result)
-    return json({"error": "Artwork not found"}, status=404)
+    result = await get_similar_artworks(artwork_id, request.args)
+    return json_response(result)
+
+@artworks_router.get("/artworks/batch")
+async def get_artworks_by_ids_route(request):
+    """
+    Handles requests to /artworks/batch and returns several artworks in one response.
+
+    Args:
+        request (sanic.Request): The HTTP request object, `ids` lists the artwork ids
+            (e.g. ?ids=12,7,42) and `fields` selects a sparse fieldset.
+
+    Returns:
+        sanic.response: JSON response with the artworks in request order, with not-found markers.
+    """
+    result = await get_artworks_by_ids(request.args)
+    return json_response(result)
 
 @artworks_router.get("/artworks/search")
 async def search_artworks_route(request):
@@ -61,18 +153,57 @@ async def search_artworks_route(request):
         sanic.response: JSON response with matching artwork data or an error message.
     """
     result = await search_artworks(request.args)
-    return json(result)
+    return json_response(result)
 
-@artworks_router.get("/artworks/recommendations")
+@artworks_router.route("/artworks/recommendations", methods=["GET", "POST"])
 async def get_artworks_recommendations_route(request):
     """
     Generate artwork recommendations based on user preferences.
 
     Args:
-        request (sanic.Request): The HTTP request object.
+        request (sanic.Request): The HTTP request object, with the preferences (style_title,
+            medium_display, category_titles, date_start, date_end, k) as query parameters or,
+            for POST, as a JSON object body.
 
     Returns:
         sanic.response: JSON response with recommended artworks.
     """
-    result = await get_artworks_recommendations()
-    return json(result)
\ No newline at end of file
+    if request.method == "POST":
+        try:
+            params = request.json or {}
+        except Exception:
+            params = None
+        if not isinstance(params, dict):
+            return json_response({"error": "Invalid JSON body", "recommendations": [], "status": 400})
+    else:
+        params = request.args
+
+    result = await get_artworks_recommendations(params)
+    return json_response(result)
+
+@artworks_router.get("/artworks/sync/status")
+async def get_sync_status_route(request):
+    """
+    Handles requests to /artworks/sync/status and returns the state of the artworks updates.
+
+    Args:
+        request (sanic.Request): The HTTP request object.
+
+    Returns:
+        sanic.response: JSON response with the update statistics and sync checkpoint.
+    """
+    result = await get_update_status()
+    return json_response({"data": result, "status": 200})
+
+@artworks_router.get("/artworks/cache/stats")
+async def get_cache_stats_route(request):
+    """
+    Handles requests to /artworks/cache/stats and returns the in-process cache counters.
+
+    Args:
+        request (sanic.Request): The HTTP request object.
+
+    Returns:
+        sanic.response: JSON response with the hit, miss and eviction counters of each cache.
+    """
+    return json_response({"data": get_cache_stats(), "status": 200})
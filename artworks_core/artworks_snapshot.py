@@ -0,0 +1,461 @@
+"""
+Columnar snapshots of the artworks table.
+
+Dumps the `artwork` table to a Parquet or Arrow IPC (Feather v2) file, and bulk-loads such a
+file back with COPY, so a new environment or a test database is bootstrapped in seconds instead
+of a full crawl of the AIC API. The sync watermark is stored in the snapshot, so the next
+scheduled update after an import is a delta sync. Requires the `pyarrow` package.
+
+Usage:
+    python -m artworks_core.artworks_snapshot export PATH [--format parquet|arrow] [--chunk-size N]
+    python -m artworks_core.artworks_snapshot import PATH [--format parquet|arrow] [--batch-size N]
+                                                         [--truncate]
+
+The format defaults to the file extension: ".parquet" for Parquet, ".arrow", ".feather" or
+".ipc" for Arrow IPC.
+
+Exit codes:
+    - 0: The snapshot was exported or imported.
+    - 1: The export or import failed.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from tortoise import Tortoise, connections
+
+from artworks_core.artworks_data_events import publish_artworks_changed
+from artworks_core.artworks_data_helper import ARTWORK_FIELDS
+from artworks_core.artworks_data_writer import get_sync_checkpoint
+from artworks_core.models import Artwork
+from artworks_settings import get_app_instance, initialize_app_env
+from artworks_utils import init_database, logger
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Optional dependency, only required by the snapshots
+    pyarrow = None
+
+# Columns of a snapshot, every stored artwork column except the generated search vector
+SNAPSHOT_FIELDS = ("id", "aic_id", *ARTWORK_FIELDS, "fingerprint")
+
+# Integer and list of strings columns, the other columns are strings
+SNAPSHOT_INTEGER_FIELDS = ("id", "aic_id", "date_start", "date_end")
+SNAPSHOT_LIST_FIELDS = ("material_titles", "term_titles", "category_titles")
+
+# Snapshot metadata key of the sync watermark
+SNAPSHOT_WATERMARK_KEY = b"artbloom.watermark"
+
+# Snapshot formats by file extension
+SNAPSHOT_EXTENSIONS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow"}
+
+def get_snapshot_format(path, snapshot_format=None):
+    """
+    Resolves the format of a snapshot file.
+
+    Args:
+        path (str): The snapshot path.
+        snapshot_format (str, optional): "parquet" or "arrow", guessed from the extension when missing.
+
+    Returns:
+        str: The snapshot format.
+
+    Raises:
+        ValueError: If the format is not supported or cannot be guessed.
+    """
+    if snapshot_format is None:
+        extension = path[path.rfind("."):].lower() if "." in path else ""
+        snapshot_format = SNAPSHOT_EXTENSIONS.get(extension)
+    if snapshot_format not in ("parquet", "arrow"):
+        raise ValueError(f"Unknown snapshot format of {path}, use a .parquet or .arrow file")
+    if pyarrow is None:
+        raise ValueError("Snapshots require the pyarrow package")
+    return snapshot_format
+
+def get_snapshot_schema(watermark=None):
+    """
+    Builds the Arrow schema of a snapshot.
+
+    Args:
+        watermark (str, optional): The sync watermark stored in the schema metadata.
+
+    Returns:
+        pyarrow.Schema: The schema of the `SNAPSHOT_FIELDS`.
+    """
+    columns = []
+    for field in SNAPSHOT_FIELDS:
+        if field in SNAPSHOT_INTEGER_FIELDS:
+            columns.append(pyarrow.field(field, pyarrow.int64(), nullable=field != "id"))
+        elif field in SNAPSHOT_LIST_FIELDS:
+            columns.append(pyarrow.field(field, pyarrow.list_(pyarrow.string())))
+        else:
+            columns.append(pyarrow.field(field, pyarrow.string()))
+    metadata = {SNAPSHOT_WATERMARK_KEY: watermark.encode("utf-8")} if watermark else None
+    return pyarrow.schema(columns, metadata=metadata)
+
+def open_snapshot_writer(path, snapshot_format, watermark=None):
+    """
+    Opens a snapshot file for writing.
+
+    Args:
+        path (str): The snapshot path.
+        snapshot_format (str): "parquet" or "arrow".
+        watermark (str, optional): The sync watermark stored in the snapshot.
+
+    Returns:
+        tuple: The writer (a context manager with `write_table`) and the snapshot schema.
+    """
+    schema = get_snapshot_schema(watermark)
+    if snapshot_format == "parquet":
+        return pyarrow.parquet.ParquetWriter(path, schema, compression="zstd"), schema
+    return pyarrow.ipc.new_file(path, schema), schema
+
+def write_artworks_snapshot(path, chunks, snapshot_format=None, watermark=None):
+    """
+    Writes artworks to a snapshot file, one chunk at a time (e.g. a test fixture).
+
+    Args:
+        path (str): The snapshot path.
+        chunks (iterable): Lists of artwork dictionaries with the `SNAPSHOT_FIELDS`.
+        snapshot_format (str, optional): "parquet" or "arrow" (see `get_snapshot_format`).
+        watermark (str, optional): The sync watermark stored in the snapshot.
+
+    Returns:
+        int: The number of artworks written.
+    """
+    writer, schema = open_snapshot_writer(path, get_snapshot_format(path, snapshot_format), watermark)
+    count = 0
+    with writer:
+        for chunk in chunks:
+            writer.write_table(pyarrow.Table.from_pylist(chunk, schema=schema))
+            count += len(chunk)
+    return count
+
+def read_snapshot_watermark(path, snapshot_format=None):
+    """
+    Reads the sync watermark stored in a snapshot.
+
+    Args:
+        path (str): The snapshot path.
+        snapshot_format (str, optional): "parquet" or "arrow" (see `get_snapshot_format`).
+
+    Returns:
+        str: The watermark, or None if the snapshot has none.
+    """
+    if get_snapshot_format(path, snapshot_format) == "parquet":
+        metadata = pyarrow.parquet.read_schema(path).metadata
+    else:
+        with pyarrow.memory_map(path) as source:
+            metadata = pyarrow.ipc.open_file(source).schema.metadata
+    watermark = (metadata or {}).get(SNAPSHOT_WATERMARK_KEY)
+    return watermark.decode("utf-8") if watermark else None
+
+def read_artworks_snapshot(path, fields=SNAPSHOT_FIELDS, snapshot_format=None):
+    """
+    Reads the artworks of a snapshot, memory-mapping the file so only the requested columns are
+    loaded (e.g. the `RECOMMENDATION_INDEX_FIELDS` to build the recommendation index).
+
+    Args:
+        path (str): The snapshot path.
+        fields (tuple): The columns to read.
+        snapshot_format (str, optional): "parquet" or "arrow" (see `get_snapshot_format`).
+
+    Returns:
+        list: The artwork dictionaries, in snapshot order.
+    """
+    if get_snapshot_format(path, snapshot_format) == "parquet":
+        return pyarrow.parquet.read_table(path, columns=list(fields), memory_map=True).to_pylist()
+    with pyarrow.memory_map(path) as source:
+        return pyarrow.ipc.open_file(source).read_all().select(list(fields)).to_pylist()
+
+def iter_artworks_snapshot(path, batch_size, snapshot_format=None, fields=SNAPSHOT_FIELDS):
+    """
+    Reads the artworks of a snapshot batch by batch.
+
+    Args:
+        path (str): The snapshot path.
+        batch_size (int): Maximum number of artworks per batch.
+        snapshot_format (str, optional): "parquet" or "arrow" (see `get_snapshot_format`).
+        fields (tuple): The columns to read.
+
+    Yields:
+        list: Artwork dictionaries with the `fields`.
+    """
+    if get_snapshot_format(path, snapshot_format) == "parquet":
+        snapshot = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        for batch in snapshot.iter_batches(batch_size=batch_size, columns=list(fields)):
+            yield batch.to_pylist()
+        return
+
+    with pyarrow.memory_map(path) as source:
+        reader = pyarrow.ipc.open_file(source)
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index).select(list(fields))
+            for start in range(0, batch.num_rows, batch_size):
+                yield batch.slice(start, batch_size).to_pylist()
+
+async def export_artworks_snapshot(path, snapshot_format=None, chunk_size=None):
+    """
+    Dumps the artworks table to a snapshot file.
+
+    Artworks are read in id order, `chunk_size` at a time with keyset range scans, and each chunk
+    is written as a row group (Parquet) or record batch (Arrow), so memory use stays bounded.
+
+    Args:
+        path (str): The snapshot path.
+        snapshot_format (str, optional): "parquet" or "arrow" (see `get_snapshot_format`).
+        chunk_size (int, optional): Artworks per chunk (default: `EXPORT_CHUNK_SIZE`).
+
+    Returns:
+        dict: Summary of the export ("path", "format", "artworks", "watermark", "duration").
+    """
+    snapshot_format = get_snapshot_format(path, snapshot_format)
+    chunk_size = chunk_size or get_app_instance().config.EXPORT_CHUNK_SIZE
+    started_at = time.monotonic()
+
+    checkpoint = await get_sync_checkpoint()
+    watermark = checkpoint.watermark
+
+    count = 0
+    writer, schema = open_snapshot_writer(path, snapshot_format, watermark)
+    with writer:
+        last_id = 0
+        while True:
+            artworks = await Artwork.filter(id__gt=last_id).order_by("id").limit(chunk_size).values(*SNAPSHOT_FIELDS)
+            if artworks:
+                writer.write_table(pyarrow.Table.from_pylist(artworks, schema=schema))
+                count += len(artworks)
+                last_id = artworks[-1]["id"]
+            if len(artworks) < chunk_size:
+                break
+
+    logger.info("Artworks snapshot exported: %s artworks to %s", count, path)
+    return {
+        "path": path,
+        "format": snapshot_format,
+        "artworks": count,
+        "watermark": watermark,
+        "duration": round(time.monotonic() - started_at, 3),
+    }
+
+# Loads a batch into a temporary copy of the table with COPY, then upserts it by id.
+# Imported artworks get a new `updated_at`, so HTTP caches revalidate them
+SNAPSHOT_UPSERT_QUERY = """
+    INSERT INTO "artwork" ({columns})
+    SELECT {columns} FROM "artwork_snapshot"
+    ON CONFLICT ("id") DO UPDATE SET {updates}, "updated_at" = CURRENT_TIMESTAMP
+""".format(
+    columns=", ".join(f'"{field}"' for field in SNAPSHOT_FIELDS),
+    updates=", ".join(f'"{field}" = EXCLUDED."{field}"' for field in SNAPSHOT_FIELDS if field != "id"),
+)
+
+# Moves the id sequence past the imported ids (explicit ids do not advance it)
+RESET_ARTWORK_ID_SEQUENCE_QUERY = """
+    SELECT setval(pg_get_serial_sequence('"artwork"', 'id'), MAX("id")) FROM "artwork"
+"""
+
+async def copy_artworks_batch(artworks):
+    """
+    Writes a batch of snapshot artworks, inserting new ids and overwriting existing ones.
+
+    On PostgreSQL (asyncpg), the batch is streamed with binary COPY into a temporary table and
+    upserted with a single statement. Other databases use a batched `INSERT ... ON CONFLICT`.
+
+    Args:
+        artworks (list): Artwork dictionaries with the `SNAPSHOT_FIELDS`.
+    """
+    connection = connections.get("default")
+    if connection.capabilities.dialect == "postgres":
+        async with connection.acquire_connection() as raw_connection:
+            if hasattr(raw_connection, "copy_records_to_table"):
+                records = [
+                    tuple(
+                        json.dumps(artwork[field]) if field in SNAPSHOT_LIST_FIELDS and artwork[field] is not None
+                        else artwork[field]
+                        for field in SNAPSHOT_FIELDS
+                    )
+                    for artwork in artworks
+                ]
+                async with raw_connection.transaction():
+                    await raw_connection.execute(
+                        'CREATE TEMP TABLE "artwork_snapshot" (LIKE "artwork" INCLUDING DEFAULTS) ON COMMIT DROP'
+                    )
+                    await raw_connection.copy_records_to_table(
+                        "artwork_snapshot", records=records, columns=SNAPSHOT_FIELDS
+                    )
+                    await raw_connection.execute(SNAPSHOT_UPSERT_QUERY)
+                return
+
+    await Artwork.bulk_create(
+        [Artwork(**artwork) for artwork in artworks],
+        on_conflict=["id"],
+        update_fields=[*(field for field in SNAPSHOT_FIELDS if field != "id"), "updated_at"],
+    )
+
+async def find_conflicting_artworks(path, batch_size, snapshot_format=None):
+    """
+    Finds the stored artworks whose upstream id is in the snapshot under another id.
+
+    The import upserts by id, so such artworks (e.g. in a separately crawled environment) would
+    violate the unique `aic_id` index partway through the import.
+
+    Args:
+        path (str): The snapshot path.
+        batch_size (int): Snapshot artworks per lookup.
+        snapshot_format (str, optional): "parquet" or "arrow" (see `get_snapshot_format`).
+
+    Returns:
+        list: The conflicts, as (aic_id, stored id, snapshot id) tuples.
+    """
+    conflicts = []
+    for artworks in iter_artworks_snapshot(path, batch_size, snapshot_format, fields=("id", "aic_id")):
+        snapshot_ids = {artwork["aic_id"]: artwork["id"] for artwork in artworks if artwork["aic_id"] is not None}
+        for artwork_id, aic_id in await Artwork.filter(aic_id__in=list(snapshot_ids)).values_list("id", "aic_id"):
+            if artwork_id != snapshot_ids[aic_id]:
+                conflicts.append((aic_id, artwork_id, snapshot_ids[aic_id]))
+    return conflicts
+
+async def import_artworks_snapshot(path, snapshot_format=None, batch_size=None, truncate=False):
+    """
+    Bulk-loads a snapshot file into the artworks table.
+
+    Artworks keep their snapshot ids, so the ids of an environment and of its snapshot match.
+    The ids of each committed batch are published (see `publish_artworks_changed`), and the sync
+    watermark of the snapshot is restored when the database has none, so the next update is a
+    delta sync.
+
+    Without `truncate`, the import is refused before any write if stored artworks have the
+    upstream id of a snapshot artwork under another id (see `find_conflicting_artworks`).
+
+    Args:
+        path (str): The snapshot path.
+        snapshot_format (str, optional): "parquet" or "arrow" (see `get_snapshot_format`).
+        batch_size (int, optional): Artworks per COPY (default: `EXPORT_CHUNK_SIZE`).
+        truncate (bool): Whether the existing artworks are deleted first.
+
+    Returns:
+        dict: Summary of the import ("path", "format", "artworks", "watermark", "duration").
+
+    Raises:
+        ValueError: If stored artworks conflict with the snapshot ids.
+    """
+    snapshot_format = get_snapshot_format(path, snapshot_format)
+    batch_size = batch_size or get_app_instance().config.EXPORT_CHUNK_SIZE
+    started_at = time.monotonic()
+
+    if truncate:
+        deleted = await Artwork.all().delete()
+        logger.info("Deleted %s artworks before the snapshot import", deleted)
+        # The servers must drop every cached artwork, not only the imported ones
+        await publish_artworks_changed(None)
+    else:
+        conflicts = await find_conflicting_artworks(path, batch_size, snapshot_format)
+        if conflicts:
+            aic_id, artwork_id, snapshot_id = conflicts[0]
+            raise ValueError(
+                f"{len(conflicts)} stored artworks have the upstream id of a snapshot artwork under another id "
+                f"(e.g. aic_id {aic_id}: id {artwork_id} here, {snapshot_id} in the snapshot), "
+                "import with --truncate to replace the catalog"
+            )
+
+    count = 0
+    for artworks in iter_artworks_snapshot(path, batch_size, snapshot_format):
+        await copy_artworks_batch(artworks)
+        await publish_artworks_changed([artwork["id"] for artwork in artworks])
+        count += len(artworks)
+        logger.info("Imported artworks: %s", count)
+
+    connection = connections.get("default")
+    if connection.capabilities.dialect == "postgres":
+        await connection.execute_query(RESET_ARTWORK_ID_SEQUENCE_QUERY)
+
+    watermark = read_snapshot_watermark(path, snapshot_format)
+    checkpoint = await get_sync_checkpoint()
+    if watermark and checkpoint.watermark is None and checkpoint.status != "running":
+        checkpoint.watermark = watermark
+        await checkpoint.save(update_fields=["watermark", "updated_at"])
+        logger.info("Sync watermark restored from the snapshot: %s", watermark)
+
+    logger.info("Artworks snapshot imported: %s artworks from %s", count, path)
+    return {
+        "path": path,
+        "format": snapshot_format,
+        "artworks": count,
+        "watermark": watermark,
+        "duration": round(time.monotonic() - started_at, 3),
+    }
+
+def parse_args(argv=None):
+    """
+    Parses the command line arguments of the snapshot tool.
+
+    Args:
+        argv (list, optional): Arguments to parse (default: `sys.argv[1:]`).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m artworks_core.artworks_snapshot",
+        description="Exports the artworks table to a Parquet or Arrow snapshot, or imports one.",
+    )
+    parser.add_argument("command", choices=("export", "import"), help="Dump the table, or load a snapshot.")
+    parser.add_argument("path", help="Snapshot file (.parquet, .arrow, .feather or .ipc).")
+    parser.add_argument("--format", choices=("parquet", "arrow"), help="Snapshot format (default: from the extension).")
+    parser.add_argument(
+        "--chunk-size", "--batch-size", type=int, dest="chunk_size",
+        help="Artworks per chunk or COPY batch (default: EXPORT_CHUNK_SIZE).",
+    )
+    parser.add_argument("--truncate", action="store_true", help="Delete the existing artworks before an import.")
+    return parser.parse_args(argv)
+
+async def run_snapshot(args):
+    """
+    Runs a snapshot export or import with the given command line options.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    await init_database()
+    try:
+        if args.command == "export":
+            summary = await export_artworks_snapshot(args.path, args.format, args.chunk_size)
+        else:
+            summary = await import_artworks_snapshot(args.path, args.format, args.chunk_size, args.truncate)
+        print(json.dumps(summary, indent=2))
+        return 0
+    except Exception as exception:
+        logger.error("Artworks snapshot %s failed: %s", args.command, exception)
+        return 1
+    finally:
+        await Tortoise.close_connections()
+
+def main(argv=None):
+    """
+    Entry point of the snapshot tool.
+
+    Args:
+        argv (list, optional): Command line arguments (default: `sys.argv[1:]`).
+
+    Returns:
+        int: The process exit code.
+    """
+    args = parse_args(argv)
+    initialize_app_env()
+    logger.info("Starting ArtBloom snapshot %s %s", args.command, "📦")
+
+    try:
+        return asyncio.run(run_snapshot(args))
+    except KeyboardInterrupt:
+        logger.info("Snapshot %s interrupted.", args.command)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
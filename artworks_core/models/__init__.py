@@ -1,3 +1,4 @@
 from .artwork import Artwork
+from .sync_checkpoint import SyncCheckpoint
 
-__all__ = ["Artwork"]  # Explicitly define public API
\ No newline at end of file
+__all__ = ["Artwork", "SyncCheckpoint"]  # Explicitly define public API
\ No newline at end of file
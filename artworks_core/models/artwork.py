@@ -1,4 +1,6 @@
 from tortoise import Model, fields
+from tortoise.contrib.postgres.indexes import GinIndex
+from tortoise.indexes import Index
 
 
 class Artwork(Model):
@@ -7,6 +9,7 @@ class Artwork(Model):
 
     Fields:
         - id (IntField): Primary key identifier for the artwork.
+        - aic_id (IntField): Upstream Art Institute of Chicago id, unique (ingest upsert key).
         - title (TextField): Title or name of the artwork.
         - artist_title (TextField): Name of the artist who created the artwork.
         - place_of_origin (TextField): Geographic location where the artwork originated.
@@ -23,6 +26,12 @@ class Artwork(Model):
         - material_titles (JSONField): List of materials used (e.g., ["Oil", "Canvas"]).
         - term_titles (JSONField): Related terms or tags (e.g., ["Starry Night", "Van Gogh"]).
         - category_titles (JSONField): Categories associated with the artwork (e.g., ["Fine Art"]).
+        - fingerprint (CharField): SHA-256 of the normalized upstream payload (change detection).
+        - updated_at (DatetimeField): Time the artwork was last written (HTTP `Last-Modified`).
+
+    The table also has a `search_vector` tsvector column, generated by PostgreSQL from the title,
+    artist, terms and description (see the migrations). It is only used by the local search query
+    and is not mapped on the model.
 
     Methods:
         - __str__(): Returns a string representation of the artwork.
@@ -30,6 +39,7 @@ class Artwork(Model):
     """
 
     id = fields.IntField(pk=True)  # Primary key
+    aic_id = fields.IntField(null=True, unique=True)  # Upstream AIC id (upsert key)
     title = fields.TextField(null=True)  # Title of the artwork
     artist_title = fields.TextField(null=True)  # Artist's name
     place_of_origin = fields.TextField(null=True)  # Place of origin
@@ -46,6 +56,24 @@ class Artwork(Model):
     material_titles = fields.JSONField(null=True)  # List of materials used (stored as JSON)
     term_titles = fields.JSONField(null=True)  # Related terms or tags (stored as JSON)
     category_titles = fields.JSONField(null=True)  # Categories (stored as JSON)
+    fingerprint = fields.CharField(max_length=64, null=True)  # Content hash of the upstream payload
+    updated_at = fields.DatetimeField(auto_now=True)  # Last write of the artwork
+
+    class Meta:
+        # Btree indexes serve the equality and year range filters of the artworks list, GIN indexes
+        # serve its JSONB containment (@>) filters. Names match the migrations (TextField has no db_index)
+        indexes = (
+            Index(fields=("artist_title",), name="idx_artwork_artist_title"),
+            Index(fields=("style_title",), name="idx_artwork_style_title"),
+            Index(fields=("medium_display",), name="idx_artwork_medium_display"),
+            Index(fields=("classification_title",), name="idx_artwork_classification_title"),
+            Index(fields=("date_start",), name="idx_artwork_date_start"),
+            Index(fields=("date_end",), name="idx_artwork_date_end"),
+            Index(fields=("updated_at",), name="idx_artwork_updated_at"),
+            GinIndex(fields=("category_titles",), name="idx_artwork_category_titles_gin"),
+            GinIndex(fields=("term_titles",), name="idx_artwork_term_titles_gin"),
+            GinIndex(fields=("material_titles",), name="idx_artwork_material_titles_gin"),
+        )
 
     def __str__(self):
         """
@@ -65,6 +93,7 @@ class Artwork(Model):
         """
         return {
             "id": self.id,
+            "aic_id": self.aic_id,
             "title": self.title,
             "artist_title": self.artist_title,
             "place_of_origin": self.place_of_origin,
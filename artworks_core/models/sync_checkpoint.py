@@ -0,0 +1,45 @@
+from tortoise import Model, fields
+
+
+class SyncCheckpoint(Model):
+    """
+    Persists the progress of an artworks sync, so a crashed run can resume and later runs can
+    fetch only the artworks changed upstream since the last completed run.
+
+    Fields:
+        - id (IntField): Primary key identifier for the checkpoint.
+        - name (CharField): Unique name of the synced dataset (e.g., "artworks").
+        - mode (CharField): Mode of the current or last run ("full" or "delta").
+        - status (CharField): "running" while a run is in progress or was interrupted, else "completed".
+        - page_size (IntField): Page size of the current run, pages are only resumable with the same size.
+        - total_pages (IntField): Number of pages of the current run.
+        - last_completed_page (IntField): Last page such that it and every page before it are saved.
+        - watermark (CharField): Upstream `updated_at` of the newest artwork of the last completed run.
+        - run_since (CharField): Watermark the current delta run fetches from (kept for resumes).
+        - run_watermark (CharField): Newest upstream `updated_at` saved by the current run.
+        - updated_at (DatetimeField): Time of the last checkpoint update.
+    """
+
+    id = fields.IntField(pk=True)  # Primary key
+    name = fields.CharField(max_length=50, unique=True)  # Synced dataset
+    mode = fields.CharField(max_length=10, default="full")  # "full" or "delta"
+    status = fields.CharField(max_length=10, default="completed")  # "running" or "completed"
+    page_size = fields.IntField(null=True)  # Page size of the current run
+    total_pages = fields.IntField(null=True)  # Pages of the current run
+    last_completed_page = fields.IntField(default=0)  # Resume point of the current run
+    watermark = fields.CharField(max_length=64, null=True)  # ISO-8601 upstream timestamp
+    run_since = fields.CharField(max_length=64, null=True)  # ISO-8601 upstream timestamp
+    run_watermark = fields.CharField(max_length=64, null=True)  # ISO-8601 upstream timestamp
+    updated_at = fields.DatetimeField(auto_now=True)  # Last checkpoint update
+
+    class Meta:
+        table = "sync_checkpoint"
+
+    def __str__(self):
+        """
+        Returns a string representation of the checkpoint.
+
+        Returns:
+            str: A string in the format "name: status (mode, page last_completed_page/total_pages)".
+        """
+        return f"{self.name}: {self.status} ({self.mode}, page {self.last_completed_page}/{self.total_pages})"
@@ -18,6 +18,66 @@ Environment Variables:
     - SECRET_KEY: The secret key for securing the application.
     - APP_PORT: The port number on which the app runs (default: 8000).
     - APP_HOST: The host interface for the app (default: "0.0.0.0").
+    - ARTWORKS_MAX_LIMIT: Maximum page size of the /artworks list (default: 100).
+    - ARTWORKS_MAX_BATCH_SIZE: Maximum number of ids of a /artworks/batch request (default: 100).
+    - EXPORT_CHUNK_SIZE: Artworks read from the database per chunk of /artworks/export (default: 1000).
+    - RECOMMENDATIONS_DEFAULT_K: Number of recommendations when `k` is not given (default: 5).
+    - RECOMMENDATIONS_MAX_K: Maximum number of recommendations per request (default: 50).
+    - RECOMMENDATION_STYLE_WEIGHT: Score of a style match (default: 3).
+    - RECOMMENDATION_MEDIUM_WEIGHT: Score of a medium match (default: 2).
+    - RECOMMENDATION_CATEGORY_WEIGHT: Score of a category match (default: 1).
+    - RECOMMENDATION_DATE_TIEBREAK: Ranks equal scores by temporal proximity (default: "True").
+    - RECOMMENDATION_EXECUTOR: Runs recommendation queries in a "thread" pool, a "process" pool or "inline" (default: "thread").
+    - RECOMMENDATION_WORKERS: Number of recommendation threads or processes (default: 2).
+    - RECOMMENDATION_MAX_PENDING: Queued or running recommendation queries before rejecting with 503 (default: 16).
+    - RECOMMENDATION_TIMEOUT_SECONDS: Seconds a request waits for its recommendation query before a 504 (default: 2).
+    - RECOMMENDATION_CACHE_MAX_ENTRIES: Maximum number of cached recommendation results, 0 disables the cache (default: 4096).
+    - RECOMMENDATION_CACHE_TTL_SECONDS: Seconds a recommendation result is cached, index rebuilds also replace it (default: 86400).
+    - RECOMMENDATION_CACHE_PREWARM: Most requested preference profiles recomputed after each index rebuild (default: 32).
+    - RECOMMENDATION_INDEX_REFRESH_DELAY_SECONDS: Seconds without artworks changes before the recommendation index is rebuilt (default: 30).
+    - RECOMMENDATION_SNAPSHOT_PATH: Artworks snapshot (.parquet or .arrow) the first recommendation index is built from, instead of the database (default: None).
+    - SIMILAR_DEFAULT_K: Number of similar artworks when `k` is not given (default: 10).
+    - SIMILAR_DATE_WEIGHT: Share of the date proximity in the similarity, 0 to 1 (default: 0.2).
+    - SIMILAR_DATE_SCALE: Years over which the date proximity decays (default: 50).
+    - SIMILAR_CACHE_MAX_ENTRIES: Maximum number of cached neighbor lists (default: 10000).
+    - INGEST_BATCH_SIZE: Number of artworks upserted per database statement (default: 100).
+    - UPDATE_ENABLED: Runs the scheduled artworks update in the server (default: "True").
+    - UPDATE_INTERVAL_SECONDS: Interval between scheduled updates (default: 86400).
+    - UPDATE_JITTER_SECONDS: Maximum random delay added to each interval (default: 600).
+    - UPDATE_INITIAL_DELAY_SECONDS: Delay before the first scheduled update (default: 60).
+    - UPDATE_MAX_RUNTIME_SECONDS: Runtime after which an update is cancelled (default: 14400).
+    - INGEST_SYNC_MODE: Default sync mode, "full" or "delta" (default: "delta").
+    - INGEST_PAGE_SIZE: Number of artworks fetched per upstream page (default: 100).
+    - INGEST_FETCH_CONCURRENCY: Number of concurrent upstream page fetchers (default: 4).
+    - INGEST_WRITER_CONCURRENCY: Number of concurrent database writers (default: 1).
+    - INGEST_QUEUE_SIZE: Maximum fetched pages buffered before fetchers block (default: 8).
+    - HTTP_CLIENT_MAX_CONNECTIONS: Connection pool size of the shared HTTP client (default: 100).
+    - HTTP_CLIENT_MAX_KEEPALIVE: Idle keep-alive connections kept in the pool (default: 20).
+    - HTTP_CLIENT_KEEPALIVE_EXPIRY: Seconds an idle connection is kept alive (default: 30).
+    - HTTP_CLIENT_HTTP2: Enables HTTP/2 for upstream calls, requires `h2` (default: "False").
+    - HTTP_CLIENT_TIMEOUT: Default upstream request timeout in seconds (default: 60).
+    - HTTP_CLIENT_CONNECT_TIMEOUT: Upstream connect timeout in seconds (default: 10).
+    - SEARCH_BACKEND: Search engine of /artworks/search, "local" (PostgreSQL) or "upstream" (default: "local").
+    - SEARCH_UPSTREAM_FALLBACK: Uses the upstream search when the local search fails (default: "True").
+    - ARTWORK_CACHE_MAX_ENTRIES: Maximum number of cached artworks of the detail route, 0 disables the cache (default: 10000).
+    - ARTWORK_CACHE_MAX_BYTES: Maximum total JSON size of the cached artworks (default: 67108864, 64 MiB).
+    - ARTWORK_CACHE_TTL_SECONDS: Seconds an artwork is cached, changes also invalidate it (default: 86400).
+    - ARTWORK_FRAGMENT_CACHE_MAX_ENTRIES: Maximum number of pre-encoded artworks of the list route, 0 disables the cache (default: 0).
+    - ARTWORK_FRAGMENT_CACHE_MAX_BYTES: Maximum total size of the pre-encoded artworks (default: 67108864, 64 MiB).
+    - JSON_ENCODER: JSON encoder of the responses, "orjson", "stdlib" or "auto" (orjson when installed) (default: "auto").
+    - ARTWORKS_CACHE_MAX_AGE_SECONDS: `Cache-Control` max-age of the artworks list and detail routes, 0 makes clients revalidate every time (default: 60).
+    - SEARCH_CACHE_MAX_ENTRIES: Maximum number of cached search results, 0 disables the cache (default: 1024).
+    - SEARCH_CACHE_TTL_SECONDS: Seconds a cached search result is fresh (default: 300).
+    - SEARCH_CACHE_STALE_SECONDS: Seconds an expired search result is served while refreshed (default: 0).
+    - SEARCH_REQUEST_TIMEOUT: Timeout in seconds of upstream search calls (default: 10).
+    - SEARCH_MAX_RETRIES: Retry budget of upstream search calls (default: 0, fail fast).
+    - UPSTREAM_RATE_LIMIT: Maximum upstream requests per second (default: 1.0).
+    - UPSTREAM_RATE_BURST: Upstream requests allowed back to back (default: 5).
+    - UPSTREAM_MAX_RETRIES: Retries of throttled or failed upstream calls (default: 3).
+    - UPSTREAM_BACKOFF_BASE: Base retry backoff in seconds, doubled per attempt (default: 0.5).
+    - UPSTREAM_BACKOFF_MAX: Maximum retry backoff in seconds (default: 30).
+    - CIRCUIT_BREAKER_FAILURE_THRESHOLD: Consecutive upstream failures opening the circuit (default: 5).
+    - CIRCUIT_BREAKER_RESET_TIMEOUT: Seconds before a trial call on an open circuit (default: 30).
 """
 import os
 from sanic import Sanic
@@ -61,6 +121,66 @@ def set_env_configuration(app):
     app.config.HOST = os.getenv("APP_HOST", "0.0.0.0")  # Default to all interfaces
     app.config.ARTWORKS_API = os.getenv("ARTWORKS_API", "")  # Default to an empty string
     app.config.ARTWORKS_SEARCH_API = os.getenv("ARTWORKS_SEARCH_API", "")  # Default to an empty string
+    app.config.ARTWORKS_MAX_LIMIT = int(os.getenv("ARTWORKS_MAX_LIMIT", "100"))  # Page size cap
+    app.config.ARTWORKS_MAX_BATCH_SIZE = int(os.getenv("ARTWORKS_MAX_BATCH_SIZE", "100"))  # Ids per batch
+    app.config.EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))  # Artworks per export chunk
+    app.config.RECOMMENDATIONS_DEFAULT_K = int(os.getenv("RECOMMENDATIONS_DEFAULT_K", "5"))
+    app.config.RECOMMENDATIONS_MAX_K = int(os.getenv("RECOMMENDATIONS_MAX_K", "50"))
+    app.config.RECOMMENDATION_STYLE_WEIGHT = float(os.getenv("RECOMMENDATION_STYLE_WEIGHT", "3"))
+    app.config.RECOMMENDATION_MEDIUM_WEIGHT = float(os.getenv("RECOMMENDATION_MEDIUM_WEIGHT", "2"))
+    app.config.RECOMMENDATION_CATEGORY_WEIGHT = float(os.getenv("RECOMMENDATION_CATEGORY_WEIGHT", "1"))
+    app.config.RECOMMENDATION_DATE_TIEBREAK = os.getenv("RECOMMENDATION_DATE_TIEBREAK", "True").lower() in ("true", "1")
+    app.config.RECOMMENDATION_EXECUTOR = os.getenv("RECOMMENDATION_EXECUTOR", "thread")  # thread, process or inline
+    app.config.RECOMMENDATION_WORKERS = int(os.getenv("RECOMMENDATION_WORKERS", "2"))
+    app.config.RECOMMENDATION_MAX_PENDING = int(os.getenv("RECOMMENDATION_MAX_PENDING", "16"))
+    app.config.RECOMMENDATION_TIMEOUT_SECONDS = float(os.getenv("RECOMMENDATION_TIMEOUT_SECONDS", "2"))
+    app.config.RECOMMENDATION_CACHE_MAX_ENTRIES = int(os.getenv("RECOMMENDATION_CACHE_MAX_ENTRIES", "4096"))
+    app.config.RECOMMENDATION_CACHE_TTL_SECONDS = float(os.getenv("RECOMMENDATION_CACHE_TTL_SECONDS", "86400"))
+    app.config.RECOMMENDATION_CACHE_PREWARM = int(os.getenv("RECOMMENDATION_CACHE_PREWARM", "32"))
+    app.config.RECOMMENDATION_INDEX_REFRESH_DELAY_SECONDS = float(os.getenv("RECOMMENDATION_INDEX_REFRESH_DELAY_SECONDS", "30"))
+    app.config.RECOMMENDATION_SNAPSHOT_PATH = os.getenv("RECOMMENDATION_SNAPSHOT_PATH")  # Snapshot file
+    app.config.SIMILAR_DEFAULT_K = int(os.getenv("SIMILAR_DEFAULT_K", "10"))
+    app.config.SIMILAR_DATE_WEIGHT = float(os.getenv("SIMILAR_DATE_WEIGHT", "0.2"))
+    app.config.SIMILAR_DATE_SCALE = float(os.getenv("SIMILAR_DATE_SCALE", "50"))
+    app.config.SIMILAR_CACHE_MAX_ENTRIES = int(os.getenv("SIMILAR_CACHE_MAX_ENTRIES", "10000"))
+    app.config.INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "100"))  # Rows per upsert
+    app.config.UPDATE_ENABLED = os.getenv("UPDATE_ENABLED", "True").lower() in ("true", "1")
+    app.config.UPDATE_INTERVAL_SECONDS = float(os.getenv("UPDATE_INTERVAL_SECONDS", "86400"))  # Daily
+    app.config.UPDATE_JITTER_SECONDS = float(os.getenv("UPDATE_JITTER_SECONDS", "600"))
+    app.config.UPDATE_INITIAL_DELAY_SECONDS = float(os.getenv("UPDATE_INITIAL_DELAY_SECONDS", "60"))
+    app.config.UPDATE_MAX_RUNTIME_SECONDS = float(os.getenv("UPDATE_MAX_RUNTIME_SECONDS", "14400"))  # 4 hours
+    app.config.INGEST_SYNC_MODE = os.getenv("INGEST_SYNC_MODE", "delta")  # "full" or "delta"
+    app.config.INGEST_PAGE_SIZE = int(os.getenv("INGEST_PAGE_SIZE", "100"))  # Artworks per upstream page
+    app.config.INGEST_FETCH_CONCURRENCY = int(os.getenv("INGEST_FETCH_CONCURRENCY", "4"))
+    app.config.INGEST_WRITER_CONCURRENCY = int(os.getenv("INGEST_WRITER_CONCURRENCY", "1"))
+    app.config.INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "8"))  # Pages buffered in memory
+    app.config.HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "100"))
+    app.config.HTTP_CLIENT_MAX_KEEPALIVE = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", "20"))
+    app.config.HTTP_CLIENT_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY", "30"))
+    app.config.HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "False").lower() in ("true", "1")
+    app.config.HTTP_CLIENT_TIMEOUT = float(os.getenv("HTTP_CLIENT_TIMEOUT", "60"))
+    app.config.HTTP_CLIENT_CONNECT_TIMEOUT = float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT", "10"))
+    app.config.SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "local")  # "local" or "upstream"
+    app.config.SEARCH_UPSTREAM_FALLBACK = os.getenv("SEARCH_UPSTREAM_FALLBACK", "True").lower() in ("true", "1")
+    app.config.ARTWORK_CACHE_MAX_ENTRIES = int(os.getenv("ARTWORK_CACHE_MAX_ENTRIES", "10000"))
+    app.config.ARTWORK_CACHE_MAX_BYTES = int(os.getenv("ARTWORK_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    app.config.ARTWORK_CACHE_TTL_SECONDS = float(os.getenv("ARTWORK_CACHE_TTL_SECONDS", "86400"))
+    app.config.ARTWORK_FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv("ARTWORK_FRAGMENT_CACHE_MAX_ENTRIES", "0"))  # Disabled
+    app.config.ARTWORK_FRAGMENT_CACHE_MAX_BYTES = int(os.getenv("ARTWORK_FRAGMENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    app.config.JSON_ENCODER = os.getenv("JSON_ENCODER", "auto")  # "orjson", "stdlib" or "auto"
+    app.config.ARTWORKS_CACHE_MAX_AGE_SECONDS = int(os.getenv("ARTWORKS_CACHE_MAX_AGE_SECONDS", "60"))
+    app.config.SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024"))
+    app.config.SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "300"))
+    app.config.SEARCH_CACHE_STALE_SECONDS = float(os.getenv("SEARCH_CACHE_STALE_SECONDS", "0"))  # Disabled
+    app.config.SEARCH_REQUEST_TIMEOUT = float(os.getenv("SEARCH_REQUEST_TIMEOUT", "10"))
+    app.config.SEARCH_MAX_RETRIES = int(os.getenv("SEARCH_MAX_RETRIES", "0"))  # Fail fast by default
+    app.config.UPSTREAM_RATE_LIMIT = float(os.getenv("UPSTREAM_RATE_LIMIT", "1.0"))  # Requests per second
+    app.config.UPSTREAM_RATE_BURST = int(os.getenv("UPSTREAM_RATE_BURST", "5"))
+    app.config.UPSTREAM_MAX_RETRIES = int(os.getenv("UPSTREAM_MAX_RETRIES", "3"))
+    app.config.UPSTREAM_BACKOFF_BASE = float(os.getenv("UPSTREAM_BACKOFF_BASE", "0.5"))
+    app.config.UPSTREAM_BACKOFF_MAX = float(os.getenv("UPSTREAM_BACKOFF_MAX", "30"))
+    app.config.CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+    app.config.CIRCUIT_BREAKER_RESET_TIMEOUT = float(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30"))
 
 def get_app_instance():
     """
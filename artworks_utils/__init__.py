@@ -1,5 +1,28 @@
-from .http_request_manager import handle_get_request
+from .http_request_manager import handle_get_request, init_http_client, close_http_client
 from .app_logger import logger
-from .database_manager import init_database
+from .database_manager import init_database, advisory_lock
+from .cache_manager import TTLCache, json_size
+from .executor_manager import BoundedExecutor, ExecutorOverloadedError
+from .json_serializer import JSONFragments, json_dumps, json_response, set_json_encoder
+from .conditional_request import make_etag, is_not_modified, get_cache_headers, not_modified_response
 
-__all__ = ["handle_get_request", "logger", "init_database"]  # Explicitly define public API
\ No newline at end of file
+__all__ = [
+    "handle_get_request",
+    "init_http_client",
+    "close_http_client",
+    "logger",
+    "init_database",
+    "advisory_lock",
+    "TTLCache",
+    "json_size",
+    "BoundedExecutor",
+    "ExecutorOverloadedError",
+    "JSONFragments",
+    "json_dumps",
+    "json_response",
+    "set_json_encoder",
+    "make_etag",
+    "is_not_modified",
+    "get_cache_headers",
+    "not_modified_response",
+]  # Explicitly define public API
\ No newline at end of file
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with TTL expiry, LRU eviction and single-flight loading.
+
+    Behavior:
+        - Entries expire `ttl` seconds after they are stored; the least recently used entries are
+          evicted once the cache holds `max_entries` entries or, when a `sizeof` function is
+          given, `max_bytes` bytes.
+        - Concurrent `get_or_load` calls missing the same key share a single loader call.
+        - Stale-while-revalidate (`stale_ttl` > 0): for `stale_ttl` seconds after expiry, the
+          stale value is returned at once while a single background call refreshes it.
+        - Invalidation (`invalidate`, `clear`) also discards the results of loads started before
+          it, so a slow load never stores a value older than the invalidation.
+    """
+
+    def __init__(
+        self, max_entries=1024, ttl=300.0, stale_ttl=0.0, max_bytes=None, sizeof=None, clock=time.monotonic
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of cached entries (0 disables caching).
+            ttl (float): Seconds an entry is fresh.
+            stale_ttl (float): Seconds an expired entry may still be served while it is refreshed.
+            max_bytes (int, optional): Maximum total size of the cached values, requires `sizeof`.
+            sizeof (callable, optional): Function returning the size in bytes of a value
+                (e.g. `json_size`).
+            clock (callable): Monotonic clock returning seconds, injectable for tests.
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.ttl = float(ttl)
+        self.stale_ttl = max(0.0, float(stale_ttl))
+        self.max_bytes = int(max_bytes) if max_bytes and sizeof else None
+        self.sizeof = sizeof
+        self.size_bytes = 0
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (value, expires_at, size), least recently used first
+        self.loading = {}  # key -> in-flight loader task
+        self.generation = 0  # Bumped on invalidation
+        self.counters = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def get(self, key, default=None):
+        """
+        Returns the fresh cached value of a key.
+
+        Args:
+            key (hashable): The cache key.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            The cached value, or `default`.
+        """
+        entry = self.entries.get(key)
+        if entry is None or self.clock() >= entry[1]:
+            self.counters["misses"] += 1
+            return default
+
+        self.entries.move_to_end(key)
+        self.counters["hits"] += 1
+        return entry[0]
+
+    def set(self, key, value, generation=None):
+        """
+        Stores a value, evicting the least recently used entries beyond `max_entries` or `max_bytes`.
+
+        Args:
+            key (hashable): The cache key.
+            value: The value to cache. A value larger than `max_bytes` is not cached.
+            generation (int, optional): The `generation` read before loading the value. The value
+                is dropped if the cache was invalidated since, as it may predate the invalidation.
+        """
+        if self.max_entries == 0 or (generation is not None and generation != self.generation):
+            return
+
+        size = self.sizeof(value) if self.sizeof else 0
+        self.remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self.entries[key] = (value, self.clock() + self.ttl, size)
+        self.size_bytes += size
+        while len(self.entries) > self.max_entries or (
+            self.max_bytes is not None and self.size_bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_size) = self.entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.counters["evictions"] += 1
+
+    def remove(self, key):
+        """
+        Removes an entry, keeping the total size up to date.
+        """
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry[2]
+
+    def invalidate(self, key):
+        """
+        Removes a key from the cache.
+
+        Args:
+            key (hashable): The cache key.
+        """
+        self.generation += 1
+        self.remove(key)
+        self.loading.pop(key, None)  # Later misses start a new load instead of joining a stale one
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        self.generation += 1
+        self.entries.clear()
+        self.size_bytes = 0
+        self.loading.clear()
+
+    async def get_or_load(self, key, loader, cacheable=None):
+        """
+        Returns the cached value of a key, loading it on a miss.
+
+        Args:
+            key (hashable): The cache key.
+            loader (callable): Coroutine function returning the value to cache.
+            cacheable (callable, optional): Predicate telling whether a loaded value may be
+                cached (e.g. only successful responses). Every value is cached by default.
+
+        Returns:
+            The cached, stale or freshly loaded value.
+
+        Raises:
+            Exception: Any exception raised by the loader, shared by the coalesced callers.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            value, expires_at, _ = entry
+            now = self.clock()
+            if now < expires_at:
+                self.entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return value
+            if now < expires_at + self.stale_ttl:
+                # Serve the stale value and refresh it in the background
+                self.entries.move_to_end(key)
+                self.counters["stale_hits"] += 1
+                self.start_load(key, loader, cacheable)
+                return value
+            self.remove(key)
+
+        self.counters["misses"] += 1
+        # Shielded so a cancelled caller does not cancel the load shared with other callers
+        return await asyncio.shield(self.start_load(key, loader, cacheable))
+
+    def start_load(self, key, loader, cacheable):
+        """
+        Starts loading a key, or joins the load already in flight for it.
+
+        Args:
+            key (hashable): The cache key.
+            loader (callable): Coroutine function returning the value to cache.
+            cacheable (callable): Predicate telling whether the loaded value may be cached.
+
+        Returns:
+            asyncio.Task: The in-flight load.
+        """
+        task = self.loading.get(key)
+        if task is not None:
+            self.counters["coalesced"] += 1
+            return task
+
+        task = asyncio.ensure_future(self.load(key, loader, cacheable, self.generation))
+        self.loading[key] = task
+        task.add_done_callback(lambda done_task: self.finish_load(key, done_task))
+        return task
+
+    async def load(self, key, loader, cacheable, generation):
+        """
+        Calls the loader and caches its value, unless the cache was invalidated since `generation`.
+        """
+        value = await loader()
+        if cacheable is None or cacheable(value):
+            self.set(key, value, generation)
+        return value
+
+    def finish_load(self, key, task):
+        """
+        Forgets a finished load, marking its exception as retrieved for background refreshes.
+        """
+        if self.loading.get(key) is task:
+            del self.loading[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: The size in entries and bytes, bounds, hit/stale hit/miss/coalesced/eviction counters and hit ratio.
+        """
+        lookups = self.counters["hits"] + self.counters["stale_hits"] + self.counters["misses"]
+        hits = self.counters["hits"] + self.counters["stale_hits"]
+        return {
+            "size": len(self.entries),
+            "max_entries": self.max_entries,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            **self.counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+def json_size(value):
+    """
+    Approximates the memory footprint of a JSON-serializable value by its encoded size.
+
+    Args:
+        value: The value to measure.
+
+    Returns:
+        int: The size in bytes of the compact JSON encoding.
+    """
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode())
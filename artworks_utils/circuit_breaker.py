@@ -0,0 +1,74 @@
+import time
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to an upstream service.
+
+    States:
+        - "closed": Calls go through; consecutive failures are counted.
+        - "open": After `failure_threshold` consecutive failures, calls are rejected immediately
+          for `reset_timeout` seconds.
+        - "half_open": After the timeout, a single trial call is let through. Its success closes
+          the circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds the circuit stays open before a trial call.
+            clock (callable): Monotonic clock returning seconds, injectable for tests.
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.clock = clock
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+
+    def allow_request(self):
+        """
+        Tells whether a call may be sent to the upstream now.
+
+        Returns:
+            bool: False while the circuit is open (fail fast), True otherwise.
+        """
+        if self.state == "open":
+            if self.clock() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = "half_open"
+            self.trial_in_flight = False
+
+        if self.state == "half_open":
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+
+        return True
+
+    def release_trial(self):
+        """
+        Frees the half-open trial of a call that ended without an outcome (e.g. was cancelled),
+        so the next call becomes the trial instead of being rejected.
+        """
+        self.trial_in_flight = False
+
+    def record_success(self):
+        """
+        Closes the circuit and resets the failure count.
+        """
+        self.state = "closed"
+        self.failures = 0
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        """
+        Counts a failure, opening the circuit on a failed trial or once the threshold is reached.
+        """
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = self.clock()
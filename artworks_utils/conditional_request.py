@@ -0,0 +1,100 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from sanic import response
+
+
+def make_etag(*parts):
+    """
+    Builds a strong entity tag from the values a representation depends on.
+
+    Args:
+        *parts: The values (e.g. a content fingerprint and the selected fields), compared by
+            their string form.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+def format_http_date(moment):
+    """
+    Formats a datetime as an HTTP date (e.g. "Fri, 16 Oct 2026 10:00:00 GMT").
+    """
+    return format_datetime(moment.astimezone(timezone.utc), usegmt=True)
+
+def parse_http_date(value):
+    """
+    Parses an HTTP date header.
+
+    Returns:
+        datetime: The aware datetime, or None if the value is not a valid HTTP date.
+    """
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+def is_not_modified(headers, etag, last_modified=None):
+    """
+    Evaluates the conditional headers of a GET request against the current representation.
+
+    `If-None-Match` matches when it lists the entity tag (weak comparison) or is "*". When it
+    is present, `If-Modified-Since` is ignored, otherwise the representation is not modified if
+    it was last modified at or before that date (HTTP dates have a one second precision).
+
+    Args:
+        headers (sanic.Header): The request headers.
+        etag (str): The entity tag of the current representation, or None if unknown.
+        last_modified (datetime, optional): Last modification of the current representation.
+
+    Returns:
+        bool: Whether a 304 Not Modified response can be sent.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    since = parse_http_date(if_modified_since)
+    return since is not None and last_modified.replace(microsecond=0) <= since
+
+def get_cache_headers(etag, last_modified=None, max_age=0):
+    """
+    Builds the caching headers of a representation.
+
+    Args:
+        etag (str): The entity tag, or None to omit it.
+        last_modified (datetime, optional): The last modification, sent as `Last-Modified`.
+        max_age (int): Seconds clients and shared caches may reuse the representation without
+            revalidating it (0 makes them revalidate every time).
+
+    Returns:
+        dict: The `Cache-Control`, `ETag` and `Last-Modified` headers.
+    """
+    headers = {"Cache-Control": f"public, max-age={max_age}" if max_age > 0 else "no-cache"}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+    return headers
+
+def not_modified_response(headers):
+    """
+    Builds a 304 Not Modified response, without a body.
+
+    Args:
+        headers (dict): The caching headers of the representation (see `get_cache_headers`).
+
+    Returns:
+        sanic.HTTPResponse: The response.
+    """
+    return response.empty(status=304, headers=headers)
@@ -1,8 +1,17 @@
-from tortoise import Tortoise
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from tortoise import Tortoise, connections
 
 from artworks_settings import get_tortoise_config
 from .app_logger import logger
 
+# Migration creating the local search column, indexes and extension. They are not mapped on the
+# models, so `generate_schemas` does not create them, and its statements are idempotent
+SEARCH_MIGRATION_PATH = Path(__file__).resolve().parent.parent / "migrations" / "models" / "10_20261016190412_update.py"
+
 async def init_database():
     """
     Initializes the database connection and generates schemas.
@@ -11,7 +20,8 @@ async def init_database():
         1. Initializes the Tortoise ORM using the configuration provided
            by `get_tortoise_config`.
         2. Generates database schemas based on the defined Tortoise models.
-        3. Logs the success or failure of the initialization process.
+        3. Creates the local search schema the models do not describe (see `ensure_search_schema`).
+        4. Logs the success or failure of the initialization process.
 
     Raises:
         Exception: If an error occurs during database initialization, it is logged
@@ -34,6 +44,7 @@ async def init_database():
 
         # Generate database schemas
         await Tortoise.generate_schemas()
+        await ensure_search_schema()
 
         # Log success message
         logger.info("Database connected successfully!")
@@ -43,3 +54,78 @@ async def init_database():
 
         # Raise the error for the caller to handle
         raise
+
+async def ensure_search_schema():
+    """
+    Creates the full-text search column, its indexes and the pg_trgm extension when missing.
+
+    A database created by `generate_schemas` instead of the aerich migrations lacks them, and
+    every local search would fail and fall back to the upstream search. The upgrade of the
+    migration that adds them is applied as is, so the schema has a single definition. If they
+    cannot be created (e.g. the role may not create extensions), the error is logged once here.
+    """
+    connection = connections.get("default")
+    if connection.capabilities.dialect != "postgres":
+        return
+
+    try:
+        spec = importlib.util.spec_from_file_location("search_migration", SEARCH_MIGRATION_PATH)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        await connection.execute_script(await migration.upgrade(connection))
+    except Exception as error:
+        logger.error(
+            "Local search is unavailable, the search_vector column or the pg_trgm extension could not be "
+            "created (run the aerich migrations as a privileged role): %s", error
+        )
+
+# Process-local locks by key, used by `advisory_lock` on databases without advisory locks
+local_locks = {}
+
+@asynccontextmanager
+async def advisory_lock(key):
+    """
+    Tries to take a PostgreSQL session-level advisory lock, without waiting.
+
+    The lock is held on a dedicated pooled connection for the duration of the `async with`
+    block and is shared by every process and replica using the same database, so it gives
+    cross-worker mutual exclusion. It is released on exit, or by PostgreSQL if the process dies.
+
+    Other databases and drivers (e.g. SQLite in development, or the psycopg backend) fall back
+    to a process-local lock, which only excludes the tasks of the current process.
+
+    Args:
+        key (int): The 64-bit advisory lock key.
+
+    Yields:
+        bool: True if the lock was acquired, False if another session holds it.
+
+    Example Usage:
+        ```
+        async with advisory_lock(42) as acquired:
+            if acquired:
+                await do_exclusive_work()
+        ```
+    """
+    client = connections.get("default")
+    # The queries below use the asyncpg connection API and placeholders
+    if client.capabilities.dialect != "postgres" or not type(client).__module__.startswith("tortoise.backends.asyncpg"):
+        logger.warning(
+            "Advisory locks need PostgreSQL with asyncpg, lock %s only excludes this process (%s database, %s)",
+            key, client.capabilities.dialect, type(client).__name__,
+        )
+        lock = local_locks.setdefault(key, asyncio.Lock())
+        if lock.locked():
+            yield False
+            return
+        async with lock:
+            yield True
+        return
+
+    async with client.acquire_connection() as connection:
+        acquired = await connection.fetchval("SELECT pg_try_advisory_lock($1)", key)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await connection.fetchval("SELECT pg_advisory_unlock($1)", key)
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+
+
+class ExecutorOverloadedError(Exception):
+    """
+    Raised when a `BoundedExecutor` already has its maximum number of pending tasks.
+    """
+
+
+class BoundedExecutor:
+    """
+    Runs blocking or CPU-heavy functions off the event loop, with bounded pending work.
+
+    Behavior:
+        - Functions run on a `concurrent.futures` executor (thread or process pool), or inline
+          when no executor is given.
+        - At most `max_pending` tasks are queued or running; further calls fail immediately with
+          `ExecutorOverloadedError` instead of piling up.
+        - A caller waits at most `timeout` seconds (`asyncio.TimeoutError`). A task that already
+          started keeps its pending slot until it really finishes, so timeouts cannot overload
+          the pool.
+        - Inline functions take a pending slot and are held to the timeout too. They cannot be
+          interrupted, so one exceeding the timeout raises `asyncio.TimeoutError` when it returns
+          and its result is dropped, as a pool task's would be.
+    """
+
+    def __init__(self, executor=None, max_pending=16, timeout=None):
+        """
+        Args:
+            executor (concurrent.futures.Executor, optional): The pool running the functions,
+                None runs them inline on the event loop.
+            max_pending (int): Maximum number of queued or running tasks.
+            timeout (float, optional): Seconds a caller waits for a result.
+        """
+        self.executor = executor
+        self.max_pending = max(1, int(max_pending))
+        self.timeout = timeout
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.counters = {"finished": 0, "rejected": 0, "timeouts": 0}
+
+    def release(self, _future=None):
+        """
+        Frees the pending slot of a finished task (called from the pool's threads).
+        """
+        with self.lock:
+            self.pending -= 1
+            self.counters["finished"] += 1
+
+    def reserve(self):
+        """
+        Takes a pending slot, released by `release` once the task finishes.
+
+        Raises:
+            ExecutorOverloadedError: If `max_pending` tasks are already pending.
+        """
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.counters["rejected"] += 1
+                raise ExecutorOverloadedError(f"{self.pending} tasks pending")
+            self.pending += 1
+
+    def run_inline(self, function, *args):
+        """
+        Runs a function on the event loop, in a pending slot taken by `reserve`.
+        """
+        started_at = time.monotonic()
+        try:
+            result = function(*args)
+        finally:
+            self.release()
+
+        if self.timeout is not None and time.monotonic() - started_at > self.timeout:
+            with self.lock:
+                self.counters["timeouts"] += 1
+            raise asyncio.TimeoutError(f"Inline task took more than {self.timeout}s")
+        return result
+
+    async def run(self, function, *args):
+        """
+        Runs a function with arguments on the executor.
+
+        Args:
+            function (callable): The function, picklable for a process pool.
+            *args: Its arguments.
+
+        Returns:
+            The function's result.
+
+        Raises:
+            ExecutorOverloadedError: If `max_pending` tasks are already pending.
+            asyncio.TimeoutError: If the result is not ready within `timeout` seconds.
+        """
+        self.reserve()
+        if self.executor is None:
+            return self.run_inline(function, *args)
+
+        try:
+            future = self.executor.submit(function, *args)
+        except Exception:
+            self.release()
+            raise
+        future.add_done_callback(self.release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self.lock:
+                self.counters["timeouts"] += 1
+            raise
+
+    def shutdown(self):
+        """
+        Shuts the executor down without waiting for its running tasks.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        """
+        Returns the executor counters.
+
+        Returns:
+            dict: The pending tasks, their bound, and the finished, rejected and timed out counts.
+        """
+        with self.lock:
+            return {"pending": self.pending, "max_pending": self.max_pending, **self.counters}
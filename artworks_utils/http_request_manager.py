@@ -1,58 +1,152 @@
 import asyncio
+import importlib.util
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
 import httpx
 
+from artworks_settings import get_app_instance
 from .app_logger import logger
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import TokenBucketRateLimiter
+
+# Upstream statuses worth retrying (throttling, server errors, timeouts, connection errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Shared connection-pooled client, opened by `init_http_client` and closed by `close_http_client`
+http_client = None
 
-async def handle_get_request(api_url, params):
+# Shared upstream protections, configured by `init_http_client`
+rate_limiter = None
+circuit_breaker = None
+retry_policy = {"max_retries": 0, "backoff_base": 0.5, "backoff_max": 30.0}
+
+async def init_http_client():
     """
-    Handles an HTTP GET request to the specified API URL with query parameters.
+    Opens the shared `httpx.AsyncClient` used by `handle_get_request`.
 
-    This function performs the following steps:
-        1. Sends an asynchronous HTTP GET request using `httpx.AsyncClient`.
-        2. Handles various exceptions, including timeout, HTTP errors, and generic errors.
-        3. Logs errors for debugging purposes and provides a structured JSON response.
+    The client keeps connections alive between calls, so upstream requests reuse pooled
+    TCP/TLS connections instead of paying a new handshake each time. The shared rate limiter,
+    circuit breaker and retry policy are configured at the same time.
+
+    Settings:
+        - HTTP_CLIENT_MAX_CONNECTIONS: Maximum number of open connections.
+        - HTTP_CLIENT_MAX_KEEPALIVE: Maximum number of idle keep-alive connections.
+        - HTTP_CLIENT_KEEPALIVE_EXPIRY: Seconds an idle connection is kept alive.
+        - HTTP_CLIENT_HTTP2: Enables HTTP/2 (requires the `h2` package).
+        - HTTP_CLIENT_TIMEOUT / HTTP_CLIENT_CONNECT_TIMEOUT: Default timeouts in seconds.
+        - UPSTREAM_RATE_LIMIT / UPSTREAM_RATE_BURST: Token-bucket rate (requests/s) and capacity.
+        - UPSTREAM_MAX_RETRIES / UPSTREAM_BACKOFF_BASE / UPSTREAM_BACKOFF_MAX: Retry policy.
+        - CIRCUIT_BREAKER_FAILURE_THRESHOLD / CIRCUIT_BREAKER_RESET_TIMEOUT: Circuit breaker policy.
+
+    Returns:
+        httpx.AsyncClient: The shared client.
+    """
+    global http_client, rate_limiter, circuit_breaker
+    if http_client is not None:
+        return http_client
+
+    config = get_app_instance().config
+
+    rate_limiter = TokenBucketRateLimiter(config.UPSTREAM_RATE_LIMIT, burst=config.UPSTREAM_RATE_BURST)
+    circuit_breaker = CircuitBreaker(
+        failure_threshold=config.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=config.CIRCUIT_BREAKER_RESET_TIMEOUT,
+    )
+    retry_policy.update(
+        max_retries=config.UPSTREAM_MAX_RETRIES,
+        backoff_base=config.UPSTREAM_BACKOFF_BASE,
+        backoff_max=config.UPSTREAM_BACKOFF_MAX,
+    )
+
+    http2 = config.HTTP_CLIENT_HTTP2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but the h2 package is not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=config.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=config.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(config.HTTP_CLIENT_TIMEOUT, connect=config.HTTP_CLIENT_CONNECT_TIMEOUT),
+        http2=http2,
+    )
+    logger.info("HTTP client opened (max connections: %s, HTTP/2: %s)", config.HTTP_CLIENT_MAX_CONNECTIONS, http2)
+    return http_client
+
+async def close_http_client():
+    """
+    Closes the shared `httpx.AsyncClient` and its pooled connections.
+    """
+    global http_client
+    if http_client is None:
+        return
+
+    await http_client.aclose()
+    http_client = None
+    logger.info("HTTP client closed")
+
+def parse_retry_after(value):
+    """
+    Parses a Retry-After header given either in seconds or as an HTTP date.
+
+    Args:
+        value (str): The header value.
+
+    Returns:
+        float: The delay in seconds, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+async def send_get_request(api_url, params, timeout=None):
+    """
+    Sends a single HTTP GET request, without rate limiting or retries.
 
     Args:
         api_url (str): The target API endpoint URL.
         params (dict): Query parameters to include in the GET request.
+        timeout (float, optional): Timeout in seconds for this call. Defaults to the client timeout.
 
     Returns:
-        dict: A dictionary containing:
-            - "data" (dict): The response payload or an error message.
-            - "status" (int): The HTTP status code of the response.
+        tuple: (response, retry_after) where `response` is the structured result described in
+            `handle_get_request` and `retry_after` the upstream's Retry-After delay (or None).
 
     Raises:
         asyncio.CancelledError: Propagates cancellation for proper task handling.
 
-    Example Usage:
-        ```
-        response = await handle_get_request(
-            "https://api.example.com/resource",
-            {"param1": "value1", "param2": "value2"}
-        )
-        if response["status"] == 200:
-            print("Success:", response["data"])
-        else:
-            print("Error:", response["data"]["error"])
-        ```
-
     Exception Handling:
         - **TimeoutException**: Occurs if the request exceeds the timeout limit.
         - **RequestError**: Handles connection-related errors.
         - **HTTPStatusError**: Handles unexpected HTTP status codes.
         - **Generic Exception**: Handles all other unexpected errors.
-
-    Notes:
-        - The function uses a 60-second timeout for the HTTP GET request.
-        - It propagates `asyncio.CancelledError` to ensure proper coroutine cancellation.
-
     """
     try:
-        # Perform an asynchronous GET request with a 60-second timeout
-        async with httpx.AsyncClient() as client:
-            response = await client.get(api_url, params=params, timeout=60)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            return {"data": response.json(), "status": 200}
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+
+        if http_client is not None:
+            response = await http_client.get(api_url, params=params, timeout=request_timeout)
+        else:
+            # No shared client (e.g. scripts), fall back to a one-off client
+            async with httpx.AsyncClient(timeout=60) as client:
+                response = await client.get(api_url, params=params, timeout=request_timeout)
+
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        return {"data": response.json(), "status": 200}, None
 
     except asyncio.CancelledError:
         # Propagate task cancellation for proper handling
@@ -64,7 +158,7 @@ async def handle_get_request(api_url, params):
         return {
             "data": {"error": "The request timed out while accessing the list of Artworks"},
             "status": 504,
-        }
+        }, None
 
     except httpx.RequestError as exception:
         # Handle request-related errors (e.g., connection issues)
@@ -72,7 +166,7 @@ async def handle_get_request(api_url, params):
         return {
             "data": {"error": "A request error occurred while accessing the list of Artworks"},
             "status": 500,
-        }
+        }, None
 
     except httpx.HTTPStatusError as exception:
         # Handle HTTP status errors
@@ -80,7 +174,7 @@ async def handle_get_request(api_url, params):
         return {
             "data": {"error": "An HTTP error occurred while accessing the list of Artworks"},
             "status": exception.response.status_code,
-        }
+        }, parse_retry_after(exception.response.headers.get("Retry-After"))
 
     except Exception as exception:
         # Handle any other unexpected exceptions
@@ -88,4 +182,102 @@ async def handle_get_request(api_url, params):
         return {
             "data": {"error": "An unknown error occurred"},
             "status": 500,
-        }
+        }, None
+
+async def handle_get_request(api_url, params, timeout=None, max_retries=None):
+    """
+    Handles an HTTP GET request to the specified API URL with query parameters.
+
+    This function performs the following steps:
+        1. Fails fast with a 503 while the upstream circuit breaker is open.
+        2. Waits for a token from the shared upstream rate limiter.
+        3. Sends an asynchronous HTTP GET request using the shared `httpx.AsyncClient`
+           (or a one-off client if `init_http_client` has not been called).
+        4. Retries throttled (429), failed (5xx) and timed out requests with exponential backoff
+           and full jitter, honoring Retry-After, up to `max_retries` times.
+        5. Logs errors for debugging purposes and provides a structured JSON response.
+
+    Args:
+        api_url (str): The target API endpoint URL.
+        params (dict): Query parameters to include in the GET request.
+        timeout (float, optional): Timeout in seconds for this call. Defaults to the client timeout.
+        max_retries (int, optional): Retry budget for this call. Defaults to `UPSTREAM_MAX_RETRIES`.
+
+    Returns:
+        dict: A dictionary containing:
+            - "data" (dict): The response payload or an error message.
+            - "status" (int): The HTTP status code of the response.
+
+    Raises:
+        asyncio.CancelledError: Propagates cancellation for proper task handling.
+
+    Example Usage:
+        ```
+        response = await handle_get_request(
+            "https://api.example.com/resource",
+            {"param1": "value1", "param2": "value2"}
+        )
+        if response["status"] == 200:
+            print("Success:", response["data"])
+        else:
+            print("Error:", response["data"]["error"])
+        ```
+
+    Notes:
+        - Without a per-call timeout, the client timeout applies (`HTTP_CLIENT_TIMEOUT`, 60s by default).
+        - Without `init_http_client`, requests are neither rate limited nor retried.
+        - It propagates `asyncio.CancelledError` to ensure proper coroutine cancellation.
+
+    """
+    if max_retries is None:
+        max_retries = retry_policy["max_retries"]
+
+    attempt = 0
+    while True:
+        if circuit_breaker is not None and not circuit_breaker.allow_request():
+            logger.warning("Circuit breaker open, rejecting request to %s", api_url)
+            return {
+                "data": {"error": "The Artworks service is temporarily unavailable"},
+                "status": 503,
+            }
+
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+
+            response, retry_after = await send_get_request(api_url, params, timeout)
+        except BaseException:
+            # Cancelled (client disconnect, timeout) before an outcome was recorded
+            if circuit_breaker is not None:
+                circuit_breaker.release_trial()
+            raise
+        status = response["status"]
+
+        if status == 429:
+            # Throttled: the upstream is alive, slow down instead of counting a failure
+            if rate_limiter is not None:
+                rate_limiter.on_throttled(retry_after)
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
+        elif status in RETRYABLE_STATUSES:
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure()
+        else:
+            if rate_limiter is not None:
+                rate_limiter.on_success()
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
+            return response
+
+        if attempt >= max_retries:
+            return response
+
+        # Exponential backoff with full jitter, never shorter than the upstream's Retry-After
+        backoff = min(retry_policy["backoff_max"], retry_policy["backoff_base"] * 2 ** attempt)
+        delay = max(random.uniform(0, backoff), retry_after or 0)
+        attempt += 1
+        logger.warning(
+            "Retrying request to %s in %.2fs (attempt %s/%s, status %s)",
+            api_url, delay, attempt, max_retries, status,
+        )
+        await asyncio.sleep(delay)
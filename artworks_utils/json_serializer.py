@@ -0,0 +1,125 @@
+import json
+from datetime import date, time
+
+from sanic import response
+
+from .app_logger import logger
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, the standard library encoder is used without it
+    orjson = None
+
+
+class JSONFragments:
+    """
+    Pre-encoded JSON values, serialized as a JSON array by joining them (see `json_dumps`).
+
+    Used for list responses whose items are encoded once and cached as bytes, so building the
+    response is a single join instead of encoding every item again.
+    """
+
+    __slots__ = ("fragments",)
+
+    def __init__(self, fragments):
+        """
+        Args:
+            fragments (iterable): The encoded JSON values, as bytes.
+        """
+        self.fragments = list(fragments)
+
+    def __len__(self):
+        return len(self.fragments)
+
+    def encode(self):
+        """
+        Returns:
+            bytes: The JSON array of the fragments.
+        """
+        return b"[" + b",".join(self.fragments) + b"]"
+
+def encode_default(value):
+    """
+    Encodes the values the standard library encoder does not support, as orjson does: dates
+    and times in ISO 8601 / RFC 3339 format, anything else by its string form.
+    """
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+def dumps_stdlib(value):
+    """
+    Encodes a value to compact JSON bytes with the standard library.
+    """
+    return json.dumps(value, separators=(",", ":"), default=encode_default).encode("ascii")
+
+def dumps_orjson(value):
+    """
+    Encodes a value to compact JSON bytes with orjson.
+    """
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+# JSON encoders by name, see `set_json_encoder`
+JSON_ENCODERS = {"stdlib": dumps_stdlib, "orjson": dumps_orjson}
+
+# Encoder used by `json_dumps`, orjson when installed
+json_encoder = dumps_orjson if orjson is not None else dumps_stdlib
+
+def set_json_encoder(name="auto"):
+    """
+    Selects the JSON encoder of the responses.
+
+    Args:
+        name (str): "orjson", "stdlib", or "auto" (orjson when installed, otherwise the
+            standard library). A missing orjson falls back to the standard library.
+
+    Returns:
+        str: The name of the selected encoder.
+    """
+    global json_encoder
+    if name not in ("auto", *JSON_ENCODERS):
+        logger.warning("Unknown JSON encoder %s, using auto", name)
+        name = "auto"
+    if name == "orjson" and orjson is None:
+        logger.warning("orjson JSON encoder requested but the orjson package is not installed, using stdlib")
+        name = "stdlib"
+    if name == "auto":
+        name = "orjson" if orjson is not None else "stdlib"
+
+    json_encoder = JSON_ENCODERS[name]
+    return name
+
+def json_dumps(value):
+    """
+    Encodes a value to compact UTF-8 JSON bytes with the selected encoder.
+
+    The members of a top-level dictionary may be `JSONFragments`, which are joined as is
+    instead of being encoded.
+
+    Args:
+        value: The JSON-serializable value.
+
+    Returns:
+        bytes: The encoded value.
+    """
+    if isinstance(value, dict) and any(isinstance(member, JSONFragments) for member in value.values()):
+        return b"{" + b",".join(
+            json_encoder(str(key)) + b":" + (member.encode() if isinstance(member, JSONFragments) else json_encoder(member))
+            for key, member in value.items()
+        ) + b"}"
+    return json_encoder(value)
+
+def json_response(body, status=200, headers=None):
+    """
+    Builds a JSON response encoded with `json_dumps`.
+
+    Args:
+        body: The JSON-serializable body, possibly with `JSONFragments` members.
+        status (int): The HTTP status code.
+        headers (dict, optional): Extra response headers.
+
+    Returns:
+        sanic.HTTPResponse: The response.
+    """
+    return response.json(body, status=status, headers=headers, dumps=json_dumps)
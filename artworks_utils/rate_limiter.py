@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+
+class TokenBucketRateLimiter:
+    """
+    Adaptive token-bucket rate limiter for upstream API calls.
+
+    Tokens are refilled continuously at the current rate, up to `burst` tokens. When the upstream
+    throttles us (HTTP 429), the rate is halved and acquisitions are paused for the Retry-After
+    delay; every successful call then recovers the rate additively up to the configured maximum
+    (AIMD), so the limiter settles just below the upstream's real limit.
+
+    Attributes:
+        max_rate (float): Configured maximum rate in requests per second.
+        rate (float): Current (adapted) rate in requests per second.
+        burst (int): Bucket capacity, the number of requests allowed back to back.
+    """
+
+    def __init__(self, rate, burst=1, min_rate=None, clock=time.monotonic):
+        """
+        Args:
+            rate (float): Maximum rate in requests per second.
+            burst (int): Bucket capacity (default: 1).
+            min_rate (float, optional): Floor of the adapted rate (default: 5% of `rate`).
+            clock (callable): Monotonic clock returning seconds, injectable for tests.
+        """
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = float(min_rate) if min_rate is not None else self.max_rate * 0.05
+        self.burst = max(1, int(burst))
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.updated_at = clock()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def refill(self):
+        """
+        Adds the tokens accrued since the last refill, capped at the bucket capacity.
+        """
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self):
+        """
+        Takes a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the number of seconds to wait before retrying.
+        """
+        self.refill()
+
+        pause = self.paused_until - self.clock()
+        if pause > 0:
+            return pause
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self):
+        """
+        Waits until a token is available and takes it. Waiters are served in arrival order.
+        """
+        async with self.lock:
+            while (delay := self.reserve()) > 0:
+                await asyncio.sleep(delay)
+
+    def on_throttled(self, retry_after=None):
+        """
+        Halves the current rate and pauses acquisitions for `retry_after` seconds, if given.
+
+        Args:
+            retry_after (float, optional): Delay requested by the upstream's Retry-After header.
+        """
+        self.refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = min(self.tokens, 0.0)
+        if retry_after:
+            self.paused_until = max(self.paused_until, self.clock() + retry_after)
+
+    def on_success(self):
+        """
+        Recovers the current rate additively towards the configured maximum.
+        """
+        if self.rate < self.max_rate:
+            self.refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
@@ -0,0 +1,108 @@
+"""
+Micro-benchmark of the artworks list serialization.
+
+Compares, on a synthetic page of artworks:
+    - to_dict + json: `Artwork.to_dict()` then the standard library `json.dumps` (previous path).
+    - json_dumps (<encoder>): The response encoder of `artworks_utils.json_serializer` on the
+      serialized artworks, for each available encoder.
+    - fragments: Joining the cached JSON encodings of the artworks (fragment cache hits).
+
+Usage:
+    python -m benchmarks.json_serialization [--artworks N] [--repeat N]
+"""
+import argparse
+import json
+import timeit
+
+from artworks_core.models import Artwork
+from artworks_utils import json_serializer
+from artworks_utils.json_serializer import JSONFragments
+
+def make_artworks(count):
+    """
+    Builds unsaved artworks with realistic field sizes.
+
+    Args:
+        count (int): Number of artworks.
+
+    Returns:
+        list: The `Artwork` instances.
+    """
+    return [
+        Artwork(
+            id=artwork_id,
+            aic_id=100000 + artwork_id,
+            title=f"A Sunday on La Grande Jatte {artwork_id}",
+            artist_title="Georges Seurat",
+            place_of_origin="France",
+            thumbnail=f"https://www.artic.edu/iiif/2/{artwork_id:08d}/full/843,/0/default.jpg",
+            date_start=1884,
+            date_end=1886,
+            date_display="1884–86",
+            artist_display="Georges Seurat\nFrench, 1859–1891",
+            description="Seurat painted this monumental work over the course of two years. " * 12,
+            short_description="A landmark of Neo-Impressionism, painted with tiny dots of color.",
+            classification_title="painting",
+            style_title="Post-Impressionism",
+            medium_display="Oil on canvas",
+            material_titles=["oil paint", "canvas"],
+            term_titles=["Pointillism", "leisure", "landscapes", "women", "men", "Paris"],
+            category_titles=["Painting and Sculpture of Europe", "Essentials"],
+        )
+        for artwork_id in range(1, count + 1)
+    ]
+
+def run_benchmark(count, repeat):
+    """
+    Times each serialization path on a page of `count` artworks.
+
+    Args:
+        count (int): Number of artworks per page.
+        repeat (int): Number of encoded pages per timing.
+
+    Returns:
+        dict: The best time per page in milliseconds, by path.
+    """
+    artworks = make_artworks(count)
+    serialized_artworks = [artwork.to_dict() for artwork in artworks]
+
+    def best_time(function):
+        return min(timeit.repeat(function, number=repeat, repeat=5)) / repeat * 1000
+
+    timings = {
+        "to_dict + json": best_time(
+            lambda: json.dumps({"data": [artwork.to_dict() for artwork in artworks], "status": 200}).encode()
+        ),
+    }
+
+    for name, encoder in json_serializer.JSON_ENCODERS.items():
+        if name == "orjson" and json_serializer.orjson is None:
+            continue
+        json_serializer.set_json_encoder(name)
+        timings[f"json_dumps ({name})"] = best_time(
+            lambda: json_serializer.json_dumps({"data": serialized_artworks, "status": 200})
+        )
+        fragments = [encoder(artwork) for artwork in serialized_artworks]
+        timings[f"fragments ({name})"] = best_time(
+            lambda fragments=fragments: json_serializer.json_dumps({"data": JSONFragments(fragments), "status": 200})
+        )
+
+    json_serializer.set_json_encoder()
+    return timings
+
+def main(argv=None):
+    """
+    Prints the timings of each serialization path.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.json_serialization")
+    parser.add_argument("--artworks", type=int, default=100, help="Artworks per page (default: 100).")
+    parser.add_argument("--repeat", type=int, default=200, help="Pages encoded per timing (default: 200).")
+    args = parser.parse_args(argv)
+
+    timings = run_benchmark(args.artworks, args.repeat)
+    baseline = timings["to_dict + json"]
+    for name, milliseconds in timings.items():
+        print(f"{name:<24} {milliseconds:8.3f} ms/page  {baseline / milliseconds:5.1f}x")
+
+if __name__ == "__main__":
+    main()
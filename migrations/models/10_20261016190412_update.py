@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        ALTER TABLE "artwork" ADD COLUMN IF NOT EXISTS "search_vector" TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', COALESCE("title", '')), 'A')
+            || setweight(to_tsvector('english', COALESCE("artist_title", '') || ' ' || COALESCE("artist_display", '')), 'B')
+            || setweight(jsonb_to_tsvector('english', COALESCE("term_titles", '[]'::JSONB), '["string"]'), 'C')
+            || setweight(to_tsvector('english', COALESCE("description", '')), 'D')
+        ) STORED;
+        CREATE INDEX IF NOT EXISTS "idx_artwork_search_vector" ON "artwork" USING GIN ("search_vector");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_title_trgm" ON "artwork" USING GIN ("title" gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS "idx_artwork_artist_title_trgm" ON "artwork" USING GIN ("artist_title" gin_trgm_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_artwork_search_vector";
+        DROP INDEX IF EXISTS "idx_artwork_title_trgm";
+        DROP INDEX IF EXISTS "idx_artwork_artist_title_trgm";
+        ALTER TABLE "artwork" DROP COLUMN IF EXISTS "search_vector";"""
@@ -0,0 +1,14 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # Rows ingested before the upstream id was stored cannot be matched to their AIC artwork, so
+    # the next sync would insert the whole catalog next to them: drop them and let it re-ingest
+    return """
+        ALTER TABLE "artwork" ADD "aic_id" INT UNIQUE;
+        DELETE FROM "artwork" WHERE "aic_id" IS NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "artwork" DROP COLUMN "aic_id";"""
@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "sync_checkpoint" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(50) NOT NULL UNIQUE,
+    "mode" VARCHAR(10) NOT NULL DEFAULT 'full',
+    "status" VARCHAR(10) NOT NULL DEFAULT 'completed',
+    "page_size" INT,
+    "total_pages" INT,
+    "last_completed_page" INT NOT NULL DEFAULT 0,
+    "watermark" VARCHAR(64),
+    "run_since" VARCHAR(64),
+    "run_watermark" VARCHAR(64),
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "sync_checkpoint";"""
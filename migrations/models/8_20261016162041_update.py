@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_artwork_sort_date" ON "artwork" (COALESCE("date_start", 0), "id");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_sort_title" ON "artwork" (LOWER(COALESCE("title", '')), "id");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_sort_artist_title" ON "artwork" (LOWER(COALESCE("artist_title", '')), "id");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_sort_artist_display" ON "artwork" (LOWER(COALESCE("artist_display", '')), "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_artwork_sort_date";
+        DROP INDEX IF EXISTS "idx_artwork_sort_title";
+        DROP INDEX IF EXISTS "idx_artwork_sort_artist_title";
+        DROP INDEX IF EXISTS "idx_artwork_sort_artist_display";"""
@@ -0,0 +1,27 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_artwork_artist_title" ON "artwork" ("artist_title");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_style_title" ON "artwork" ("style_title");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_medium_display" ON "artwork" ("medium_display");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_classification_title" ON "artwork" ("classification_title");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_date_start" ON "artwork" ("date_start");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_date_end" ON "artwork" ("date_end");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_category_titles_gin" ON "artwork" USING GIN ("category_titles");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_term_titles_gin" ON "artwork" USING GIN ("term_titles");
+        CREATE INDEX IF NOT EXISTS "idx_artwork_material_titles_gin" ON "artwork" USING GIN ("material_titles");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_artwork_artist_title";
+        DROP INDEX IF EXISTS "idx_artwork_style_title";
+        DROP INDEX IF EXISTS "idx_artwork_medium_display";
+        DROP INDEX IF EXISTS "idx_artwork_classification_title";
+        DROP INDEX IF EXISTS "idx_artwork_date_start";
+        DROP INDEX IF EXISTS "idx_artwork_date_end";
+        DROP INDEX IF EXISTS "idx_artwork_category_titles_gin";
+        DROP INDEX IF EXISTS "idx_artwork_term_titles_gin";
+        DROP INDEX IF EXISTS "idx_artwork_material_titles_gin";"""
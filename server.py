@@ -5,15 +5,79 @@ import signal
 from tortoise.exceptions import DBConnectionError
 
 from artworks_settings import initialize_app_env
-from artworks_core import  artworks_router
-from artworks_utils import logger, init_database
+from artworks_core import  artworks_router, schedule_artworks_updates
+from artworks_core.artworks_data_events import (
+    register_artworks_change_handler,
+    start_artworks_listener,
+    stop_artworks_listener,
+)
+from artworks_core.artworks_data_reader import invalidate_artworks_caches, schedule_recommendation_cache_prewarm
+from artworks_core.artworks_recommendation_index import (
+    RECOMMENDATION_INDEX_FIELDS,
+    close_recommendation_executor,
+    refresh_recommendation_index,
+    register_index_refresh_handler,
+    schedule_recommendation_index_refresh,
+)
+from artworks_core.artworks_snapshot import read_artworks_snapshot
+from artworks_utils import logger, init_database, init_http_client, close_http_client, set_json_encoder
 
 # Initialize and retrieve the Sanic app instance
 app = initialize_app_env()
 
+# Select the JSON encoder of the responses
+logger.info("JSON responses encoded with %s", set_json_encoder(app.config.JSON_ENCODER))
+
 # Register the router
 app.blueprint(artworks_router)
 
+@app.before_server_start
+async def open_http_client_listener(_app):
+    """
+    Opens the shared, connection-pooled HTTP client before the server accepts requests.
+    """
+    await init_http_client()
+
+@app.after_server_stop
+async def close_http_client_listener(_app):
+    """
+    Closes the shared HTTP client once the server has stopped.
+    """
+    await close_http_client()
+
+@app.after_server_start
+async def start_artworks_changes_listener(_app):
+    """
+    Builds the recommendation index, then invalidates the cached artworks and refreshes the
+    index whenever ingest, in any process, changes artworks. Each rebuilt index pre-warms the
+    recommendation results cache.
+
+    With `RECOMMENDATION_SNAPSHOT_PATH`, the first index is built from the memory-mapped snapshot
+    the database was bootstrapped from, without reading the artworks table.
+    """
+    register_index_refresh_handler(schedule_recommendation_cache_prewarm)
+    try:
+        artworks = None
+        if app.config.RECOMMENDATION_SNAPSHOT_PATH:
+            artworks = await asyncio.get_running_loop().run_in_executor(
+                None, read_artworks_snapshot, app.config.RECOMMENDATION_SNAPSHOT_PATH, RECOMMENDATION_INDEX_FIELDS
+            )
+        await refresh_recommendation_index(artworks)
+    except Exception as error:
+        logger.error("Recommendation index build failed, retrying on first use: %s", error)
+
+    register_artworks_change_handler(invalidate_artworks_caches)
+    register_artworks_change_handler(schedule_recommendation_index_refresh)
+    start_artworks_listener()
+
+@app.before_server_stop
+async def stop_artworks_changes_listener(_app):
+    """
+    Stops listening for artworks changes and the recommendation workers before the server stops.
+    """
+    await stop_artworks_listener()
+    close_recommendation_executor()
+
 async def init_app_task():
     """
     Asynchronous initialization for the app, such as database setup.
@@ -40,19 +104,23 @@ async def update_data_task():
     Periodically updates the artworks database.
 
     Performs:
-        - Fetches the latest artwork data from the external API.
+        - Fetches the latest artwork data from the external API on a jittered interval.
         - Updates the local database with new or modified records.
+        - Skips a run while another worker or replica holds the update lock.
 
     Logs:
         - Success or failure of the update process.
     """
+    if not app.config.UPDATE_ENABLED:
+        logger.info("Scheduled updates disabled (UPDATE_ENABLED=False)")
+        return
+
     try:
-        logger.info("Starting update_data...")
-        # Uncomment the following line to enable periodic updates:
-        # await update_artworks()
-        logger.info("Finished update_data!")
-    except asyncio.TimeoutError as timeout_error:
-        logger.error("Timeout occurred during update_data: %s", timeout_error)
+        logger.info("Starting update_data scheduler...")
+        await schedule_artworks_updates()
+    except asyncio.CancelledError:
+        logger.info("update_data scheduler stopped.")
+        raise
     except Exception as error:
         logger.error("Unexpected error during update_data: %s", error)
         raise  # Re-raise unexpected exceptions for further handling
@@ -63,6 +131,7 @@ async def run_server_task():
 
     Performs:
         - Starts the Sanic server asynchronously.
+        - Triggers the server lifecycle listeners (e.g., shared HTTP client setup and teardown).
         - Handles server shutdown gracefully when cancelled.
 
     Logs:
@@ -80,12 +149,16 @@ async def run_server_task():
     try:
         logger.info("Starting Sanic server...")
         await server.startup()  # Explicitly start the server
+        await server.before_start()  # Trigger before_server_start listeners
         logger.info("Sanic server started.")
+        await server.after_start()  # Trigger after_server_start listeners
         await server.serve_forever()  # Start serving requests
     except asyncio.CancelledError:
         logger.info("Server task cancelled. Shutting down...")
+        await server.before_stop()  # Trigger before_server_stop listeners
         server.close()  # Stop accepting new connections
         await server.wait_closed()  # Wait for all connections to close
+        await server.after_stop()  # Trigger after_server_stop listeners
         logger.info("Sanic server shutdown complete.")
         raise
 
@@ -2,3 +2,19 @@
 
 # This ensures test modules are accessible when running tests
 from .test_format_artworks import *
+from .test_artwork_payload import *
+from .test_upstream_guards import *
+from .test_pagination_cursor import *
+from .test_artworks_filters import *
+from .test_cache_manager import *
+from .test_recommendation_index import *
+from .test_executor_manager import *
+from .test_json_serializer import *
+from .test_artworks_snapshot import *
+from .test_conditional_request import *
+from .test_artworks_scheduler import *
+from .test_artworks_writer import *
+from .test_database_manager import *
+from .test_artworks_search import *
+from .test_http_request_manager import *
+from .test_artworks_ingest import *
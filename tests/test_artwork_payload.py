@@ -0,0 +1,93 @@
+import unittest
+
+from artworks_core.artworks_data_helper import (
+    ARTWORK_FIELDS,
+    compute_artwork_fingerprint,
+    get_artworks_query_params,
+    get_latest_timestamp,
+    normalize_artwork_payload,
+)
+
+
+class TestNormalizeArtworkPayload(unittest.TestCase):
+
+    def test_maps_upstream_id(self):
+        """Test that the upstream id is stored as aic_id."""
+        result = normalize_artwork_payload({"id": 27992, "title": "A Sunday on La Grande Jatte"})
+        self.assertEqual(result["aic_id"], 27992)
+        self.assertEqual(result["title"], "A Sunday on La Grande Jatte")
+
+    def test_missing_fields_defaults(self):
+        """Test the defaults applied to missing fields."""
+        result = normalize_artwork_payload({})
+        self.assertIsNone(result["aic_id"])
+        self.assertEqual(result["title"], "Unknown Title")
+        self.assertEqual(result["artist_title"], "Unknown Artist")
+        self.assertEqual(result["category_titles"], [])
+
+    def test_maps_every_stored_field(self):
+        """Test that every stored field is copied from the payload and extra fields are dropped."""
+        item = {field: f"{field} value" for field in ARTWORK_FIELDS}
+        item.update({"id": 1, "updated_at": "2026-10-16T10:00:00-05:00", "api_link": "https://upstream/1"})
+        result = normalize_artwork_payload(item)
+        self.assertEqual(set(result), {"aic_id", *ARTWORK_FIELDS})
+        self.assertEqual({field: result[field] for field in ARTWORK_FIELDS}, {field: item[field] for field in ARTWORK_FIELDS})
+
+    def test_keeps_explicit_nulls(self):
+        """Test that null upstream values are stored as null, only missing fields get defaults."""
+        result = normalize_artwork_payload({"id": 5, "title": None, "term_titles": None})
+        self.assertIsNone(result["title"])
+        self.assertIsNone(result["term_titles"])
+        self.assertEqual(result["material_titles"], [])
+
+
+class TestComputeArtworkFingerprint(unittest.TestCase):
+
+    def test_same_payload_same_fingerprint(self):
+        """Test that equal payloads hash to the same fingerprint."""
+        first = normalize_artwork_payload({"id": 1, "title": "Artwork A", "term_titles": ["oil"]})
+        second = normalize_artwork_payload({"title": "Artwork A", "id": 1, "term_titles": ["oil"]})
+        self.assertEqual(compute_artwork_fingerprint(first), compute_artwork_fingerprint(second))
+
+    def test_changed_field_changes_fingerprint(self):
+        """Test that editing a stored field changes the fingerprint."""
+        original = normalize_artwork_payload({"id": 1, "title": "Artwork A"})
+        edited = normalize_artwork_payload({"id": 1, "title": "Artwork B"})
+        self.assertNotEqual(compute_artwork_fingerprint(original), compute_artwork_fingerprint(edited))
+
+    def test_ignores_non_content_fields(self):
+        """Test that the upstream id and extra keys do not take part in the fingerprint."""
+        artwork_data = normalize_artwork_payload({"id": 1, "title": "Artwork A"})
+        with_extra_keys = {**artwork_data, "aic_id": 2, "fingerprint": "stale"}
+        self.assertEqual(compute_artwork_fingerprint(artwork_data), compute_artwork_fingerprint(with_extra_keys))
+
+
+class TestDeltaSyncHelpers(unittest.TestCase):
+
+    def test_full_query_params(self):
+        """Test that a full sync only pages through the listing."""
+        self.assertEqual(get_artworks_query_params(2, 100), {"page": 2, "limit": 100})
+
+    def test_delta_query_params(self):
+        """Test that a delta sync filters and sorts on the modification time."""
+        result = get_artworks_query_params(1, 100, "2024-12-28T23:27:37-06:00")
+        self.assertEqual(result["query[range][updated_at][gte]"], "2024-12-28T23:27:37-06:00")
+        self.assertEqual(result["sort[updated_at]"], "asc")
+        self.assertIn("updated_at", result["fields"].split(","))
+
+    def test_latest_timestamp_compares_offsets(self):
+        """Test that timestamps are compared as instants, whatever their offset."""
+        result = get_latest_timestamp([
+            "2024-12-28T23:00:00-06:00",
+            "2024-12-29T05:30:00+00:00",
+            None,
+            "not a date",
+        ])
+        self.assertEqual(result, "2024-12-29T05:30:00+00:00")
+
+    def test_latest_timestamp_empty(self):
+        """Test that no valid timestamp gives None."""
+        self.assertIsNone(get_latest_timestamp([None]))
+
+if __name__ == "__main__":
+    unittest.main()
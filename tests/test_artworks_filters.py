@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+import unittest
+
+from artworks_core.artworks_data_helper import (
+    ARTWORK_PUBLIC_FIELDS,
+    encode_csv_artworks,
+    encode_ndjson_artworks,
+    get_artworks_batch_ids,
+    get_artworks_export_format,
+    get_artworks_fields,
+    get_artworks_filters,
+)
+
+
+class TestGetArtworksFilters(unittest.TestCase):
+
+    def test_no_filters(self):
+        """Test that pagination and sorting parameters are not filters."""
+        self.assertEqual(get_artworks_filters({'page': ['1'], 'limit': ['10'], 'sort': ['title_asc']}), {})
+
+    def test_equality_filters(self):
+        """Test that a single value matches exactly and several values match any of them."""
+        result = get_artworks_filters({
+            'artist_title': ['Claude Monet'],
+            'style_title': ['Impressionism', 'Post-Impressionism'],
+        })
+        self.assertEqual(result, {
+            "artist_title": "Claude Monet",
+            "style_title__in": ["Impressionism", "Post-Impressionism"],
+        })
+
+    def test_year_range(self):
+        """Test that date_start and date_end bound the creation years."""
+        result = get_artworks_filters({'date_start': ['1850'], 'date_end': ['1900']})
+        self.assertEqual(result, {"date_start__gte": 1850, "date_end__lte": 1900})
+
+    def test_invalid_year(self):
+        """Test that a non-integer year is rejected."""
+        with self.assertRaises(ValueError):
+            get_artworks_filters({'date_start': ['nineteenth century']})
+
+    def test_containment_filters(self):
+        """Test that list filters require every given value."""
+        result = get_artworks_filters({'category_titles': ['Essentials', 'Impressionism'], 'term_titles': ['']})
+        self.assertEqual(result, {"category_titles__contains": ["Essentials", "Impressionism"]})
+
+
+class TestGetArtworksFields(unittest.TestCase):
+
+    def test_default_fields(self):
+        """Test that every public field is selected without a fields parameter."""
+        self.assertEqual(get_artworks_fields({}), ARTWORK_PUBLIC_FIELDS)
+        self.assertEqual(get_artworks_fields({'fields': ['']}), ARTWORK_PUBLIC_FIELDS)
+
+    def test_sparse_fields(self):
+        """Test that requested fields keep the public order and always include the id."""
+        result = get_artworks_fields({'fields': ['thumbnail, title', 'artist_title']})
+        self.assertEqual(result, ("id", "title", "artist_title", "thumbnail"))
+
+    def test_unknown_field(self):
+        """Test that an unknown field is rejected."""
+        with self.assertRaises(ValueError):
+            get_artworks_fields({'fields': ['title,fingerprint']})
+
+
+class TestGetArtworksBatchIds(unittest.TestCase):
+
+    def test_ids_keep_request_order(self):
+        """Test that ids are parsed in request order, duplicates included."""
+        self.assertEqual(get_artworks_batch_ids({'ids': ['12, 7', '42,7']}, 10), [12, 7, 42, 7])
+
+    def test_invalid_ids(self):
+        """Test that missing, non-integer or too many ids are rejected."""
+        for params in ({}, {'ids': ['']}, {'ids': ['12,seven']}, {'ids': ['1,2,3']}):
+            with self.assertRaises(ValueError):
+                get_artworks_batch_ids(params, 2)
+
+
+class TestArtworksExport(unittest.TestCase):
+
+    ARTWORKS = [
+        {"id": 1, "title": 'A "Sunday", 1884', "term_titles": ["leisure", "Paris"]},
+        {"id": 2, "title": None, "term_titles": None},
+    ]
+
+    def test_export_format(self):
+        """Test that the format defaults to NDJSON and unsupported formats are rejected."""
+        self.assertEqual(get_artworks_export_format({}), "ndjson")
+        self.assertEqual(get_artworks_export_format({'format': ['CSV']}), "csv")
+        with self.assertRaises(ValueError):
+            get_artworks_export_format({'format': ['xml']})
+
+    def test_ndjson(self):
+        """Test that every artwork is encoded on its own line."""
+        lines = encode_ndjson_artworks(self.ARTWORKS).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.ARTWORKS)
+
+    def test_csv(self):
+        """Test that CSV rows quote text, encode lists as JSON and leave missing values empty."""
+        fields = ("id", "title", "term_titles")
+        encoded = encode_csv_artworks(self.ARTWORKS, fields, header=True)
+        rows = list(csv.reader(io.StringIO(encoded.decode())))
+        self.assertEqual(rows, [
+            ["id", "title", "term_titles"],
+            ["1", 'A "Sunday", 1884', '["leisure", "Paris"]'],
+            ["2", "", ""],
+        ])
+
+if __name__ == "__main__":
+    unittest.main()
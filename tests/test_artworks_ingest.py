@@ -0,0 +1,114 @@
+import asyncio
+import contextlib
+import io
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from artworks_core import artworks_data_scheduler, artworks_data_writer, artworks_ingest
+from artworks_core.artworks_data_scheduler import update_status
+from .test_artworks_writer import FakeCheckpoint
+
+
+@contextlib.asynccontextmanager
+async def free_lock(_key):
+    yield True
+
+class TestIngestWorker(unittest.TestCase):
+
+    def setUp(self):
+        config = SimpleNamespace(
+            UPDATE_MAX_RUNTIME_SECONDS=5,
+            INGEST_SYNC_MODE="full",
+            INGEST_PAGE_SIZE=2,
+            INGEST_BATCH_SIZE=2,
+            INGEST_FETCH_CONCURRENCY=2,
+            INGEST_WRITER_CONCURRENCY=1,
+            INGEST_QUEUE_SIZE=2,
+            ARTWORKS_API="https://upstream/artworks",
+            ARTWORKS_SEARCH_API="https://upstream/artworks/search",
+        )
+        app = SimpleNamespace(config=config)
+        self.checkpoint = FakeCheckpoint(
+            mode="full", status="completed", page_size=None, total_pages=None, last_completed_page=0,
+            watermark=None, run_since=None, run_watermark=None,
+        )
+        self.failing_pages = set()
+        self.saved_pages = []
+        self.saved_status = dict(update_status)
+        self.init_database = mock.AsyncMock()
+        self.close_http_client = mock.AsyncMock()
+
+        for target, name, value in (
+            (artworks_ingest, "initialize_app_env", mock.Mock()),
+            (artworks_ingest, "init_database", self.init_database),
+            (artworks_ingest, "init_http_client", mock.AsyncMock()),
+            (artworks_ingest, "close_http_client", self.close_http_client),
+            (artworks_ingest, "Tortoise", mock.Mock(close_connections=mock.AsyncMock())),
+            (artworks_data_scheduler, "get_app_instance", mock.Mock(return_value=app)),
+            (artworks_data_scheduler, "advisory_lock", free_lock),
+            (artworks_data_writer, "get_app_instance", mock.Mock(return_value=app)),
+            (artworks_data_writer, "get_sync_checkpoint", mock.AsyncMock(return_value=self.checkpoint)),
+            (artworks_data_writer, "get_total_artworks", mock.AsyncMock(return_value=6)),
+            (artworks_data_writer, "handle_get_request", self.handle_get_request),
+            (artworks_data_writer, "save_artworks_page", self.save_artworks_page),
+        ):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        update_status.clear()
+        update_status.update(self.saved_status)
+
+    async def handle_get_request(self, api_url, params):
+        page = params["page"]
+        await asyncio.sleep(0)
+        if page in self.failing_pages:
+            return {"data": {"error": "Service unavailable"}, "status": 503}
+        artworks = [{"id": page * 10 + index, "updated_at": "2026-10-16T00:00:00-05:00"} for index in range(2)]
+        return {"data": {"data": artworks}, "status": 200}
+
+    async def save_artworks_page(self, data, batch_size=None):
+        self.saved_pages.append(data[0]["id"] // 10)
+        return {"inserted": len(data), "updated": 0, "unchanged": 0, "skipped": 0}
+
+    def run_main(self, *argv):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = artworks_ingest.main(list(argv))
+        return exit_code, json.loads(output.getvalue())
+
+    def test_completed_run(self):
+        """Test that a complete run prints its summary and exits with 0."""
+        exit_code, report = self.run_main("--mode", "full", "--batch-size", "2")
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(report["result"], "completed")
+        self.assertEqual(report["summary"]["pages"], 3)
+        self.assertEqual(report["summary"]["inserted"], 6)
+        self.assertEqual(report["summary"]["failed_pages"], [])
+        self.assertEqual(sorted(self.saved_pages), [1, 2, 3])
+        self.init_database.assert_awaited_once()
+        self.close_http_client.assert_awaited_once()
+
+    def test_failed_pages(self):
+        """Test that a run leaving failed pages reports them and exits with 1."""
+        self.failing_pages = {2}
+        exit_code, report = self.run_main()
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(report["result"], "completed")
+        self.assertEqual(report["summary"]["failed_pages"], [2])
+        self.assertEqual(sorted(self.saved_pages), [1, 3])
+
+    def test_failed_run(self):
+        """Test that a run failing to write prints a failed result and exits with 1."""
+        self.save_artworks_page = mock.AsyncMock(side_effect=ConnectionError("database unavailable"))
+        with mock.patch.object(artworks_data_writer, "save_artworks_page", self.save_artworks_page):
+            exit_code, report = self.run_main()
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(report, {"result": "failed", "summary": None})
+        self.close_http_client.assert_awaited_once()
+
+if __name__ == "__main__":
+    unittest.main()
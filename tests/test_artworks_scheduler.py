@@ -0,0 +1,95 @@
+import asyncio
+import contextlib
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from artworks_core import artworks_data_scheduler
+from artworks_core.artworks_data_scheduler import run_scheduled_update, schedule_artworks_updates, update_status
+
+
+def make_lock(acquired=True, error=None):
+    """Builds a stand-in for `advisory_lock` that yields `acquired` or raises `error`."""
+    @contextlib.asynccontextmanager
+    async def lock(_key):
+        if error is not None:
+            raise error
+        yield acquired
+    return lock
+
+class TestArtworksScheduler(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        config = SimpleNamespace(
+            UPDATE_MAX_RUNTIME_SECONDS=5,
+            UPDATE_INITIAL_DELAY_SECONDS=0,
+            UPDATE_INTERVAL_SECONDS=0,
+            UPDATE_JITTER_SECONDS=0,
+        )
+        self.config = config
+        self.saved_status = dict(update_status)
+        update_status.update(runs=0, skipped_runs=0, last_result=None, last_error=None)
+        self.update_artworks = mock.AsyncMock(return_value={"pages": 1})
+        for patcher in (
+            mock.patch.object(artworks_data_scheduler, "get_app_instance", return_value=SimpleNamespace(config=config)),
+            mock.patch.object(artworks_data_scheduler, "update_artworks", self.update_artworks),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        update_status.clear()
+        update_status.update(self.saved_status)
+
+    async def test_lock_busy(self):
+        """Test that a run is skipped while another worker holds the update lock."""
+        with mock.patch.object(artworks_data_scheduler, "advisory_lock", make_lock(acquired=False)):
+            self.assertIsNone(await run_scheduled_update())
+        self.update_artworks.assert_not_called()
+        self.assertEqual(update_status["skipped_runs"], 1)
+        self.assertEqual(update_status["runs"], 0)
+
+    async def test_completed_run(self):
+        """Test that a run holding the lock returns the update summary."""
+        with mock.patch.object(artworks_data_scheduler, "advisory_lock", make_lock()):
+            self.assertEqual(await run_scheduled_update(mode="delta"), {"pages": 1})
+        self.update_artworks.assert_awaited_once_with(mode="delta")
+        self.assertEqual(update_status["last_result"], "completed")
+        self.assertFalse(update_status["running"])
+
+    async def test_timeout(self):
+        """Test that a run exceeding the maximum runtime is cancelled and recorded."""
+        self.config.UPDATE_MAX_RUNTIME_SECONDS = 0.01
+
+        async def slow_update(**options):
+            await asyncio.sleep(10)
+
+        self.update_artworks.side_effect = slow_update
+        with mock.patch.object(artworks_data_scheduler, "advisory_lock", make_lock()):
+            self.assertIsNone(await run_scheduled_update())
+        self.assertEqual(update_status["last_result"], "timed_out")
+        self.assertEqual(update_status["runs"], 1)
+
+    async def test_lock_error_keeps_schedule(self):
+        """Test that an error taking the lock is recorded and the next interval still runs."""
+        errors = [OSError("connection refused"), OSError("connection refused"), asyncio.CancelledError()]
+        attempts = []
+
+        @contextlib.asynccontextmanager
+        async def failing_lock(_key):
+            # Two failed runs, then stop the scheduler
+            attempts.append(_key)
+            raise errors[len(attempts) - 1]
+            yield
+
+        with mock.patch.object(artworks_data_scheduler, "advisory_lock", failing_lock):
+            with self.assertRaises(asyncio.CancelledError):
+                await schedule_artworks_updates()
+
+        self.assertEqual(len(attempts), 3)
+        self.update_artworks.assert_not_called()
+        self.assertEqual(update_status["last_result"], "failed")
+        self.assertEqual(update_status["last_error"], "connection refused")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from artworks_core import artworks_data_reader
+from artworks_core.artworks_data_reader import search_artworks
+
+
+class TestUpstreamSearchFallback(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        config = SimpleNamespace(
+            ARTWORKS_MAX_LIMIT=100,
+            ARTWORKS_SEARCH_API="https://upstream/artworks/search",
+            SEARCH_BACKEND="local",
+            SEARCH_UPSTREAM_FALLBACK=True,
+            SEARCH_CACHE_MAX_ENTRIES=16,
+            SEARCH_CACHE_TTL_SECONDS=60,
+            SEARCH_CACHE_STALE_SECONDS=0,
+            SEARCH_REQUEST_TIMEOUT=1,
+            SEARCH_MAX_RETRIES=0,
+        )
+        self.handle_get_request = mock.AsyncMock(return_value={
+            "data": {"data": [{"id": 27992, "title": "A Sunday on La Grande Jatte", "artist_title": "Georges Seurat"}]},
+            "status": 200,
+        })
+        for name, value in (
+            ("get_app_instance", mock.Mock(return_value=SimpleNamespace(config=config))),
+            ("search_cache", None),
+            ("search_local_artworks", mock.AsyncMock(side_effect=ConnectionError("database unavailable"))),
+            ("handle_get_request", self.handle_get_request),
+        ):
+            patcher = mock.patch.object(artworks_data_reader, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_pagination_and_fields_forwarded(self):
+        """Test that the fallback requests the page of the search and returns the local shape."""
+        result = await search_artworks({"q": ["seurat"], "page": ["2"], "limit": ["5"], "fields": ["title"]})
+
+        self.assertEqual(result, {"data": [{"id": None, "title": "A Sunday on La Grande Jatte"}], "status": 200})
+        params = self.handle_get_request.await_args.args[1]
+        self.assertEqual((params["q"], params["page"], params["limit"]), ("seurat", 2, 5))
+        self.assertIn("artist_title", params["fields"].split(","))
+
+    async def test_pages_cached_separately(self):
+        """Test that each page of a fallback search is its own upstream request and cache entry."""
+        await search_artworks({"q": ["seurat"], "page": ["1"]})
+        await search_artworks({"q": ["seurat"], "page": ["2"]})
+        await search_artworks({"q": ["Seurat "], "page": ["2"]})
+        self.assertEqual([call.args[1]["page"] for call in self.handle_get_request.await_args_list], [1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
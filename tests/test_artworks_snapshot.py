@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+from artworks_core import artworks_snapshot
+from artworks_core.artworks_snapshot import (
+    SNAPSHOT_FIELDS,
+    get_snapshot_format,
+    iter_artworks_snapshot,
+    read_artworks_snapshot,
+    read_snapshot_watermark,
+    write_artworks_snapshot,
+)
+
+
+def make_snapshot_artwork(artwork_id):
+    artwork = {field: None for field in SNAPSHOT_FIELDS}
+    artwork.update({
+        "id": artwork_id,
+        "aic_id": 1000 + artwork_id,
+        "title": f"Artwork {artwork_id}",
+        "style_title": "Impressionism",
+        "date_start": 1870 + artwork_id,
+        "category_titles": ["Painting", "Essentials"],
+        "term_titles": [],
+        "fingerprint": f"{artwork_id:064x}",
+    })
+    return artwork
+
+@unittest.skipIf(artworks_snapshot.pyarrow is None, "Snapshots require the pyarrow package")
+class TestArtworksSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.artworks = [make_snapshot_artwork(artwork_id) for artwork_id in range(1, 6)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_snapshot(self, name, watermark=None):
+        path = os.path.join(self.directory.name, name)
+        count = write_artworks_snapshot(path, [self.artworks[:3], self.artworks[3:]], watermark=watermark)
+        self.assertEqual(count, len(self.artworks))
+        return path
+
+    def test_round_trip(self):
+        """Test that both formats read back the written artworks, lists included."""
+        for name in ("artworks.parquet", "artworks.arrow"):
+            path = self.write_snapshot(name)
+            self.assertEqual(read_artworks_snapshot(path), self.artworks)
+
+    def test_read_selected_fields(self):
+        """Test that only the requested columns are read."""
+        path = self.write_snapshot("artworks.arrow")
+        artworks = read_artworks_snapshot(path, fields=("id", "style_title"))
+        self.assertEqual(artworks[0], {"id": 1, "style_title": "Impressionism"})
+
+    def test_watermark(self):
+        """Test that the sync watermark is stored in the snapshot metadata."""
+        for name in ("artworks.parquet", "artworks.arrow"):
+            self.assertEqual(read_snapshot_watermark(self.write_snapshot(name, "2024-05-01T10:00:00")), "2024-05-01T10:00:00")
+            self.assertIsNone(read_snapshot_watermark(self.write_snapshot(f"empty-{name}")))
+
+    def test_iter_batches(self):
+        """Test that a snapshot is read in batches of at most the batch size."""
+        for name in ("artworks.parquet", "artworks.arrow"):
+            batches = list(iter_artworks_snapshot(self.write_snapshot(name), 2))
+            self.assertTrue(all(len(batch) <= 2 for batch in batches))
+            self.assertEqual([artwork for batch in batches for artwork in batch], self.artworks)
+
+    def test_format(self):
+        """Test that the format is guessed from the extension and unknown formats are rejected."""
+        self.assertEqual(get_snapshot_format("artworks.parquet"), "parquet")
+        self.assertEqual(get_snapshot_format("artworks.feather"), "arrow")
+        self.assertEqual(get_snapshot_format("artworks.bin", "arrow"), "arrow")
+        with self.assertRaises(ValueError):
+            get_snapshot_format("artworks.csv")
+
+if __name__ == "__main__":
+    unittest.main()
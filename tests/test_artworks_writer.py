@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from artworks_core import artworks_data_writer
+from artworks_core.artworks_data_helper import compute_artwork_fingerprint, normalize_artwork_payload
+from artworks_core.artworks_data_writer import update_artworks, upsert_artworks_batch
+
+
+class FakeCheckpoint(SimpleNamespace):
+    """In-memory stand-in for the `SyncCheckpoint` model."""
+
+    async def save(self, update_fields=None):
+        self.saves = getattr(self, "saves", 0) + 1
+
+
+class TestUpdateArtworks(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.config = SimpleNamespace(
+            INGEST_SYNC_MODE="full",
+            INGEST_PAGE_SIZE=2,
+            INGEST_BATCH_SIZE=2,
+            INGEST_FETCH_CONCURRENCY=3,
+            INGEST_WRITER_CONCURRENCY=1,
+            INGEST_QUEUE_SIZE=1,
+            ARTWORKS_API="https://upstream/artworks",
+            ARTWORKS_SEARCH_API="https://upstream/artworks/search",
+        )
+        self.checkpoint = FakeCheckpoint(
+            mode="full", status="completed", page_size=None, total_pages=None, last_completed_page=0,
+            watermark=None, run_since=None, run_watermark=None,
+        )
+        self.failing_pages = set()
+        self.requested_pages = []
+        self.saved_pages = []
+        self.save_error = None
+
+        for name, value in (
+            ("get_app_instance", mock.Mock(return_value=SimpleNamespace(config=self.config))),
+            ("get_sync_checkpoint", mock.AsyncMock(return_value=self.checkpoint)),
+            ("get_total_artworks", mock.AsyncMock(return_value=10)),
+            ("handle_get_request", self.handle_get_request),
+            ("save_artworks_page", self.save_artworks_page),
+        ):
+            patcher = mock.patch.object(artworks_data_writer, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def handle_get_request(self, api_url, params):
+        page = params["page"]
+        self.requested_pages.append(page)
+        await asyncio.sleep(0)
+        if page in self.failing_pages:
+            return {"data": {"error": "Service unavailable"}, "status": 503}
+        artworks = [
+            {"id": page * 10 + index, "updated_at": f"2026-10-{page:02d}T00:00:00-05:00"}
+            for index in range(2)
+        ]
+        return {"data": {"data": artworks}, "status": 200}
+
+    async def save_artworks_page(self, data, batch_size=None):
+        await asyncio.sleep(0)
+        if self.save_error is not None:
+            raise self.save_error
+        self.saved_pages.append(data[0]["id"] // 10)
+        return {"inserted": len(data), "updated": 0, "unchanged": 0, "skipped": 0}
+
+    async def test_all_pages_written(self):
+        """Test that every page is fetched and written, and the checkpoint completes."""
+        summary = await update_artworks()
+        self.assertEqual(sorted(self.saved_pages), [1, 2, 3, 4, 5])
+        self.assertEqual(summary["pages"], 5)
+        self.assertEqual(summary["inserted"], 10)
+        self.assertEqual(summary["failed_pages"], [])
+        self.assertEqual(self.checkpoint.status, "completed")
+        self.assertEqual(self.checkpoint.last_completed_page, 5)
+        self.assertEqual(self.checkpoint.watermark, "2026-10-05T00:00:00-05:00")
+
+    async def test_failed_page_recorded(self):
+        """Test that a page failing to fetch is reported and the next run resumes before it."""
+        self.failing_pages = {3}
+        summary = await update_artworks()
+        self.assertEqual(summary["failed_pages"], [3])
+        self.assertEqual(sorted(self.saved_pages), [1, 2, 4, 5])
+        self.assertEqual(self.checkpoint.status, "running")
+        self.assertEqual(self.checkpoint.last_completed_page, 2)
+        self.assertIsNone(self.checkpoint.watermark)
+
+        # The next run resumes after the last page saved without gaps
+        self.failing_pages = set()
+        self.requested_pages = []
+        summary = await update_artworks()
+        self.assertEqual(summary["start_page"], 3)
+        self.assertEqual(sorted(self.requested_pages), [3, 4, 5])
+        self.assertEqual(self.checkpoint.status, "completed")
+
+    async def test_writer_error_stops_fetchers(self):
+        """Test that a database error stops the fetchers and is raised, instead of blocking the run."""
+        self.save_error = ConnectionError("database unavailable")
+        self.config.INGEST_FETCH_CONCURRENCY = 1
+        get_total_artworks = mock.AsyncMock(return_value=200)
+        with mock.patch.object(artworks_data_writer, "get_total_artworks", get_total_artworks):
+            with self.assertRaises(ConnectionError):
+                await asyncio.wait_for(update_artworks(), timeout=5)
+        self.assertLess(len(self.requested_pages), 100)
+        self.assertEqual(self.checkpoint.status, "running")
+        self.assertEqual(self.checkpoint.last_completed_page, 0)
+
+
+class TestUpsertArtworksBatch(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.stored_artworks = []
+        self.artwork_model = mock.MagicMock()
+        self.artwork_model.filter.return_value.using_db.return_value.values_list = mock.AsyncMock(
+            side_effect=lambda *fields: self.stored_artworks
+        )
+        self.artwork_model.bulk_create = mock.AsyncMock()
+        self.artwork_model.side_effect = lambda **fields: fields
+        self.publish = mock.AsyncMock()
+
+        connection = mock.MagicMock()
+        connection.__aenter__ = mock.AsyncMock(return_value=connection)
+        connection.__aexit__ = mock.AsyncMock(return_value=False)
+        for name, value in (
+            ("Artwork", self.artwork_model),
+            ("in_transaction", mock.Mock(return_value=connection)),
+            ("publish_artworks_changed", self.publish),
+        ):
+            patcher = mock.patch.object(artworks_data_writer, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def stored(self, artwork_id, item):
+        return artwork_id, item["id"], compute_artwork_fingerprint(normalize_artwork_payload(item))
+
+    async def test_changed_and_unchanged_split(self):
+        """Test that only new and changed artworks are written, and only updated ids are published."""
+        new_item = {"id": 1, "title": "New"}
+        changed_item = {"id": 2, "title": "Changed"}
+        unchanged_item = {"id": 3, "title": "Unchanged"}
+        self.stored_artworks = [
+            self.stored(20, {"id": 2, "title": "Before"}),
+            self.stored(30, unchanged_item),
+        ]
+
+        stats = await upsert_artworks_batch([new_item, changed_item, unchanged_item, {"title": "No id"}])
+
+        self.assertEqual(stats, {"inserted": 1, "updated": 1, "unchanged": 1, "skipped": 1})
+        self.artwork_model.filter.assert_called_once_with(aic_id__in=[1, 2, 3])
+        written = self.artwork_model.bulk_create.await_args.args[0]
+        self.assertEqual([artwork["aic_id"] for artwork in written], [1, 2])
+        self.assertEqual(written[1]["fingerprint"], compute_artwork_fingerprint(normalize_artwork_payload(changed_item)))
+        self.assertEqual(self.artwork_model.bulk_create.await_args.kwargs["on_conflict"], ["aic_id"])
+        self.publish.assert_awaited_once_with([20])
+
+    async def test_duplicate_upstream_id_last_wins(self):
+        """Test that the last occurrence of an upstream id in a batch is written."""
+        stats = await upsert_artworks_batch([{"id": 1, "title": "First"}, {"id": 1, "title": "Last"}])
+        self.assertEqual(stats["inserted"], 1)
+        written = self.artwork_model.bulk_create.await_args.args[0]
+        self.assertEqual([artwork["title"] for artwork in written], ["Last"])
+
+    async def test_unchanged_batch_writes_nothing(self):
+        """Test that a batch without changes neither writes nor publishes."""
+        item = {"id": 3, "title": "Unchanged"}
+        self.stored_artworks = [self.stored(30, item)]
+        stats = await upsert_artworks_batch([item])
+        self.assertEqual(stats["unchanged"], 1)
+        self.artwork_model.bulk_create.assert_not_called()
+        self.publish.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
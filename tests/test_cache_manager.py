@@ -0,0 +1,132 @@
+import asyncio
+import unittest
+
+from artworks_core import artworks_data_events
+from artworks_core.artworks_data_helper import get_search_cache_key
+from artworks_utils.cache_manager import TTLCache, json_size
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(max_entries=2, ttl=10, clock=self.clock)
+        self.calls = 0
+
+    async def load(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.calls
+
+    def test_ttl_expiry(self):
+        """Test that an entry is fresh until its TTL elapses."""
+        self.cache.set("monet", 1)
+        self.clock.now += 9
+        self.assertEqual(self.cache.get("monet"), 1)
+        self.clock.now += 1
+        self.assertIsNone(self.cache.get("monet"))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        self.cache.set("monet", 1)
+        self.cache.set("manet", 2)
+        self.cache.get("monet")
+        self.cache.set("degas", 3)
+        self.assertIsNone(self.cache.get("manet"))
+        self.assertEqual(self.cache.get("monet"), 1)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_byte_bound_eviction(self):
+        """Test that least recently used entries are evicted beyond the byte bound."""
+        cache = TTLCache(max_entries=10, ttl=10, max_bytes=20, sizeof=json_size, clock=self.clock)
+        cache.set(1, "a" * 8)
+        cache.set(2, "b" * 8)
+        self.assertEqual(cache.stats()["size_bytes"], 20)
+        cache.set(3, "c" * 8)
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(cache.stats()["size_bytes"], 20)
+        cache.set(4, "d" * 30)
+        self.assertIsNone(cache.get(4))
+        cache.invalidate(2)
+        self.assertEqual(cache.stats()["size_bytes"], 10)
+
+    async def test_concurrent_misses_are_coalesced(self):
+        """Test that concurrent misses of the same key share one loader call."""
+        results = await asyncio.gather(*(self.cache.get_or_load("monet", self.load) for _ in range(5)))
+        self.assertEqual(results, [1] * 5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(await self.cache.get_or_load("monet", self.load), 1)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["coalesced"]), (1, 5, 4))
+
+    async def test_uncacheable_values(self):
+        """Test that values rejected by the predicate are not cached."""
+        await self.cache.get_or_load("monet", self.load, cacheable=lambda value: False)
+        self.assertEqual(await self.cache.get_or_load("monet", self.load), 2)
+
+    async def test_stale_while_revalidate(self):
+        """Test that an expired entry is served while a background load refreshes it."""
+        cache = TTLCache(max_entries=2, ttl=10, stale_ttl=5, clock=self.clock)
+        await cache.get_or_load("monet", self.load)
+        self.clock.now += 12
+        self.assertEqual(await cache.get_or_load("monet", self.load), 1)
+        await asyncio.sleep(0.01)
+        self.assertEqual(await cache.get_or_load("monet", self.load), 2)
+        self.clock.now += 20
+        self.assertEqual(await cache.get_or_load("monet", self.load), 3)
+
+    async def test_invalidation_discards_inflight_load(self):
+        """Test that a load started before an invalidation is not cached."""
+        task = asyncio.ensure_future(self.cache.get_or_load("monet", self.load))
+        await asyncio.sleep(0)
+        self.cache.clear()
+        self.assertEqual(await task, 1)
+        self.assertIsNone(self.cache.get("monet"))
+
+
+class TestArtworksChangeEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.changes = []
+        self.handlers = list(artworks_data_events.artworks_change_handlers)
+        artworks_data_events.register_artworks_change_handler(self.changes.append)
+
+    def tearDown(self):
+        artworks_data_events.artworks_change_handlers[:] = self.handlers
+
+    def test_notification_dispatch(self):
+        """Test that a change notification reaches the registered handlers."""
+        artworks_data_events.handle_artworks_notification(None, 1, "artworks_changed", '{"ids": [3, 5]}')
+        self.assertEqual(self.changes, [[3, 5]])
+
+    def test_invalid_notification(self):
+        """Test that an unreadable notification is treated as a change of any artwork."""
+        artworks_data_events.handle_artworks_notification(None, 1, "artworks_changed", "not json")
+        self.assertEqual(self.changes, [None])
+
+
+class TestSearchCacheKey(unittest.TestCase):
+
+    def test_normalized_query(self):
+        """Test that case and whitespace do not change the search cache key."""
+        self.assertEqual(
+            get_search_cache_key("  Van   Gogh ", 1, 10, ("id",)),
+            get_search_cache_key("van gogh", 1, 10, ("id",)),
+        )
+        self.assertNotEqual(
+            get_search_cache_key("van gogh", 1, 10, ("id",)),
+            get_search_cache_key("van gogh", 2, 10, ("id",)),
+        )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from sanic.compat import Header
+
+from artworks_core import artworks_data_reader
+from artworks_core.artworks_data_helper import encode_cursor, get_artwork_etag, get_artworks_list_etag
+from artworks_core.artworks_data_reader import get_artworks_list_validators
+from artworks_utils.conditional_request import get_cache_headers, is_not_modified, make_etag, parse_http_date
+
+
+class TestConditionalRequest(unittest.TestCase):
+
+    def setUp(self):
+        self.last_modified = datetime(2026, 10, 16, 10, 0, 0, 500000, tzinfo=timezone.utc)
+        self.etag = make_etag("fingerprint", "id", "title")
+
+    def test_etag(self):
+        """Test that entity tags are quoted and depend on every part."""
+        self.assertTrue(self.etag.startswith('"') and self.etag.endswith('"'))
+        self.assertEqual(self.etag, make_etag("fingerprint", "id", "title"))
+        self.assertNotEqual(self.etag, make_etag("fingerprint", "id"))
+
+    def test_if_none_match(self):
+        """Test that If-None-Match matches the listed, weak or wildcard entity tags only."""
+        self.assertTrue(is_not_modified(Header({"If-None-Match": self.etag}), self.etag))
+        self.assertTrue(is_not_modified(Header({"If-None-Match": f'"other", W/{self.etag}'}), self.etag))
+        self.assertTrue(is_not_modified(Header({"If-None-Match": "*"}), self.etag))
+        self.assertFalse(is_not_modified(Header({"If-None-Match": '"other"'}), self.etag))
+        self.assertFalse(is_not_modified(Header({"If-None-Match": "*"}), None))
+        self.assertFalse(is_not_modified(Header(), self.etag))
+
+    def test_if_modified_since(self):
+        """Test that If-Modified-Since compares seconds and is ignored with If-None-Match."""
+        since = "Fri, 16 Oct 2026 10:00:00 GMT"
+        self.assertEqual(parse_http_date(since), self.last_modified.replace(microsecond=0))
+        self.assertTrue(is_not_modified(Header({"If-Modified-Since": since}), self.etag, self.last_modified))
+        self.assertFalse(is_not_modified(
+            Header({"If-Modified-Since": "Fri, 16 Oct 2026 09:59:59 GMT"}), self.etag, self.last_modified
+        ))
+        self.assertFalse(is_not_modified(
+            Header({"If-None-Match": '"other"', "If-Modified-Since": since}), self.etag, self.last_modified
+        ))
+        self.assertFalse(is_not_modified(Header({"If-Modified-Since": "yesterday"}), self.etag, self.last_modified))
+
+    def test_cache_headers(self):
+        """Test that the caching headers carry the validators and the max-age."""
+        headers = get_cache_headers(self.etag, self.last_modified, 60)
+        self.assertEqual(headers, {
+            "Cache-Control": "public, max-age=60",
+            "ETag": self.etag,
+            "Last-Modified": "Fri, 16 Oct 2026 10:00:00 GMT",
+        })
+        self.assertEqual(get_cache_headers(None, None, 0), {"Cache-Control": "no-cache"})
+
+    def test_artwork_etags(self):
+        """Test that artwork tags follow the fingerprint and fields, and list tags the catalog and query."""
+        artwork = {"id": 1, "fingerprint": "abc", "updated_at": self.last_modified}
+        self.assertEqual(get_artwork_etag(artwork, ("id", "title")), get_artwork_etag(artwork, ("id", "title")))
+        self.assertNotEqual(get_artwork_etag(artwork, ("id", "title")), get_artwork_etag(artwork, ("id",)))
+        self.assertNotEqual(
+            get_artwork_etag(artwork, ("id",)), get_artwork_etag({**artwork, "fingerprint": "abd"}, ("id",))
+        )
+        self.assertTrue(get_artwork_etag({**artwork, "fingerprint": None}, ("id",)))
+
+        version = (10, self.last_modified)
+        params = {"limit": ["10"], "style_title": ["Cubism"]}
+        self.assertEqual(
+            get_artworks_list_etag(version, params),
+            get_artworks_list_etag(version, {"style_title": ["Cubism"], "limit": ["10"]}),
+        )
+        self.assertNotEqual(get_artworks_list_etag(version, params), get_artworks_list_etag((11, self.last_modified), params))
+        self.assertNotEqual(get_artworks_list_etag(version, params), get_artworks_list_etag(version, {"limit": ["10"]}))
+
+class TestArtworksListValidators(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.last_modified = datetime(2026, 10, 16, 10, 0, tzinfo=timezone.utc)
+        cache = mock.Mock()
+        cache.get_or_load = mock.AsyncMock(return_value=(10, self.last_modified))
+        patcher = mock.patch.object(artworks_data_reader, "get_catalog_version_cache", return_value=cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_valid_parameters(self):
+        """Test that a valid list query gets the tag of the catalog version and query."""
+        params = {"style_title": ["Cubism"], "sort": ["title_asc"], "cursor": [encode_cursor("title_asc", ["a", 1])]}
+        etag, last_modified = await get_artworks_list_validators(params)
+        self.assertEqual(etag, get_artworks_list_etag((10, self.last_modified), params))
+        self.assertEqual(last_modified, self.last_modified)
+
+    async def test_invalid_parameters(self):
+        """Test that invalid query parameters have no validators, so they are never answered with a 304."""
+        for params in (
+            {"fields": ["title,unknown"]},
+            {"date_start": ["soon"]},
+            {"cursor": ["not-a-cursor"]},
+            {"sort": ["title_desc"], "cursor": [encode_cursor("title_asc", ["a", 1])]},
+        ):
+            self.assertEqual(await get_artworks_list_validators(params), (None, None), params)
+
+if __name__ == "__main__":
+    unittest.main()
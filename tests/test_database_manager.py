@@ -0,0 +1,67 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from artworks_utils import database_manager
+from artworks_utils.database_manager import advisory_lock, ensure_search_schema
+
+
+class TestEnsureSearchSchema(unittest.IsolatedAsyncioTestCase):
+
+    def patch_connection(self, dialect):
+        connection = SimpleNamespace(
+            capabilities=SimpleNamespace(dialect=dialect),
+            execute_script=mock.AsyncMock(),
+        )
+        patcher = mock.patch.object(database_manager, "connections", SimpleNamespace(get=lambda _name: connection))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return connection
+
+    async def test_applies_search_migration(self):
+        """Test that the upgrade of the search migration is applied on PostgreSQL."""
+        connection = self.patch_connection("postgres")
+        await ensure_search_schema()
+        script = connection.execute_script.await_args.args[0]
+        self.assertIn("CREATE EXTENSION IF NOT EXISTS pg_trgm", script)
+        self.assertIn('"search_vector"', script)
+
+    async def test_other_dialects_skipped(self):
+        """Test that nothing is applied on databases without full-text search."""
+        connection = self.patch_connection("sqlite")
+        await ensure_search_schema()
+        connection.execute_script.assert_not_called()
+
+    async def test_error_logged(self):
+        """Test that a failure to create the schema is logged instead of raised."""
+        connection = self.patch_connection("postgres")
+        connection.execute_script.side_effect = PermissionError("permission denied to create extension")
+        with self.assertLogs(database_manager.logger, "ERROR"):
+            await ensure_search_schema()
+
+class TestAdvisoryLock(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        connection = SimpleNamespace(capabilities=SimpleNamespace(dialect="sqlite"))
+        for name, value in (
+            ("connections", SimpleNamespace(get=lambda _name: connection)),
+            ("local_locks", {}),
+        ):
+            patcher = mock.patch.object(database_manager, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_local_fallback(self):
+        """Test that without PostgreSQL the lock excludes the tasks of the process, per key."""
+        with self.assertLogs(database_manager.logger, "WARNING"):
+            async with advisory_lock(1) as acquired:
+                self.assertTrue(acquired)
+                async with advisory_lock(1) as acquired_again:
+                    self.assertFalse(acquired_again)
+                async with advisory_lock(2) as other_key:
+                    self.assertTrue(other_key)
+            async with advisory_lock(1) as acquired:
+                self.assertTrue(acquired)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from artworks_utils.executor_manager import BoundedExecutor, ExecutorOverloadedError
+
+
+class TestBoundedExecutor(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.pool.shutdown(wait=True)
+
+    def blocking_task(self, value):
+        self.release.wait(5)
+        return value
+
+    async def test_runs_off_the_event_loop(self):
+        """Test that a function runs on the pool and returns its result."""
+        executor = BoundedExecutor(self.pool, max_pending=2, timeout=5)
+        self.assertNotEqual(await executor.run(threading.get_ident), threading.get_ident())
+        self.assertEqual(executor.stats()["pending"], 0)
+
+    async def test_inline_without_executor(self):
+        """Test that functions run inline when no pool is configured."""
+        self.assertEqual(await BoundedExecutor(None).run(sum, [1, 2]), 3)
+
+    async def test_inline_bounds(self):
+        """Test that inline functions take a pending slot and are held to the timeout."""
+        executor = BoundedExecutor(None, max_pending=1, timeout=0.01)
+        self.assertEqual(await executor.run(sum, [1, 2]), 3)
+        self.assertEqual(executor.stats()["pending"], 0)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await executor.run(time.sleep, 0.05)
+        self.assertEqual(executor.stats()["timeouts"], 1)
+        self.assertEqual(executor.stats()["pending"], 0)
+
+        # A slot held elsewhere (e.g. another thread's event loop) bounds inline calls as well
+        executor.reserve()
+        with self.assertRaises(ExecutorOverloadedError):
+            await executor.run(sum, [1, 2])
+        self.assertEqual(executor.stats()["rejected"], 1)
+
+    async def test_overload_is_rejected(self):
+        """Test that calls beyond the pending bound fail immediately."""
+        executor = BoundedExecutor(self.pool, max_pending=1, timeout=5)
+        task = asyncio.ensure_future(executor.run(self.blocking_task, 1))
+        await asyncio.sleep(0.01)
+        with self.assertRaises(ExecutorOverloadedError):
+            await executor.run(self.blocking_task, 2)
+        self.release.set()
+        self.assertEqual(await task, 1)
+        self.assertEqual(executor.stats()["rejected"], 1)
+
+    async def test_timeout_keeps_slot_until_done(self):
+        """Test that a timed out task keeps its pending slot until it really finishes."""
+        executor = BoundedExecutor(self.pool, max_pending=1, timeout=0.05)
+        with self.assertRaises(asyncio.TimeoutError):
+            await executor.run(self.blocking_task, 1)
+        self.assertEqual(executor.stats()["pending"], 1)
+        self.release.set()
+        await asyncio.sleep(0.05)
+        self.assertEqual(executor.stats()["pending"], 0)
+        self.assertEqual(await executor.run(self.blocking_task, 2), 2)
+
+if __name__ == "__main__":
+    unittest.main()
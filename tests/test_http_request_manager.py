@@ -0,0 +1,94 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+
+from artworks_utils import http_request_manager
+from artworks_utils.http_request_manager import close_http_client, init_http_client, send_get_request
+
+
+class TestHTTPClient(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        config = SimpleNamespace(
+            HTTP_CLIENT_MAX_CONNECTIONS=4,
+            HTTP_CLIENT_MAX_KEEPALIVE=2,
+            HTTP_CLIENT_KEEPALIVE_EXPIRY=5,
+            HTTP_CLIENT_HTTP2=False,
+            HTTP_CLIENT_TIMEOUT=1,
+            HTTP_CLIENT_CONNECT_TIMEOUT=1,
+            UPSTREAM_RATE_LIMIT=0,
+            UPSTREAM_RATE_BURST=1,
+            UPSTREAM_MAX_RETRIES=0,
+            UPSTREAM_BACKOFF_BASE=0.5,
+            UPSTREAM_BACKOFF_MAX=30,
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD=5,
+            CIRCUIT_BREAKER_RESET_TIMEOUT=30,
+        )
+        self.requests = []
+        self.clients = []
+        self.transport = httpx.MockTransport(self.handle_request)
+        real_client = httpx.AsyncClient
+
+        def make_client(**options):
+            client = real_client(transport=self.transport, **options)
+            self.clients.append(client)
+            return client
+
+        for target, name, value in (
+            (http_request_manager, "get_app_instance", mock.Mock(return_value=SimpleNamespace(config=config))),
+            (http_request_manager, "http_client", None),
+            (http_request_manager, "rate_limiter", None),
+            (http_request_manager, "circuit_breaker", None),
+            (http_request_manager, "retry_policy", dict(http_request_manager.retry_policy)),
+            (http_request_manager.httpx, "AsyncClient", make_client),
+        ):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def handle_request(self, request):
+        self.requests.append(request)
+        return httpx.Response(200, json={"data": [{"id": len(self.requests)}]})
+
+    async def test_pooled_client_reused(self):
+        """Test that every request goes through the one shared client opened by `init_http_client`."""
+        client = await init_http_client()
+        for page in (1, 2, 3):
+            response, retry_after = await send_get_request("https://upstream/artworks", {"page": page})
+            self.assertEqual(response, {"data": {"data": [{"id": page}]}, "status": 200})
+            self.assertIsNone(retry_after)
+        self.assertEqual(self.clients, [client])
+        self.assertEqual([request.url.params["page"] for request in self.requests], ["1", "2", "3"])
+        self.assertFalse(client.is_closed)
+        await close_http_client()
+
+    async def test_one_off_client_fallback(self):
+        """Test that without a shared client each request opens and closes its own client."""
+        response, _ = await send_get_request("https://upstream/artworks", {"page": 1})
+        self.assertEqual(response["status"], 200)
+        await send_get_request("https://upstream/artworks", {"page": 2})
+        self.assertEqual(len(self.clients), 2)
+        self.assertTrue(all(client.is_closed for client in self.clients))
+        self.assertIsNone(http_request_manager.http_client)
+
+    async def test_client_lifecycle(self):
+        """Test that the shared client is opened once, and closed cleanly once."""
+        client = await init_http_client()
+        self.assertIs(await init_http_client(), client)
+        self.assertEqual(len(self.clients), 1)
+        self.assertIsNotNone(http_request_manager.circuit_breaker)
+
+        await close_http_client()
+        self.assertTrue(client.is_closed)
+        self.assertIsNone(http_request_manager.http_client)
+        await close_http_client()
+
+        reopened = await init_http_client()
+        self.assertIsNot(reopened, client)
+        await close_http_client()
+        self.assertTrue(reopened.is_closed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import unittest
+from datetime import date, datetime, timezone
+
+from artworks_utils import json_serializer
+from artworks_utils.json_serializer import JSONFragments, json_dumps, set_json_encoder
+
+
+class TestJSONSerializer(unittest.TestCase):
+
+    def tearDown(self):
+        set_json_encoder()
+
+    def test_encoders_agree(self):
+        """Test that every available encoder produces the same JSON document."""
+        value = {"data": [{"id": 1, "title": "Nighthawks", "term_titles": ["urban", "night"]}], "next": None}
+        encoders = ["stdlib"] + (["orjson"] if json_serializer.orjson is not None else [])
+        for name in encoders:
+            self.assertEqual(set_json_encoder(name), name)
+            self.assertEqual(json.loads(json_dumps(value)), value)
+
+    def test_dates_encoded_alike(self):
+        """Test that every available encoder writes dates and datetimes in ISO 8601 format."""
+        value = {
+            "updated_at": datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc),
+            "synced_at": datetime(2026, 10, 16, 12, 0, 0, 500000, tzinfo=timezone.utc),
+            "day": date(2026, 10, 16),
+        }
+        expected = b'{"updated_at":"2026-10-16T12:00:00+00:00","synced_at":"2026-10-16T12:00:00.500000+00:00","day":"2026-10-16"}'
+        encoders = ["stdlib"] + (["orjson"] if json_serializer.orjson is not None else [])
+        for name in encoders:
+            set_json_encoder(name)
+            self.assertEqual(json_dumps(value), expected, name)
+
+    def test_fragments_are_joined(self):
+        """Test that pre-encoded fragments are embedded as a JSON array."""
+        fragments = JSONFragments([b'{"id":1}', b'{"id":2}'])
+        encoded = json_dumps({"data": fragments, "next": "abc", "status": 200})
+        self.assertEqual(json.loads(encoded), {"data": [{"id": 1}, {"id": 2}], "next": "abc", "status": 200})
+        self.assertEqual(json.loads(json_dumps({"data": JSONFragments([])})), {"data": []})
+
+    def test_unknown_or_missing_encoder(self):
+        """Test that an unknown encoder, or orjson when not installed, falls back to an available one."""
+        self.assertIn(set_json_encoder("ujson"), ("orjson", "stdlib"))
+        if json_serializer.orjson is None:
+            self.assertEqual(set_json_encoder("orjson"), "stdlib")
+
+if __name__ == "__main__":
+    unittest.main()
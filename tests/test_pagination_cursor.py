@@ -0,0 +1,75 @@
+import unittest
+
+from artworks_core.artworks_data_helper import (
+    ARTWORKS_SORT_KEYS,
+    decode_cursor,
+    encode_cursor,
+    get_artworks_pagination,
+    get_artworks_sort,
+)
+
+
+class TestPaginationCursor(unittest.TestCase):
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the sort key it was encoded with."""
+        cursor = encode_cursor("id", [42])
+        self.assertEqual(decode_cursor(cursor, "id"), [42])
+
+    def test_round_trip_with_text_key(self):
+        """Test that non-ASCII sort values survive the encoding."""
+        cursor = encode_cursor("title_asc", ["café terrace at night", 7])
+        self.assertEqual(decode_cursor(cursor, "title_asc"), ["café terrace at night", 7])
+
+    def test_cursor_is_url_safe(self):
+        """Test that the cursor needs no URL escaping."""
+        cursor = encode_cursor("title_asc", ["???>>>", 1])
+        self.assertRegex(cursor, r"^[A-Za-z0-9_-]+$")
+
+    def test_sort_mismatch(self):
+        """Test that a cursor cannot be reused with another sort."""
+        cursor = encode_cursor("id", [42])
+        with self.assertRaises(ValueError):
+            decode_cursor(cursor, "title_asc")
+
+    def test_malformed_cursor(self):
+        """Test that garbage cursors are rejected."""
+        for cursor in ("not-a-cursor", "e30", encode_cursor("id", [])):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor, "id")
+
+
+class TestGetArtworksSort(unittest.TestCase):
+
+    def test_default_sort(self):
+        """Test that a missing sort orders by id."""
+        self.assertEqual(get_artworks_sort({}), ("id", None, False))
+
+    def test_supported_sorts(self):
+        """Test that every sort key resolves in both directions."""
+        for sort_key, expression in ARTWORKS_SORT_KEYS.items():
+            self.assertEqual(get_artworks_sort({'sort': [f"{sort_key}_asc"]}), (f"{sort_key}_asc", expression, False))
+            self.assertEqual(get_artworks_sort({'sort': [f"{sort_key}_desc"]}), (f"{sort_key}_desc", expression, True))
+
+    def test_invalid_sort(self):
+        """Test that unsupported sorts fall back to the id order."""
+        for sort_type in ("invalid_type", "title", "description_asc", "title_sideways"):
+            self.assertEqual(get_artworks_sort({'sort': [sort_type]}), ("id", None, False))
+
+
+class TestGetArtworksPagination(unittest.TestCase):
+
+    def test_default_pagination(self):
+        """Test that the first page of 10 artworks is used without parameters."""
+        self.assertEqual(get_artworks_pagination({}, 100), (1, 10))
+
+    def test_limit_is_clamped(self):
+        """Test that the page size is capped and pages start at 1."""
+        self.assertEqual(get_artworks_pagination({'page': ['0'], 'limit': ['500']}, 100), (1, 100))
+
+    def test_invalid_pagination(self):
+        """Test that non-integer values fall back to the defaults."""
+        self.assertEqual(get_artworks_pagination({'page': ['two'], 'limit': ['20']}, 100), (1, 10))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from artworks_core.artworks_data_helper import (
+    DEFAULT_RECOMMENDATION_PREFERENCES,
+    get_recommendation_preferences,
+    get_recommendation_profile,
+)
+from artworks_core import artworks_recommendation_index
+from artworks_core.artworks_recommendation_index import (
+    RecommendationIndex,
+    get_recommendation_index,
+    schedule_recommendation_index_refresh,
+)
+
+
+def make_artwork(
+    artwork_id, style_title=None, medium_display=None, category_titles=None, date_start=None, date_end=None,
+    term_titles=None, material_titles=None,
+):
+    """Builds an artwork row with the recommendation index columns."""
+    return {
+        "id": artwork_id,
+        "title": f"Artwork {artwork_id}",
+        "artist_title": "Unknown Artist",
+        "style_title": style_title,
+        "medium_display": medium_display,
+        "thumbnail": None,
+        "classification_title": None,
+        "date_start": date_start,
+        "date_end": date_end,
+        "category_titles": category_titles,
+        "term_titles": term_titles,
+        "material_titles": material_titles,
+    }
+
+
+PREFERENCES = {
+    "style_title": "Post-Impressionism",
+    "medium_display": "Oil on canvas",
+    "category_titles": ["Painting and Sculpture of Europe"],
+}
+
+
+class TestRecommendationIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RecommendationIndex([
+            make_artwork(1, "Post-Impressionism", "Oil on canvas", None, 1889, 1889),
+            make_artwork(2, "Post-Impressionism", "Oil on canvas", None, 1890, 1890),
+            make_artwork(3, "Impressionism", "Oil on canvas", None, 1875, 1876),
+            make_artwork(4, "Modernism", "Oil on canvas", ["Prints"], 1911, 1911),
+            make_artwork(5, "Modernism", "Watercolor", ["Painting and Sculpture of Europe"], 1850, None),
+            make_artwork(6, "Modernism", "Watercolor", ["Prints"], 1889, 1889),
+        ])
+
+    def test_ranking(self):
+        """Test that matches are ranked by score, then by distance to the average date."""
+        recommendations = self.index.recommend(PREFERENCES, k=5)
+        self.assertEqual([artwork["id"] for artwork in recommendations], [1, 2, 3, 4, 5])
+
+    def test_top_k(self):
+        """Test that only the k best artworks are returned."""
+        self.assertEqual([artwork["id"] for artwork in self.index.recommend(PREFERENCES, k=1)], [1])
+        self.assertEqual([artwork["id"] for artwork in self.index.recommend(PREFERENCES, k=3)], [1, 2, 3])
+
+    def test_id_tiebreak(self):
+        """Test that artworks with the same score and date are ordered by id."""
+        index = RecommendationIndex([make_artwork(artwork_id, "Cubism", None, None, 1910, 1912) for artwork_id in (9, 3, 7)])
+        self.assertEqual([artwork["id"] for artwork in index.recommend({"style_title": "Cubism"}, k=2)], [3, 7])
+
+    def test_category_bitmap(self):
+        """Test that a category preference matches artworks having any of the categories."""
+        recommendations = self.index.recommend({"category_titles": ["Prints", "Unknown"]}, k=5)
+        self.assertEqual(sorted(artwork["id"] for artwork in recommendations), [4, 6])
+
+    def test_no_match(self):
+        """Test that unknown preferences and an empty catalog recommend nothing."""
+        self.assertEqual(self.index.recommend({"style_title": "Cubism"}), [])
+        self.assertEqual(RecommendationIndex([]).recommend(PREFERENCES), [])
+
+    def test_date_range(self):
+        """Test that a date range keeps only the artworks dated within it."""
+        recommendations = self.index.recommend({**PREFERENCES, "date_start": 1880, "date_end": 1900}, k=5)
+        self.assertEqual([artwork["id"] for artwork in recommendations], [1, 2])
+
+    def test_weights_without_date_tiebreak(self):
+        """Test that custom weights change the ranking and ties fall back to the id."""
+        weights = {"style_title": 1, "medium_display": 1, "category_titles": 5}
+        recommendations = self.index.recommend(PREFERENCES, k=5, weights=weights, date_tiebreak=False)
+        self.assertEqual([artwork["id"] for artwork in recommendations], [5, 1, 2, 3, 4])
+
+
+class TestSimilarArtworks(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RecommendationIndex([
+            make_artwork(1, "Impressionism", "Oil on canvas", None, 1870, 1870, ["water lilies", "garden"], ["oil"]),
+            make_artwork(2, "Impressionism", "Oil on canvas", None, 1872, 1872, ["water lilies", "pond"], ["oil"]),
+            make_artwork(3, "Impressionism", "Watercolor", None, 1900, 1900, ["garden"], None),
+            make_artwork(4, "Cubism", "Bronze", None, 1910, 1910, ["portrait"], ["bronze"]),
+            make_artwork(5, None, None, None, None, None, None, None),
+        ])
+
+    def test_most_similar_first(self):
+        """Test that artworks sharing more (and rarer) features rank first, without the artwork itself."""
+        similar_artworks = self.index.similar(1, k=5)
+        self.assertEqual([artwork["id"] for artwork in similar_artworks], [2, 3])
+        self.assertGreater(similar_artworks[0]["similarity"], similar_artworks[1]["similarity"])
+        self.assertLessEqual(similar_artworks[0]["similarity"], 1)
+
+    def test_top_k(self):
+        """Test that only the k most similar artworks are returned."""
+        self.assertEqual([artwork["id"] for artwork in self.index.similar(1, k=1)], [2])
+
+    def test_unknown_or_featureless_artwork(self):
+        """Test that an unknown artwork returns None and an artwork without features nothing."""
+        self.assertIsNone(self.index.similar(42))
+        self.assertEqual(self.index.similar(5), [])
+
+
+class TestGetRecommendationPreferences(unittest.TestCase):
+
+    def test_default_preferences(self):
+        """Test that the default preferences and k are used without parameters."""
+        preferences, k = get_recommendation_preferences({}, 5, 50)
+        self.assertEqual(preferences, {**DEFAULT_RECOMMENDATION_PREFERENCES, "date_start": None, "date_end": None})
+        self.assertEqual(k, 5)
+
+    def test_query_parameters(self):
+        """Test that query parameters, with repeated categories, are resolved."""
+        preferences, k = get_recommendation_preferences({
+            'style_title': ['Cubism'],
+            'category_titles': ['Prints', 'Essentials'],
+            'date_end': ['1920'],
+            'k': ['10'],
+        }, 5, 50)
+        self.assertEqual(preferences, {
+            "style_title": "Cubism",
+            "medium_display": None,
+            "category_titles": ["Prints", "Essentials"],
+            "date_start": None,
+            "date_end": 1920,
+        })
+        self.assertEqual(k, 10)
+
+    def test_json_body(self):
+        """Test that a JSON body with scalar values is resolved like query parameters."""
+        preferences, k = get_recommendation_preferences({'medium_display': 'Oil on canvas', 'date_start': 1850, 'k': 3}, 5, 50)
+        self.assertEqual((preferences["medium_display"], preferences["date_start"], k), ("Oil on canvas", 1850, 3))
+
+    def test_invalid_parameters(self):
+        """Test that invalid years and out of range k are rejected."""
+        for params in ({'date_start': ['1850s']}, {'k': ['0']}, {'k': ['51']}):
+            with self.assertRaises(ValueError):
+                get_recommendation_preferences(params, 5, 50)
+
+    def test_normalized_profile(self):
+        """Test that equivalent preferences share one profile, whatever the category order."""
+        first = get_recommendation_preferences({'style_title': ['Cubism'], 'category_titles': ['Prints', 'Essentials']}, 5, 50)
+        second = get_recommendation_preferences({'category_titles': ['Essentials', 'Prints', 'Prints'], 'style_title': 'Cubism'}, 5, 50)
+        self.assertEqual(get_recommendation_profile(*first), get_recommendation_profile(*second))
+        self.assertNotEqual(get_recommendation_profile(first[0], 5), get_recommendation_profile(first[0], 6))
+
+class TestRecommendationIndexRefresh(unittest.IsolatedAsyncioTestCase):
+
+    async def test_burst_of_changes_rebuilds_once(self):
+        """Test that the index is rebuilt once, after the changes of an ingest run stop."""
+        config = SimpleNamespace(RECOMMENDATION_INDEX_REFRESH_DELAY_SECONDS=0.05)
+        refresh = mock.AsyncMock()
+        with mock.patch.object(artworks_recommendation_index, "get_app_instance", return_value=SimpleNamespace(config=config)), \
+                mock.patch.object(artworks_recommendation_index, "refresh_recommendation_index", refresh):
+            for _ in range(5):
+                schedule_recommendation_index_refresh([1])
+                await asyncio.sleep(0.01)
+            refresh.assert_not_called()
+            await artworks_recommendation_index.refresh_task
+        refresh.assert_awaited_once()
+
+    async def test_cold_start_builds_once(self):
+        """Test that concurrent requests on a cold start share a single index build."""
+        index = object()
+
+        async def slow_refresh():
+            await asyncio.sleep(0.01)
+            return index
+
+        refresh = mock.AsyncMock(side_effect=slow_refresh)
+        with mock.patch.object(artworks_recommendation_index, "recommendation_index", None), \
+                mock.patch.object(artworks_recommendation_index, "initial_build_task", None), \
+                mock.patch.object(artworks_recommendation_index, "refresh_recommendation_index", refresh):
+            results = await asyncio.gather(*(get_recommendation_index() for _ in range(5)))
+        self.assertEqual(results, [index] * 5)
+        refresh.assert_awaited_once()
+
+if __name__ == "__main__":
+    unittest.main()
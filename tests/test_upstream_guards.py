@@ -0,0 +1,137 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from artworks_utils import http_request_manager
+from artworks_utils.circuit_breaker import CircuitBreaker
+from artworks_utils.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketRateLimiter(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = TokenBucketRateLimiter(2.0, burst=2, clock=self.clock)
+
+    def test_burst_then_wait(self):
+        """Test that the burst is served immediately and the next token waits for a refill."""
+        self.assertEqual(self.limiter.reserve(), 0)
+        self.assertEqual(self.limiter.reserve(), 0)
+        self.assertAlmostEqual(self.limiter.reserve(), 0.5)
+
+    def test_refill_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        self.limiter.reserve()
+        self.limiter.reserve()
+        self.clock.now += 0.5
+        self.assertEqual(self.limiter.reserve(), 0)
+
+    def test_throttled_halves_rate_and_pauses(self):
+        """Test that a 429 halves the rate and honors Retry-After."""
+        self.limiter.on_throttled(retry_after=3)
+        self.assertEqual(self.limiter.rate, 1.0)
+        self.assertAlmostEqual(self.limiter.reserve(), 3)
+        self.clock.now += 3
+        self.assertEqual(self.limiter.reserve(), 0)
+
+    def test_success_recovers_rate(self):
+        """Test that successes recover the rate up to the maximum."""
+        self.limiter.on_throttled()
+        for _ in range(100):
+            self.limiter.on_success()
+        self.assertEqual(self.limiter.rate, 2.0)
+
+    async def test_acquire_takes_token(self):
+        """Test that acquire returns immediately while tokens are available."""
+        await self.limiter.acquire()
+        self.assertEqual(self.limiter.tokens, 1)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=self.clock)
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "open")
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_success_resets_failures(self):
+        """Test that a success resets the consecutive failure count."""
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_half_open_single_trial(self):
+        """Test that a single trial call is allowed after the reset timeout."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed trial call opens the circuit again."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.allow_request()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "open")
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_released_trial_allows_next_call(self):
+        """Test that releasing a trial without an outcome lets the next call through."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.release_trial()
+        self.assertTrue(self.breaker.allow_request())
+
+
+class TestHandleGetRequestCancellation(unittest.IsolatedAsyncioTestCase):
+
+    async def test_cancelled_trial_is_released(self):
+        """Test that cancelling a half-open trial call does not leave the circuit rejecting calls."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now += 10
+
+        async def never_responds(*args):
+            await asyncio.Event().wait()
+
+        with mock.patch.object(http_request_manager, "circuit_breaker", breaker), \
+                mock.patch.object(http_request_manager, "rate_limiter", None), \
+                mock.patch.object(http_request_manager, "send_get_request", never_responds):
+            task = asyncio.ensure_future(http_request_manager.handle_get_request("https://upstream", {}))
+            await asyncio.sleep(0)
+            self.assertTrue(breaker.trial_in_flight)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.assertEqual(breaker.state, "half_open")
+        self.assertTrue(breaker.allow_request())
+
+if __name__ == "__main__":
+    unittest.main()